@@ -3,6 +3,7 @@
 from fastapi import FastAPI
 
 from app.configuration import __containers__
+from app.configuration.lifespan import lifespan
 from app.configuration.server import Server
 from app.pkg.settings import settings
 
@@ -19,6 +20,7 @@ def create_app() -> FastAPI:
     app = FastAPI(
         **fastapi_kwargs,
         title="User service",
+        lifespan=lifespan,
     )
 
     __containers__.wire_packages(app=app)
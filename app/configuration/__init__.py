@@ -7,12 +7,18 @@ from app.pkg.models.core import Container, Containers
 
 __all__ = ["__containers__"]
 
+#: List[str]: Modules which use ``Provide`` of the containers.
+WIRED_MODULES = [
+    "app.configuration.lifespan",
+    "app.internal.repository.postgresql.connection",
+    "app.internal.routes.dependencies",
+]
 
 __containers__ = Containers(
     pkg_name=__name__,
     containers=[
-        Container(container=Services),
-        Container(container=Connectors),
-        Container(container=Repository),
+        Container(container=Services, packages=[], modules=WIRED_MODULES),
+        Container(container=Connectors, packages=[], modules=WIRED_MODULES),
+        Container(container=Repository, packages=[], modules=WIRED_MODULES),
     ],
 )
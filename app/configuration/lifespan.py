@@ -0,0 +1,44 @@
+"""Application lifespan."""
+
+from contextlib import asynccontextmanager
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import FastAPI
+
+from app.internal.repository.postgresql.invalidation import (
+    UsersInvalidationListener,
+)
+from app.internal.services import Services
+from app.pkg.connectors import Connectors
+from app.pkg.connectors.postgresql import Postgresql
+from app.pkg.settings import settings
+
+__all__ = ["lifespan"]
+
+
+@asynccontextmanager
+@inject
+async def lifespan(
+    app: FastAPI,
+    postgresql: Postgresql = Provide[Connectors.postgresql],
+    users_invalidation: UsersInvalidationListener = Provide[
+        Services.users_invalidation
+    ],
+):
+    """Open process-wide resources on startup and release them on shutdown.
+
+    The postgresql pool is warmed up to its minimum size before the first
+    request is accepted, and the users caches start to listen for
+    invalidations of other workers.
+    """
+
+    _ = app
+
+    await postgresql.create_pool()
+    if settings.CACHE_MAX_SIZE or settings.CACHE_RESPONSES_MAX_SIZE:
+        await users_invalidation.start(postgresql)
+    try:
+        yield
+    finally:
+        await users_invalidation.stop()
+        await postgresql.close_pool()
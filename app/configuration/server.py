@@ -6,9 +6,12 @@ from fastapi import FastAPI
 from app.internal.pkg.middlewares.handle_http_exceptions import (
     handle_api_exceptions,
 )
+from app.internal.pkg.middlewares.session_token import SessionTokenMiddleware
+from app.internal.pkg.middlewares.stale_response import StaleResponseMiddleware
 from app.internal.routes import __routes__
 from app.pkg.models.base import BaseAPIException
 from app.pkg.models.types.fastapi import FastAPITypes
+from app.pkg.settings import settings
 
 __all__ = ["Server"]
 
@@ -28,6 +31,7 @@ class Server:
         self.__app = app
         self._register_routes(app)
         self._register_http_exceptions(app)
+        self._register_middlewares(app)
 
     def get_app(self) -> FastAPI:
         """Getter of the current application instance."""
@@ -45,3 +49,12 @@ class Server:
         """Register http exceptions."""
 
         app.add_exception_handler(BaseAPIException, handle_api_exceptions)
+
+    @staticmethod
+    def _register_middlewares(app: FastAPITypes.instance) -> None:
+        """Register middlewares."""
+
+        if settings.POSTGRESQL_REPLICA_HOSTS:
+            app.add_middleware(SessionTokenMiddleware)
+        if settings.CACHE_MAX_SIZE and settings.CACHE_STALE_IF_ERROR:
+            app.add_middleware(StaleResponseMiddleware)
@@ -0,0 +1 @@
+"""API server dependencies."""
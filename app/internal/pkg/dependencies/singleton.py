@@ -0,0 +1,61 @@
+"""Dependency which resolves a singleton of the worker once."""
+
+from typing import Callable, Generic, Optional, TypeVar
+
+from dependency_injector import providers
+
+__all__ = ["SingletonDependency"]
+
+T = TypeVar("T")
+
+
+class SingletonDependency(Generic[T]):
+    """FastAPI dependency which resolves its value on the first request and
+    returns the same value afterwards.
+
+    Routes with ``@inject`` and ``Provide`` go through wiring of
+    dependency_injector on every call. For hot routes the provider of the
+    singleton is resolved by an ``@inject`` function once, and each request
+    only awaits this dependency, which FastAPI calls without a thread pool.
+
+    The value is resolved again when the provider is overridden or its
+    override is reset, so ``container.provider.override(...)`` takes effect
+    on the next request.
+
+    Examples:
+        ::
+
+            @inject
+            def _users_service(
+                provider: providers.Provider = Provider[Services.users_service],
+            ) -> providers.Provider:
+                return provider
+
+            get_users_service = SingletonDependency(_users_service)
+
+            @users_router.get("/{user_id:str}")
+            async def read_user(
+                user_id: str,
+                users_service: UserService = Depends(get_users_service),
+            ):
+                ...
+
+    Notes:
+        Only providers of singletons may be resolved this way, otherwise
+        every request gets the object of the first one.
+    """
+
+    def __init__(self, resolve: Callable[[], providers.Provider]):
+        self.__resolve = resolve
+        self.__provider: Optional[providers.Provider] = None
+        self.__overriding: Optional[providers.Provider] = None
+        self.__value: Optional[T] = None
+
+    async def __call__(self) -> T:
+        if self.__provider is None:
+            self.__provider = self.__resolve()
+        overriding = self.__provider.last_overriding
+        if self.__value is None or overriding is not self.__overriding:
+            self.__value = self.__provider()
+            self.__overriding = overriding
+        return self.__value
@@ -0,0 +1,39 @@
+"""Middleware for read-your-writes consistency on read replicas."""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.pkg.connectors.postgresql import session
+
+__all__ = ["SessionTokenMiddleware", "SESSION_TOKEN_HEADER"]
+
+SESSION_TOKEN_HEADER = "X-SESSION-TOKEN"
+
+
+class SessionTokenMiddleware:
+    """Open read-your-writes session for every request.
+
+    The caller receives a session token in ``X-SESSION-TOKEN`` response
+    header after its writes. While the caller sends it back, its reads are
+    served by the primary until replicas have replayed those writes.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = Headers(scope=scope).get(SESSION_TOKEN_HEADER)
+
+        with session(token=token) as current:
+
+            async def send_with_token(message: Message) -> None:
+                if message["type"] == "http.response.start" and current.token:
+                    headers = MutableHeaders(scope=message)
+                    headers[SESSION_TOKEN_HEADER] = current.token
+                await send(message)
+
+            await self.app(scope, receive, send_with_token)
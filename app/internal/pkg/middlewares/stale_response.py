@@ -0,0 +1,34 @@
+"""Middleware which marks responses built from stale cache entries."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.pkg.cache.stale import staleness
+
+__all__ = ["StaleResponseMiddleware", "STALE_RESPONSE_WARNING"]
+
+#: str: Value of ``Warning`` header of a stale response, see RFC 7234.
+STALE_RESPONSE_WARNING = '110 - "Response is Stale"'
+
+
+class StaleResponseMiddleware:
+    """Add ``Warning`` header to responses served from expired cache
+    entries while the database is unreachable."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with staleness() as current:
+
+            async def send_with_warning(message: Message) -> None:
+                if message["type"] == "http.response.start" and current.stale:
+                    headers = MutableHeaders(scope=message)
+                    headers["Warning"] = STALE_RESPONSE_WARNING
+                await send(message)
+
+            await self.app(scope, receive, send_with_warning)
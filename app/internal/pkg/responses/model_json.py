@@ -0,0 +1,36 @@
+"""Response which encodes models without intermediate ``dict``."""
+
+from typing import Any
+
+import pydantic
+from fastapi.responses import JSONResponse
+
+from app.pkg.models.base.encoder import encode_json
+
+__all__ = ["ModelJSONResponse"]
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response which encodes a model, or a list of models, in one
+    pass by the encoder compiled for the model.
+
+    Other content, e.g. ``dict`` built by ``jsonable_encoder``, is encoded
+    as by ``JSONResponse``.
+
+    Examples:
+        ::
+
+            users_router = APIRouter(
+                prefix="/users",
+                default_response_class=ModelJSONResponse,
+            )
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, pydantic.BaseModel) or (
+            isinstance(content, list)
+            and content
+            and all(isinstance(item, pydantic.BaseModel) for item in content)
+        ):
+            return encode_json(content)
+        return super().render(content)
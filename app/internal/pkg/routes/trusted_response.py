@@ -0,0 +1,98 @@
+"""Route which trusts models returned by its endpoint."""
+
+import asyncio
+import typing
+from functools import wraps
+from typing import Any, Callable, Tuple, Type
+
+import pydantic
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from starlette import status
+
+from app.internal.pkg.responses.model_json import ModelJSONResponse
+
+__all__ = ["TrustedResponseRoute"]
+
+#: Tuple[str, ...]: Options of a route which change the serialized fields.
+_SERIALIZATION_OPTIONS = (
+    "response_model_include",
+    "response_model_exclude",
+    "response_model_exclude_unset",
+    "response_model_exclude_defaults",
+    "response_model_exclude_none",
+)
+
+
+class TrustedResponseRoute(APIRoute):
+    """Route which serializes an instance of ``response_model`` as is.
+
+    FastAPI dumps the returned model to ``dict`` and validates it against
+    ``response_model`` again. Models returned by services are already
+    validated, or built from trusted rows of the database, so a value whose
+    type is the declared model, or one of the models of declared ``Union``,
+    is encoded by ``ModelJSONResponse`` without the second validation.
+    Other values are validated as usual.
+
+    Examples:
+        ::
+
+            users_router = APIRouter(
+                prefix="/users",
+                route_class=TrustedResponseRoute,
+            )
+
+    Notes:
+        Routes with options which change serialized fields, e.g.
+        ``response_model_exclude``, and synchronous endpoints are validated
+        as usual.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        if not any(kwargs.get(option) for option in _SERIALIZATION_OPTIONS):
+            endpoint = _trust_response(
+                endpoint=endpoint,
+                response_model=kwargs.get("response_model"),
+                status_code=kwargs.get("status_code") or status.HTTP_200_OK,
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _trust_response(
+    endpoint: Callable[..., Any],
+    response_model: Any,
+    status_code: int,
+) -> Callable[..., Any]:
+    """Wrap ``endpoint`` to encode instances of ``response_model``."""
+
+    models = _models(response_model)
+    if not models or not asyncio.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @wraps(endpoint)
+    async def trusted(*args: Any, **kwargs: Any) -> Any:
+        response = await endpoint(*args, **kwargs)
+        if type(response) not in models:
+            return response
+
+        return ModelJSONResponse(content=response, status_code=status_code)
+
+    return trusted
+
+
+def _models(response_model: Any) -> Tuple[Type[pydantic.BaseModel], ...]:
+    """Models of ``response_model``, or of each type of its ``Union``."""
+
+    if response_model is None or isinstance(response_model, DefaultPlaceholder):
+        return ()
+
+    types = (
+        typing.get_args(response_model)
+        if typing.get_origin(response_model) is typing.Union
+        else (response_model,)
+    )
+    return tuple(
+        type_
+        for type_ in types
+        if isinstance(type_, type) and issubclass(type_, pydantic.BaseModel)
+    )
@@ -1,9 +1,26 @@
 from dependency_injector import containers, providers
 
+from app.pkg.settings import settings
+
+from .loaders import UserLoader
 from .users import UserRepository
 
 __all__ = ["Repository"]
 
 
 class Repository(containers.DeclarativeContainer):
-    users = providers.Factory(UserRepository)
+    configuration = providers.Configuration(
+        name="settings",
+        pydantic_settings=[settings],
+    )
+
+    #: UserRepository: Stateless, single per process.
+    users = providers.Singleton(UserRepository)
+
+    #: UserLoader: Coalesces reads of single users, single per process.
+    user_loader = providers.Singleton(
+        UserLoader,
+        user_repository=users,
+        max_batch_size=configuration.API_LOADER_MAX_BATCH_SIZE,
+        window=configuration.API_LOADER_WINDOW,
+    )
@@ -1,21 +1,179 @@
+import asyncio
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, List, Optional
 
-from aiopg.connection import Cursor
 from dependency_injector.wiring import Provide, inject
-from psycopg2.extras import RealDictCursor
 
 from app.pkg.connectors import Connectors
-from app.pkg.connectors.postgresql import Postgresql
+from app.pkg.connectors.base import BaseConnection, DatabaseError
+from app.pkg.connectors.postgresql import Postgresql, get_session
 
-__all__ = ["get_connection"]
+__all__ = [
+    "get_connection",
+    "unit_of_work",
+    "in_unit_of_work",
+    "after_commit",
+    "has_unreplayed_writes",
+]
+
+
+@dataclass
+class _UnitOfWork:
+    """Connection and transaction shared by repository calls."""
+
+    #: BaseConnection: Connection with open transaction.
+    connection: BaseConnection
+    #: int: Number of nested units of work, used to name savepoints.
+    depth: int = 0
+    #: List[Callable[[], None]]: Callbacks to run after commit.
+    callbacks: List[Callable[[], None]] = field(default_factory=list)
+
+
+_unit_of_work: ContextVar[Optional[_UnitOfWork]] = ContextVar(
+    "unit_of_work",
+    default=None,
+)
+
+
+def in_unit_of_work() -> bool:
+    """Check if the current context runs inside of ``unit_of_work``."""
+
+    return _unit_of_work.get() is not None
+
+
+def has_unreplayed_writes() -> bool:
+    """Check if the current session has written WAL positions which no
+    replica has replayed yet.
+
+    Callers which have written long ago are served by replicas again, so
+    only the first reads after a write have to observe it on the primary.
+    """
+
+    session = get_session()
+    return session is not None and session.lsn > 0 and not __has_replayed(session.lsn)
+
+
+@inject
+def __has_replayed(
+    lsn: int,
+    postgresql: Postgresql = Provide[Connectors.postgresql],
+) -> bool:
+    return postgresql.has_replayed(lsn)
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` once writes of the current context are committed.
+
+    Outside of ``unit_of_work`` writes are already committed, so the
+    callback runs immediately. Callbacks of rolled back units of work are
+    dropped.
+    """
+
+    if (uow := _unit_of_work.get()) is None:
+        callback()
+        return
+
+    uow.callbacks.append(callback)
 
 
 @asynccontextmanager
 @inject
 async def get_connection(
+    read_only: bool = False,
     postgresql: Postgresql = Provide[Connectors.postgresql],
-) -> Cursor:
-    """Get async connection to postgresql of pool."""
+) -> AsyncIterator[BaseConnection]:
+    """Get async connection to postgresql of pool.
+
+    Inside of ``unit_of_work`` the connection of the unit of work is
+    returned, so the query runs in its transaction.
+
+    Args:
+        read_only: Connection is used only for reads and can be taken from
+            a replica.
+    """
+
+    if (uow := _unit_of_work.get()) is not None:
+        yield uow.connection
+        return
+
+    async with postgresql.get_connect(read_only=read_only) as connection:
+        yield connection
+
+
+@asynccontextmanager
+@inject
+async def unit_of_work(
+    postgresql: Postgresql = Provide[Connectors.postgresql],
+) -> AsyncIterator[BaseConnection]:
+    """Run repository calls in one connection and one transaction.
+
+    The transaction is committed when the block exits and rolled back when
+    it raises. Nested units of work are savepoints of the outer one, so
+    their failure does not abort the outer transaction.
+
+    Examples:
+        ::
+
+            async with unit_of_work():
+                user = await user_repository.create(cmd=cmd)
+                await user_repository.update(cmd=update_cmd)
+
+    Notes:
+        The connection must not be used concurrently, so repository calls
+        inside of the unit of work must be awaited one by one.
+    """
+
+    if (uow := _unit_of_work.get()) is not None:
+        async with __savepoint(uow):
+            yield uow.connection
+        return
+
     async with postgresql.get_connect() as connection:
-        async with await connection.cursor(cursor_factory=RealDictCursor) as cur:
-            yield cur
+        await connection.execute("begin;")
+        uow = _UnitOfWork(connection=connection)
+        token = _unit_of_work.set(uow)
+        try:
+            yield connection
+        except BaseException:
+            await asyncio.shield(__rollback(connection, "rollback;"))
+            raise
+        else:
+            await connection.execute("commit;")
+            for callback in uow.callbacks:
+                callback()
+        finally:
+            _unit_of_work.reset(token)
+
+
+@asynccontextmanager
+async def __savepoint(uow: _UnitOfWork) -> AsyncIterator[None]:
+    """Nested unit of work."""
+
+    uow.depth += 1
+    name = f"unit_of_work_{uow.depth}"
+    callbacks = len(uow.callbacks)
+    await uow.connection.execute(f"savepoint {name};")
+    try:
+        yield
+    except BaseException:
+        del uow.callbacks[callbacks:]
+        await asyncio.shield(
+            __rollback(uow.connection, f"rollback to savepoint {name};"),
+        )
+        raise
+    else:
+        await uow.connection.execute(f"release savepoint {name};")
+    finally:
+        uow.depth -= 1
+
+
+async def __rollback(connection: BaseConnection, query: str) -> None:
+    """Roll back and keep the original error of the unit of work."""
+
+    try:
+        await connection.execute(query)
+    except DatabaseError:
+        # The connection is broken, so it is closed instead of reused.
+        await connection.close()
@@ -1,23 +1,51 @@
-from functools import wraps
-from typing import List, Union
+"""Handlers for postgresql queries.
+
+- Collect response
+- Handle exceptions
+    - If postgresql query have empty result, raises ``EmptyResult``
+"""
+
+import typing
+from functools import partial, wraps
+from typing import Any, Callable, List, Tuple, Union
 
 import pydantic
-from psycopg2.extras import RealDictRow
 
 from app.internal.repository.postgresql.handlers.handle_exception import (
     handle_exception,
 )
+from app.pkg.connectors.base import Row
 from app.pkg.models.base import Model
 from app.pkg.models.exceptions.repository import EmptyResult
 
 __all__ = ["collect_response"]
 
+#: Types of model fields whose columns can be returned as ``memoryview``.
+_BYTES_TYPES = (bytes, pydantic.SecretBytes)
 
-def collect_response(fn):
-    """
+
+def collect_response(fn=None, *, trusted: bool = False):
+    """Convert rows returned by `fn` to the model of its return annotation.
+
+    The annotation is resolved once, when `fn` is decorated, into a
+    converter of one row or of a list of rows.
+
+    Examples:
+        ::
+
+            @collect_response
+            async def read(self, query: ReadUserQuery) -> UserResponse:
+                ...
+
+            @collect_response(trusted=True)
+            async def read_all(self) -> List[UserResponse]:
+                ...
 
     Args:
         fn: Target function that contains a query in postgresql.
+        trusted: Rows already have types of the model fields, e.g. rows of
+            its own table, so models are built by ``construct`` without
+            validation.
 
     Returns:
         The model that is specified in type hints of `fn`.
@@ -27,44 +55,101 @@ def collect_response(fn):
 
     """
 
+    if fn is None:
+        return partial(collect_response, trusted=trusted)
+
+    convert = __build_converter(typing.get_type_hints(fn)["return"], trusted)
+
     @wraps(fn)
     @handle_exception
     async def inner(*args: object, **kwargs: object) -> Union[List[Model], Model]:
         response = await fn(*args, **kwargs)
         if not response:
             raise EmptyResult
-        return pydantic.parse_obj_as(
-            (ann := fn.__annotations__["return"]),
-            await __convert_response(response=response, annotations=str(ann)),
-        )
+        return convert(response)
 
     return inner
 
 
-async def __convert_response(response: RealDictRow, annotations: str):
-    """
-    Converts the response of the request to an List of models or to a single model.
+def __build_converter(annotation: Any, trusted: bool) -> Callable[[Any], Any]:
+    """Build converter of the response of a query to ``annotation``.
+
     Args:
-        response: Response of aiopg query.
-        annotations: Annotations of `fn`.
+        annotation: ``Model`` or ``List[Model]``, other types are parsed with
+            ``pydantic.parse_obj_as``.
+        trusted: Build models without validation.
 
-    Returns: List[`Model`] if List is specified in the type annotations,
-            or a single `Model` if `Model` is specified in the type annotations.
+    Returns:
+        Function which converts one row, or a list of rows if ``annotation``
+        is a list.
     """
 
-    r = response.copy()
-    if annotations.replace("typing.", "").startswith("List"):
-        return [await __convert_memory_viewer(item) for item in r]
-    return await __convert_memory_viewer(r)
+    many = typing.get_origin(annotation) is list
+    model = typing.get_args(annotation)[0] if many else annotation
+
+    if not (isinstance(model, type) and issubclass(model, pydantic.BaseModel)):
+        return lambda response: pydantic.parse_obj_as(annotation, response)
 
+    parse = (
+        __build_trusted_row_converter(model)
+        if trusted
+        else __build_row_converter(model)
+    )
+    if many:
+        return lambda rows: [parse(row) for row in rows]
+    return parse
 
-async def __convert_memory_viewer(r: RealDictRow):
-    """Convert memory viewer in bytes.
+
+def __build_row_converter(model: type[Model]) -> Callable[[Row], Model]:
+    """Build converter of one row to ``model``.
 
     Notes: aiopg returns memory viewer in query response,
-        when in database type of cell `bytes`.
+        when in database type of cell `bytes`, so only columns of bytes
+        fields are converted.
+    """
+
+    columns = __bytes_columns(model)
+    if not columns:
+        return model.parse_obj
+
+    def parse(row: Row) -> Model:
+        row = dict(row)
+        for column in columns:
+            if isinstance(value := row.get(column), memoryview):
+                row[column] = value.tobytes()
+        return model.parse_obj(row)
+
+    return parse
+
+
+def __build_trusted_row_converter(model: type[Model]) -> Callable[[Row], Model]:
+    """Build converter of one row to ``model`` without validation.
+
+    Columns which are not fields of ``model`` are dropped, as
+    ``construct`` keeps extra values.
     """
-    for key, value in r.items():
-        if isinstance(value, memoryview):
-            r[key] = value.tobytes()
-    return r
+
+    fields = tuple((field.alias, name) for name, field in model.__fields__.items())
+    columns = set(__bytes_columns(model))
+
+    def construct(row: Row) -> Model:
+        values = {}
+        for column, name in fields:
+            if column in row:
+                value = row[column]
+                if column in columns and isinstance(value, memoryview):
+                    value = value.tobytes()
+                values[name] = value
+        return model.construct(**values)
+
+    return construct
+
+
+def __bytes_columns(model: type[Model]) -> Tuple[str, ...]:
+    """Columns of ``model`` fields which hold bytes."""
+
+    return tuple(
+        field.alias
+        for field in model.__fields__.values()
+        if isinstance(field.type_, type) and issubclass(field.type_, _BYTES_TYPES)
+    )
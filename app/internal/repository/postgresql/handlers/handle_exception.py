@@ -1,8 +1,10 @@
-from typing import Callable
+import inspect
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, NoReturn
 
-from psycopg2 import Error as QueryError
 from psycopg2 import errorcodes
 
+from app.pkg.connectors.base import DatabaseError
 from app.pkg.models.base import Model
 from app.pkg.models.exceptions.repository import DriverError, UniqueViolation
 
@@ -12,6 +14,8 @@ __all__ = ["handle_exception"]
 def handle_exception(func: Callable[..., Model]):
     """Decorator Catching Postgresql Query Exceptions.
 
+    Async generators are supported as well, e.g. for streamed results.
+
     Args:
         func: callable function object.
 
@@ -23,13 +27,35 @@ def handle_exception(func: Callable[..., Model]):
         DriverError: Invalid database query/
     """
 
+    if inspect.isasyncgenfunction(func):
+        return __wrap_async_generator(func)
+    return __wrap_coroutine(func)
+
+
+def __wrap_coroutine(func: Callable[..., Model]):
     async def wrapper(*args: object, **kwargs: object) -> Model:
         try:
             return await func(*args, **kwargs)
-        except QueryError as e:
-            if e.pgcode == errorcodes.UNIQUE_VIOLATION:
-                raise UniqueViolation
+        except DatabaseError as e:
+            __raise_repository_error(e)
+
+    return wrapper
 
-            raise DriverError(message=e.pgerror)
+
+def __wrap_async_generator(func: Callable[..., AsyncIterator[Model]]):
+    async def wrapper(*args: object, **kwargs: object) -> AsyncIterator[Model]:
+        try:
+            async with aclosing(func(*args, **kwargs)) as items:
+                async for item in items:
+                    yield item
+        except DatabaseError as e:
+            __raise_repository_error(e)
 
     return wrapper
+
+
+def __raise_repository_error(e: DatabaseError) -> NoReturn:
+    if e.pgcode == errorcodes.UNIQUE_VIOLATION:
+        raise UniqueViolation
+
+    raise DriverError(message=e.pgerror)
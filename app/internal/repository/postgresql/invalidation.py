@@ -0,0 +1,222 @@
+"""Invalidation of cached users across worker processes.
+
+Writes of ``UserRepository`` publish ids of created and changed users to
+``users_invalidation`` channel with Postgres ``notify``, which is delivered
+on commit. Every worker keeps one connection that listens to the channel,
+evicts those users from its caches and bumps its version of the users
+table, which keys cached collection responses.
+
+Messages are tagged by the worker which published them. The worker updates
+its own caches after commit of its writes, so the listener skips its own
+messages, which would evict the users just cached.
+
+Each message is numbered by ``users_invalidation_seq``. Numbers are taken
+when the statement runs, while messages are delivered on commit, so they
+arrive out of order and a lost message cannot be told by them. The listener
+clears the caches whenever it reconnects, as messages could have been
+published while it was disconnected.
+"""
+
+import asyncio
+import os
+import uuid
+from functools import lru_cache
+from typing import Dict, Optional
+
+from app.pkg import models
+from app.pkg.cache import BaseCache, NegativeCache, Version
+from app.pkg.connectors.base import BaseConnection, DatabaseError
+from app.pkg.connectors.postgresql import Postgresql
+from app.pkg.logger import get_logger
+
+__all__ = [
+    "UsersInvalidationListener",
+    "invalidation_origin",
+    "join_users_invalidation",
+    "notify_users_invalidation",
+    "with_invalidation_origin",
+]
+
+logger = get_logger(__name__)
+
+#: str: Channel of invalidation messages.
+USERS_INVALIDATION_CHANNEL = "users_invalidation"
+
+#: str: Sequence that numbers invalidation messages.
+USERS_INVALIDATION_SEQUENCE = "users_invalidation_seq"
+
+#: str: Query param with the origin of invalidation messages.
+USERS_INVALIDATION_ORIGIN = "invalidation_origin"
+
+
+@lru_cache(maxsize=1)
+def _origin(pid: int) -> str:
+    return uuid.uuid4().hex
+
+
+def invalidation_origin() -> str:
+    """Origin of invalidation messages published by the current process.
+
+    The origin is keyed by pid, so a forked worker gets its own one.
+    """
+
+    return _origin(os.getpid())
+
+
+def with_invalidation_origin(params: Dict[str, object]) -> Dict[str, object]:
+    """Add the origin of the current process to params of a query which
+    publishes invalidation messages."""
+
+    return {**params, USERS_INVALIDATION_ORIGIN: invalidation_origin()}
+
+
+def join_users_invalidation(id_column: str) -> str:
+    """Join which publishes ``<number>:<origin>:<id>`` for each row of a
+    query.
+
+    The query takes the origin by ``with_invalidation_origin`` params.
+
+    Args:
+        id_column: Column with ids of changed users, rows with ``null`` id
+            are not published.
+    """
+
+    return f"""
+        left join lateral (
+            select pg_notify(
+                '{USERS_INVALIDATION_CHANNEL}',
+                nextval('{USERS_INVALIDATION_SEQUENCE}')::text
+                    || ':' || %({USERS_INVALIDATION_ORIGIN})s::text
+                    || ':' || {id_column}
+            )
+            where {id_column} is not null
+        ) as notified on true
+    """
+
+
+def notify_users_invalidation(query: str) -> str:
+    """Wrap a query that returns changed users to publish their ids.
+
+    Args:
+        query: ``insert``, ``update`` or ``delete`` query with ``returning``
+            clause and without trailing semicolon.
+
+    Returns:
+        Query that returns the same rows and publishes
+        ``<number>:<origin>:<id>`` for each of them.
+    """
+
+    return f"""
+        with changed as ({query})
+        select changed.* from changed
+            {join_users_invalidation("changed.id")};
+    """
+
+
+class UsersInvalidationListener:
+    """Listen to invalidation messages and evict users from the caches.
+
+    Messages of ``origin``, the current process by default, only advance
+    ``position``.
+    """
+
+    #: int: Number of the last message seen, ``None`` before first connect.
+    position: Optional[int]
+
+    def __init__(
+        self,
+        users_cache: BaseCache[str, models.UserResponse],
+        users_negative_cache: Optional[NegativeCache[str]] = None,
+        users_version: Optional[Version] = None,
+        reconnect_delay: float = 1.0,
+        connect_timeout: float = 10.0,
+        origin: Optional[str] = None,
+    ):
+        self.position = None
+        self.__caches = [
+            cache for cache in (users_cache, users_negative_cache) if cache is not None
+        ]
+        self.__users_version = users_version or Version()
+        self.__reconnect_delay = reconnect_delay
+        self.__connect_timeout = connect_timeout
+        self.__origin = origin
+        self.__task: Optional[asyncio.Task[None]] = None
+        self.__listening = asyncio.Event()
+
+    async def start(self, postgresql: Postgresql) -> None:
+        """Start listening in background on a dedicated connection to
+        ``postgresql``.
+
+        Waits until the listener is subscribed, so invalidations published
+        after startup are not missed, but no longer than
+        ``connect_timeout``.
+        """
+
+        if self.__task is not None:
+            return
+
+        self.__listening = asyncio.Event()
+        self.__task = asyncio.create_task(self.__run(postgresql))
+        try:
+            await asyncio.wait_for(
+                self.__listening.wait(),
+                timeout=self.__connect_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Users invalidation listener is not connected yet")
+
+    async def stop(self) -> None:
+        """Stop listening."""
+
+        if self.__task is None:
+            return
+
+        task, self.__task = self.__task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def __run(self, postgresql: Postgresql) -> None:
+        while True:
+            try:
+                async with postgresql.connect() as conn:
+                    await conn.listen(USERS_INVALIDATION_CHANNEL)
+                    await self.__resync(conn)
+                    self.__listening.set()
+                    async for payload in conn.notifications():
+                        self.__invalidate(payload)
+            except (DatabaseError, OSError, asyncio.TimeoutError) as e:
+                logger.warning("Users invalidation listener is disconnected: %s", e)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Users invalidation listener has failed")
+
+            self.__listening.clear()
+            await asyncio.sleep(self.__reconnect_delay)
+
+    async def __resync(self, conn: BaseConnection) -> None:
+        """Clear the caches, as messages could be lost while disconnected."""
+
+        row = await conn.fetchone(
+            f"""
+                select case when is_called then last_value else 0 end as position
+                    from {USERS_INVALIDATION_SEQUENCE};
+            """,
+        )
+        if self.position is not None:
+            logger.info("Users caches are cleared after reconnect")
+        for cache in self.__caches:
+            cache.clear()
+        self.__users_version.bump()
+        self.position = row["position"] if row is not None else 0
+
+    def __invalidate(self, payload: str) -> None:
+        position, origin, user_id = payload.split(":", 2)
+        self.position = max(self.position or 0, int(position))
+        if origin == (self.__origin or invalidation_origin()):
+            return
+
+        for cache in self.__caches:
+            cache.delete(user_id)
+        self.__users_version.bump()
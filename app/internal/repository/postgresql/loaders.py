@@ -0,0 +1,35 @@
+"""Batch loaders on top of PostgreSQL repositories."""
+
+from typing import Dict, List
+
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg import models
+from app.pkg.loaders import BatchLoader
+from app.pkg.models.exceptions.repository import EmptyResult
+
+__all__ = ["UserLoader"]
+
+
+class UserLoader(BatchLoader[str, models.UserResponse]):
+    """Coalesce concurrent reads of single users into ``read_many``."""
+
+    __user_repository: UserRepository
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        max_batch_size: int,
+        window: float,
+    ):
+        super().__init__(max_batch_size=max_batch_size, window=window)
+        self.__user_repository = user_repository
+
+    async def load_many(self, keys: List[str]) -> Dict[str, models.UserResponse]:
+        try:
+            users = await self.__user_repository.read_many(
+                query=models.ReadManyUsersQuery(ids=keys),
+            )
+        except EmptyResult:
+            return {}
+
+        return {user.id: user for user in users}
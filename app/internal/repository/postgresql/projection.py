@@ -0,0 +1,38 @@
+"""Select lists derived from models returned by repositories."""
+
+from typing import Optional, Tuple, Type
+
+import pydantic
+
+__all__ = ["select_list"]
+
+
+def select_list(
+    model: Type[pydantic.BaseModel],
+    fields: Optional[Tuple[str, ...]] = None,
+    table: Optional[str] = None,
+) -> str:
+    """Columns of ``model`` fields, so a query reads only what the model
+    keeps.
+
+    Examples:
+        ::
+
+            >>> from app.pkg.models import UserResponse
+            >>> select_list(UserResponse)
+            'id, username, created_at'
+            >>> select_list(UserResponse, fields=("id",), table="inserted")
+            'inserted.id'
+
+    Args:
+        model: Model built from the rows, columns are aliases of its fields.
+        fields: Names of fields to select, all fields of ``model`` if not set.
+        table: Name or alias of the table to qualify columns with.
+    """
+
+    prefix = f"{table}." if table else ""
+    return ", ".join(
+        prefix + field.alias
+        for name, field in model.__fields__.items()
+        if fields is None or name in fields
+    )
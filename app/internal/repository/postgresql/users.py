@@ -1,97 +1,342 @@
 """PostgreSQL repository for users."""
 
-from typing import List
+from contextlib import aclosing
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from app.internal.repository.base import Repository
 from app.internal.repository.postgresql.connection import get_connection
 from app.internal.repository.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.postgresql.handlers.handle_exception import (
+    handle_exception,
+)
+from app.internal.repository.postgresql.invalidation import (
+    join_users_invalidation,
+    notify_users_invalidation,
+    with_invalidation_origin,
+)
+from app.internal.repository.postgresql.projection import select_list
 from app.pkg import models
+from app.pkg.connectors.base import Row
+from app.pkg.connectors.postgresql.statements import Statement
+from app.pkg.models.exceptions.repository import DriverError
 
 __all__ = ["UserRepository"]
 
+#: str: Columns of ``UserResponse`` returned by queries of users.
+_USER_COLUMNS = select_list(models.UserResponse)
+
+
+def _projection_name(name: str, fields: Optional[Tuple[str, ...]]) -> str:
+    """Name of statement ``name`` which selects only ``fields``.
+
+    The projection is tagged by a bitmask of the fields right after the
+    ``users_`` prefix, as Postgres truncates names longer than 63 bytes.
+    """
+
+    if fields is None:
+        return name
+
+    mask = sum(
+        1 << i
+        for i, field in enumerate(models.UserResponse.__fields__)
+        if field in fields
+    )
+    return name.replace("users_", f"users_p{mask}_", 1)
+
+
+def _build_update_statement(columns: Tuple[str, ...]) -> Statement:
+    """Build update statement for the set of updated columns."""
+
+    return Statement(
+        name=f"users_update_{'_'.join(columns)}",
+        query=notify_users_invalidation(
+            f"""
+                update users set {", ".join(f"{c} = %({c})s" for c in columns)}
+                    where id = %(id)s and deleted_at is null
+                returning {_USER_COLUMNS}
+            """,
+        ),
+    )
+
+
+#: Dict[str, str]: Conditions of users page, by names of their params.
+_PAGE_CONDITIONS = {
+    "after": (
+        "(created_at, id) > (%(after_created_at)s::timestamp, %(after_id)s::text)"
+    ),
+    "created_after": "created_at > %(created_after)s::timestamp",
+    "created_before": "created_at < %(created_before)s::timestamp",
+    "username_prefix": "starts_with(username, %(username_prefix)s::text)",
+}
+
+
+@lru_cache(maxsize=None)
+def _build_page_statement(
+    conditions: Tuple[str, ...],
+    fields: Optional[Tuple[str, ...]],
+) -> Statement:
+    """Build statement of users page for the set of its conditions and the
+    selected fields.
+
+    Users are ordered by ``(created_at, id)``, so every page is a range scan
+    of ``users_created_at_id_active`` index starting after the cursor.
+    """
+
+    where = " and ".join(
+        ("deleted_at is null", *(_PAGE_CONDITIONS[c] for c in conditions)),
+    )
+    return Statement(
+        name=_projection_name("_".join(("users_read_page", *conditions)), fields),
+        query=f"""
+            select {select_list(models.UserResponse, fields)} from users
+                where {where}
+                order by created_at, id
+                limit %(limit)s::int;
+        """,
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_read_many_statement(fields: Optional[Tuple[str, ...]]) -> Statement:
+    """Build statement of users by ids for the selected fields."""
+
+    return Statement(
+        name=_projection_name("users_read_many", fields),
+        query=f"""
+            select {select_list(models.UserResponse, fields)} from users
+                where id = any(%(ids)s::text[]) and deleted_at is null;
+        """,
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_export_statement(fields: Optional[Tuple[str, ...]]) -> Statement:
+    """Build statement of export of users for the selected fields."""
+
+    return Statement(
+        name=_projection_name("users_export", fields),
+        query=f"""
+            select {select_list(models.UserResponse, fields)} from users
+                where deleted_at is null
+                order by created_at, id;
+        """,
+    )
+
 
 class UserRepository(Repository):
     """User repository implementation."""
 
-    @collect_response
+    __create = Statement(
+        name="users_create",
+        query=notify_users_invalidation(
+            f"""
+                insert into users(
+                    username, password
+                ) values (
+                    %(username)s, %(password)s
+                )
+                returning {_USER_COLUMNS}
+            """,
+        ),
+    )
+
+    __create_many = Statement(
+        name="users_create_many",
+        query=f"""
+            with input as (
+                select username, password, ord, row_number() over (
+                    partition by username order by ord
+                ) as occurrence
+                from unnest(%(username)s::text[], %(password)s::text[])
+                    with ordinality as t(username, password, ord)
+            ), inserted as (
+                insert into users(username, password)
+                    select username, password from input
+                        where occurrence = 1
+                        order by ord
+                on conflict (username) where deleted_at is null do nothing
+                returning {_USER_COLUMNS}
+            )
+            select {select_list(models.UserResponse, table="inserted")}
+            from input
+                left join inserted
+                    on inserted.username = input.username
+                    and input.occurrence = 1
+                {join_users_invalidation("inserted.id")}
+            order by input.ord;
+        """,
+    )
+
+    __read = Statement(
+        name="users_read",
+        query=f"""
+            select {_USER_COLUMNS} from users
+                where id = %(id)s and deleted_at is null;
+        """,
+    )
+
+    __read_all = Statement(
+        name="users_read_all",
+        query=f"""
+            select {_USER_COLUMNS} from users
+                where deleted_at is null;
+        """,
+    )
+
+    __update: Dict[Tuple[str, ...], Statement] = {
+        columns: _build_update_statement(columns)
+        for columns in (("username",), ("password",), ("username", "password"))
+    }
+
+    __delete = Statement(
+        name="users_delete",
+        query=notify_users_invalidation(
+            f"""
+                update users set deleted_at = now()
+                    where id = %(id)s and deleted_at is null
+                returning {_USER_COLUMNS}
+            """,
+        ),
+    )
+
+    @collect_response(trusted=True)
     async def create(self, cmd: models.CreateUserCommand) -> models.UserResponse:
-        q = """
-            insert into users(
-                username, password
-            ) values (
-                %(username)s, %(password)s
+        async with get_connection() as conn:
+            return await conn.fetchone(
+                self.__create,
+                with_invalidation_origin(cmd.to_dict()),
             )
-            returning id, username, password, created_at, deleted_at;
+
+    @handle_exception
+    async def create_many(
+        self,
+        cmds: List[models.CreateUserCommand],
+    ) -> List[Optional[models.UserResponse]]:
+        """Create users by one statement.
+
+        Users whose username is taken, either by an active user or by a
+        previous user of ``cmds``, are skipped.
+
+        Returns:
+            Created users in the same order as ``cmds``, and ``None`` for
+            skipped ones.
         """
 
-        async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+        params = {
+            "username": [cmd.username for cmd in cmds],
+            "password": [cmd.password for cmd in cmds],
+        }
+        async with get_connection() as conn:
+            rows = await conn.fetchall(
+                self.__create_many,
+                with_invalidation_origin(params),
+            )
+
+        return [
+            models.UserResponse.parse_obj(row) if row["id"] is not None else None
+            for row in rows
+        ]
 
-    @collect_response
+    @collect_response(trusted=True)
     async def read(self, query: models.ReadUserQuery) -> models.UserResponse:
-        q = """
-            select id, username, password, created_at, deleted_at from users
-                where id = %(id)s and deleted_at is null;
-        """
-        async with get_connection() as cur:
-            await cur.execute(q, query.to_dict())
-            return await cur.fetchone()
+        async with get_connection(read_only=True) as conn:
+            return await conn.fetchone(self.__read, query.to_dict())
+
+    @collect_response(trusted=True)
+    async def read_many(
+        self,
+        query: models.ReadManyUsersQuery,
+    ) -> List[models.UserResponse]:
+        """Read active users by ids in any order, only ``query.fields`` of
+        them if set."""
 
-    @collect_response
+        statement = _build_read_many_statement(query.fields)
+        async with get_connection(read_only=True) as conn:
+            return await conn.fetchall(statement, {"ids": query.ids})
+
+    @collect_response(trusted=True)
     async def read_all(self) -> List[models.UserResponse]:
-        q = """
-            select id, username, password, created_at, deleted_at from users
-                where deleted_at is null;
+        async with get_connection(read_only=True) as conn:
+            return await conn.fetchall(self.__read_all)
+
+    @collect_response(trusted=True)
+    async def read_page(
+        self,
+        query: models.ReadUsersPageQuery,
+        after: Optional[models.UsersPageCursor] = None,
+    ) -> List[models.UserResponse]:
+        """Read ``query.limit`` users that follow ``after`` in ``(created_at,
+        id)`` order, only ``query.fields`` of them if set."""
+
+        params: Dict[str, Any] = {"limit": query.limit}
+        conditions: Tuple[str, ...] = ()
+        if after is not None:
+            params.update(after_created_at=after.created_at, after_id=after.id)
+            conditions += ("after",)
+        for condition in ("created_after", "created_before", "username_prefix"):
+            if (value := getattr(query, condition)) is not None:
+                params[condition] = value
+                conditions += (condition,)
+
+        statement = _build_page_statement(conditions, query.fields)
+        async with get_connection(read_only=True) as conn:
+            return await conn.fetchall(statement, params)
+
+    @handle_exception
+    async def export(
+        self,
+        chunk_size: int = 1000,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> AsyncIterator[Row]:
+        """Stream all active users through a server-side cursor.
+
+        Rows are not converted to models, so the caller decides how to
+        serialize them. The connection is held until the iterator is
+        exhausted or closed.
+
+        Args:
+            chunk_size: Number of rows fetched from the cursor at a time.
+            fields: Columns of ``UserResponse`` fields to read, all of them
+                if not set.
         """
-        async with get_connection() as cur:
-            await cur.execute(q)
-            return await cur.fetchall()
 
-    @collect_response
+        statement = _build_export_statement(fields)
+        async with get_connection(read_only=True) as conn:
+            rows = conn.stream(statement, chunk_size=chunk_size)
+            async with aclosing(rows):
+                async for row in rows:
+                    yield row
+
+    @collect_response(trusted=True)
     async def update(
         self,
         cmd: models.UpdateUserCommand,
     ) -> models.UserResponse:
-        # nosec
-        q = f"""
-            update users set {self.__build_update_statement(cmd=cmd)}
-                where id = %(id)s and deleted_at is null
-            returning id, username, password, created_at, deleted_at;
-        """
-
-        async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+        async with get_connection() as conn:
+            return await conn.fetchone(
+                self.__get_update_statement(cmd=cmd),
+                with_invalidation_origin(cmd.to_dict()),
+            )
 
-    @collect_response
+    @collect_response(trusted=True)
     async def delete(self, cmd: models.DeleteUserCommand) -> models.UserResponse:
-        q = """
-            update users set deleted_at = now()
-                where id = %(id)s and deleted_at is null
-            returning id, username, password, created_at, deleted_at;
-        """
-        async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
-
-    @staticmethod
-    def __build_update_statement(cmd: models.UpdateUserCommand) -> str:
-        update_statements = []
-
-        if cmd.username is not None:
-            update_statements.append(
-                """
-                    username = %(username)s
-                """,
-            )
-        if cmd.password is not None:
-            update_statements.append(
-                """
-                    password = %(password)s
-                """,
+        async with get_connection() as conn:
+            return await conn.fetchone(
+                self.__delete,
+                with_invalidation_origin(cmd.to_dict()),
             )
 
-        return (", ".join(update_statements)) if update_statements else ""
+    def __get_update_statement(self, cmd: models.UpdateUserCommand) -> Statement:
+        columns = tuple(
+            column
+            for column in ("username", "password")
+            if getattr(cmd, column) is not None
+        )
+
+        if not columns:
+            raise DriverError(message="Nothing to update.")
+
+        return self.__update[columns]
@@ -1,5 +1,6 @@
 """Global point for collected routers."""
 
+from app.internal.routes.admin import admin_router
 from app.internal.routes.healthcheck import healthcheck_router
 from app.internal.routes.users import users_router
 from app.pkg.models.core.routes import Routes
@@ -13,5 +14,6 @@ __routes__ = Routes(
     routers=(
         healthcheck_router,
         users_router,
+        admin_router,
     ),
 )
@@ -0,0 +1,83 @@
+"""Admin routes."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.internal.pkg.middlewares.validation import validate_access_key
+from app.internal.repository.postgresql.loaders import UserLoader
+from app.internal.routes.dependencies import (
+    get_user_loader,
+    get_users_cache,
+    get_users_negative_cache,
+    get_users_service,
+)
+from app.internal.services.users import UserService
+from app.pkg.cache import BaseCache, NegativeCache
+from app.pkg import models
+from app.pkg.connectors.postgresql.statements import registry
+
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[
+        Depends(validate_access_key),
+    ],
+)
+
+
+@admin_router.get(
+    "/statistics",
+    status_code=status.HTTP_200_OK,
+    description="Get runtime statistics of the worker process.",
+    response_model=models.StatisticsResponse,
+)
+async def read_statistics(
+    user_loader: UserLoader = Depends(get_user_loader),
+    users_cache: BaseCache = Depends(get_users_cache),
+    users_negative_cache: NegativeCache = Depends(get_users_negative_cache),
+):
+    return models.StatisticsResponse(
+        prepared_statements=models.PreparedStatementsStatistics(
+            prepared=registry.prepared,
+            hits=registry.hits,
+            misses=registry.misses,
+        ),
+        users_loader=models.BatchLoaderStatistics(
+            loads=user_loader.loads,
+            coalesced=user_loader.coalesced,
+            batches=user_loader.batches,
+            keys=user_loader.keys,
+        ),
+        users_cache=models.CacheStatistics(
+            size=users_cache.size,
+            hits=users_cache.hits,
+            misses=users_cache.misses,
+            evictions=users_cache.evictions,
+            rejections=users_cache.rejections,
+        ),
+        users_negative_cache=models.CacheStatistics(
+            size=users_negative_cache.size,
+            hits=users_negative_cache.hits,
+            misses=users_negative_cache.misses,
+            evictions=users_negative_cache.evictions,
+            rejections=users_negative_cache.rejections,
+        ),
+    )
+
+
+@admin_router.get(
+    "/users/hot",
+    status_code=status.HTTP_200_OK,
+    description="Get the most frequently read users of the worker process.",
+    response_model=models.HotUsersResponse,
+)
+async def read_hot_users(
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        description="Maximum number of users, all tracked users if not set.",
+    ),
+    users_service: UserService = Depends(get_users_service),
+):
+    return users_service.read_hot_users(limit=limit)
@@ -0,0 +1,66 @@
+"""Singletons of the worker which routes depend on."""
+
+from dependency_injector import providers
+from dependency_injector.wiring import Provider, inject
+
+from app.internal.pkg.dependencies.singleton import SingletonDependency
+from app.internal.repository.postgresql.loaders import UserLoader
+from app.internal.services import Services
+from app.internal.services.users import UserService
+from app.pkg.cache import BaseCache, NegativeCache
+
+__all__ = [
+    "get_user_loader",
+    "get_users_cache",
+    "get_users_negative_cache",
+    "get_users_service",
+]
+
+
+@inject
+def _users_service(
+    provider: providers.Provider = Provider[Services.users_service],
+) -> providers.Provider:
+    return provider
+
+
+@inject
+def _user_loader(
+    provider: providers.Provider = Provider[Services.repositories.user_loader],
+) -> providers.Provider:
+    return provider
+
+
+@inject
+def _users_cache(
+    provider: providers.Provider = Provider[Services.users_cache],
+) -> providers.Provider:
+    return provider
+
+
+@inject
+def _users_negative_cache(
+    provider: providers.Provider = Provider[Services.users_negative_cache],
+) -> providers.Provider:
+    return provider
+
+
+#: SingletonDependency: Service of users, resolved once.
+get_users_service: SingletonDependency[UserService] = SingletonDependency(
+    _users_service,
+)
+
+#: SingletonDependency: Loader of users by id, resolved once.
+get_user_loader: SingletonDependency[UserLoader] = SingletonDependency(
+    _user_loader,
+)
+
+#: SingletonDependency: Cache of users by id, resolved once.
+get_users_cache: SingletonDependency[BaseCache] = SingletonDependency(
+    _users_cache,
+)
+
+#: SingletonDependency: Ids of missing users, resolved once.
+get_users_negative_cache: SingletonDependency[NegativeCache] = SingletonDependency(
+    _users_negative_cache,
+)
@@ -1,71 +1,175 @@
 """User routes."""
 
-from typing import List
+import datetime
+from typing import Any, List, Optional, Union
 
-from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi.responses import Response, StreamingResponse
 
-from app.internal.services import Services
 from app.internal.services.users import UserService
 from app.internal.pkg.middlewares.validation import validate_access_key
+from app.internal.pkg.responses.model_json import ModelJSONResponse
+from app.internal.pkg.routes.trusted_response import TrustedResponseRoute
+from app.internal.routes.dependencies import get_users_service
 from app.pkg import models
+from app.pkg.settings import settings
 
 users_router = APIRouter(
     prefix="/users",
     tags=["Users"],
+    route_class=TrustedResponseRoute,
+    default_response_class=ModelJSONResponse,
     dependencies=[
         Depends(validate_access_key),
     ],
 )
 
 
+def _fields_query() -> Any:
+    """Query param which selects fields of ``UserResponse`` to return."""
+
+    field = "|".join(models.UserResponse.__fields__)
+    return Query(
+        default=None,
+        pattern=f"^({field})(,({field}))*$",
+        description="Comma-separated fields of users to return, all if not set.",
+        examples=["id,username"],
+    )
+
+
 @users_router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     description="Create new user.",
     response_model=models.UserResponse,
 )
-@inject
 async def create_user(
     cmd: models.CreateUserCommand,
-    users_service: UserService = Depends(
-        Provide[Services.users_service],
-    ),
+    users_service: UserService = Depends(get_users_service),
 ):
     return await users_service.create_user(cmd=cmd)
 
 
+@users_router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    description="Create users of the batch, skipping ones with taken username.",
+    response_model=models.CreateUsersBatchResponse,
+)
+async def create_users(
+    cmds: List[models.CreateUserCommand] = Body(
+        min_items=1,
+        max_items=settings.API_BATCH_SIZE_MAX,
+    ),
+    users_service: UserService = Depends(get_users_service),
+):
+    return await users_service.create_users(cmds=cmds)
+
+
+@users_router.post(
+    "/lookup",
+    status_code=status.HTTP_200_OK,
+    description="Get users by ids, for lists of ids too long for a query string.",
+    response_model=models.ReadManyUsersResponse,
+)
+async def read_many_users(
+    ids: List[str] = Body(
+        embed=True,
+        min_items=1,
+        max_items=settings.API_BATCH_SIZE_MAX,
+    ),
+    fields: Optional[str] = _fields_query(),
+    users_service: UserService = Depends(get_users_service),
+):
+    return await users_service.read_many_users(
+        query=models.ReadManyUsersQuery(ids=ids, fields=fields),
+    )
+
+
+@users_router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    description="Export all users as newline-delimited JSON.",
+    response_class=StreamingResponse,
+)
+async def export_users(
+    fields: Optional[str] = _fields_query(),
+    users_service: UserService = Depends(get_users_service),
+):
+    return StreamingResponse(
+        users_service.export_users(
+            fields=models.UserProjectionQuery(fields=fields).fields,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
 @users_router.get(
     "/{user_id:str}",
     status_code=status.HTTP_200_OK,
     description="Get an user.",
     response_model=models.UserResponse,
 )
-@inject
 async def read_user(
     user_id: str,
-    users_service: UserService = Depends(
-        Provide[Services.users_service],
-    ),
+    fields: Optional[str] = _fields_query(),
+    users_service: UserService = Depends(get_users_service),
 ):
     return await users_service.read_user(
-        query=models.ReadUserQuery(id=user_id),
+        query=models.ReadUserQuery(id=user_id, fields=fields),
     )
 
 
 @users_router.get(
     "",
     status_code=status.HTTP_200_OK,
-    description="Get all users.",
-    response_model=List[models.UserResponse],
+    description=(
+        "Get users by ids, or page of users ordered by registration date "
+        "if ids are not set."
+    ),
+    response_model=Union[models.ReadManyUsersResponse, models.UsersPageResponse],
 )
-@inject
-async def read_all_users(
-    users_service: UserService = Depends(
-        Provide[Services.users_service],
+async def read_users(
+    ids: Optional[List[str]] = Query(
+        default=None,
+        max_items=settings.API_PAGE_SIZE_MAX,
+        description="Ids of users, other params are ignored if set.",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor returned with the previous page.",
     ),
+    limit: int = Query(
+        default=settings.API_PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.API_PAGE_SIZE_MAX,
+        description="Maximum number of users in the page.",
+    ),
+    created_after: Optional[datetime.datetime] = None,
+    created_before: Optional[datetime.datetime] = None,
+    username_prefix: Optional[str] = Query(default=None, min_length=1),
+    fields: Optional[str] = _fields_query(),
+    users_service: UserService = Depends(get_users_service),
 ):
-    return await users_service.read_all_users()
+    if ids:
+        return await users_service.read_many_users(
+            query=models.ReadManyUsersQuery(ids=ids, fields=fields),
+        )
+
+    # Page is encoded by the service, so its cached bytes are returned as is.
+    return Response(
+        content=await users_service.read_users_page_json(
+            query=models.ReadUsersPageQuery(
+                cursor=cursor,
+                limit=limit,
+                created_after=created_after,
+                created_before=created_before,
+                username_prefix=username_prefix,
+                fields=fields,
+            ),
+        ),
+        media_type="application/json",
+    )
 
 
 @users_router.patch(
@@ -74,13 +178,10 @@ async def read_all_users(
     description="Update an user.",
     response_model=models.UserResponse,
 )
-@inject
 async def update_user(
     user_id: str,
     cmd: models.UpdateUserCommandPayload,
-    users_service: UserService = Depends(
-        Provide[Services.users_service],
-    ),
+    users_service: UserService = Depends(get_users_service),
 ):
     return await users_service.update_user(
         cmd=models.UpdateUserCommand(id=user_id, **cmd.to_dict()),
@@ -93,12 +194,9 @@ async def update_user(
     description="Delete an user.",
     response_model=models.UserResponse,
 )
-@inject
 async def delete_user(
     user_id: str,
-    users_service: UserService = Depends(
-        Provide[Services.users_service],
-    ),
+    users_service: UserService = Depends(get_users_service),
 ):
     return await users_service.delete_user(
         cmd=models.DeleteUserCommand(
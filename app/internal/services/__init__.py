@@ -3,17 +3,127 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories, postgresql
+from app.internal.repository.postgresql.invalidation import (
+    UsersInvalidationListener,
+)
 from app.internal.services.users import UserService
+from app.pkg import models
+from app.pkg.cache import (
+    CountMinSketch,
+    MemoryCache,
+    NegativeCache,
+    Refresher,
+    SharedMemoryCache,
+    TinyLfuAdmission,
+    Version,
+)
+from app.pkg.settings import settings
 
 
 class Services(containers.DeclarativeContainer):
     """Containers with services."""
 
+    configuration = providers.Configuration(
+        name="settings",
+        pydantic_settings=[settings],
+    )
+
     repositories: postgresql.Repository = providers.Container(
         Repositories.postgresql,
     )
 
-    users_service = providers.Factory(
+    #: CountMinSketch: Frequencies of read user ids, single per process.
+    users_sketch = providers.Singleton(
+        CountMinSketch,
+        width=configuration.CACHE_SKETCH_WIDTH,
+        sample_size=configuration.CACHE_SKETCH_SAMPLE_SIZE,
+        top_size=configuration.CACHE_SKETCH_TOP_SIZE,
+    )
+
+    #: TinyLfuAdmission: Admission of users to the full cache.
+    users_admission = providers.Singleton(
+        TinyLfuAdmission,
+        sketch=users_sketch,
+    )
+
+    #: float: Seconds an expired user is kept in the cache.
+    users_stale_ttl = providers.Callable(
+        max,
+        configuration.CACHE_STALE_WHILE_REVALIDATE,
+        configuration.CACHE_STALE_IF_ERROR,
+    )
+
+    #: BaseCache: Cache of users by id, single per process.
+    users_cache = providers.Selector(
+        configuration.CACHE_BACKEND,
+        MEMORY=providers.Singleton(
+            MemoryCache,
+            max_size=configuration.CACHE_MAX_SIZE,
+            ttl=configuration.CACHE_TTL,
+            stale_ttl=users_stale_ttl,
+            policy=configuration.CACHE_POLICY,
+            admission=users_admission,
+        ),
+        SHARED_MEMORY=providers.Singleton(
+            SharedMemoryCache,
+            path=configuration.CACHE_SHARED_MEMORY_PATH,
+            max_size=configuration.CACHE_MAX_SIZE,
+            ttl=configuration.CACHE_TTL,
+            stale_ttl=users_stale_ttl,
+            slot_size=configuration.CACHE_SHARED_MEMORY_SLOT_SIZE,
+            admission=users_admission,
+            encode=models.UserResponse.to_cache,
+            decode=models.UserResponse.from_cache,
+        ),
+    )
+
+    #: Version: Writes to users seen by the process.
+    users_version = providers.Singleton(Version)
+
+    #: Refresher: Background refreshes of expired users, single per process.
+    users_refresher = providers.Singleton(
+        Refresher,
+        cache=users_cache,
+        stale_while_revalidate=configuration.CACHE_STALE_WHILE_REVALIDATE,
+        stale_if_error=configuration.CACHE_STALE_IF_ERROR,
+        version=users_version,
+    )
+
+    #: NegativeCache: Ids of missing users, single per process.
+    users_negative_cache = providers.Singleton(
+        NegativeCache,
+        max_size=configuration.CACHE_NEGATIVE_MAX_SIZE,
+        ttl=configuration.CACHE_NEGATIVE_TTL,
+        doorkeeper_size=configuration.CACHE_NEGATIVE_DOORKEEPER_SIZE,
+    )
+
+    #: MemoryCache: Encoded pages of users by query and version, single per
+    #: process.
+    users_responses_cache = providers.Singleton(
+        MemoryCache,
+        max_size=configuration.CACHE_RESPONSES_MAX_SIZE,
+        ttl=configuration.CACHE_RESPONSES_TTL,
+    )
+
+    #: UsersInvalidationListener: Evicts users changed by other workers.
+    users_invalidation = providers.Singleton(
+        UsersInvalidationListener,
+        users_cache=users_cache,
+        users_negative_cache=users_negative_cache,
+        users_version=users_version,
+        reconnect_delay=configuration.CACHE_INVALIDATION_RECONNECT_DELAY,
+        connect_timeout=configuration.POSTGRESQL_POOL_ACQUIRE_TIMEOUT,
+    )
+
+    #: UserService: Stateless, single per process.
+    users_service = providers.Singleton(
         UserService,
         user_repository=repositories.users,
+        user_loader=repositories.user_loader,
+        users_cache=users_cache,
+        users_negative_cache=users_negative_cache,
+        users_sketch=users_sketch,
+        users_refresher=users_refresher,
+        users_version=users_version,
+        users_responses_cache=users_responses_cache,
     )
@@ -1,53 +1,377 @@
 """Service for manage users."""
 
-from typing import List
+import asyncio
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional, Tuple
 
+from app.internal.repository.postgresql.connection import (
+    after_commit,
+    has_unreplayed_writes,
+    in_unit_of_work,
+    unit_of_work,
+)
+from app.internal.repository.postgresql.loaders import UserLoader
 from app.internal.repository.postgresql.users import UserRepository
-from app.pkg.models.exceptions.repository import EmptyResult
-from app.pkg.models.exceptions.users import UserWasNotFound
+from app.pkg.cache import (
+    BaseCache,
+    CountMinSketch,
+    NegativeCache,
+    Refresher,
+    Version,
+)
+from app.pkg.cache.stale import mark_stale
+from app.pkg.models.base.encoder import encode_json, model_encoder
+from app.pkg.models.exceptions.repository import DriverError, EmptyResult
+from app.pkg.models.exceptions.users import InvalidPageCursor, UserWasNotFound
 from app.pkg import models
 
 __all__ = ["UserService"]
 
+#: int: Users serialized into one chunk of the export stream.
+EXPORT_CHUNK_SIZE = 1000
+
+#: int: Users created by one statement of a batch.
+CREATE_CHUNK_SIZE = 1000
+
+#: str: Error of a batch item whose username is taken.
+USERNAME_IS_TAKEN = "Username is already taken."
+
+#: Tuple[str, ...]: Fields of a user which position it in a page.
+PAGE_CURSOR_FIELDS = ("id", "created_at")
+
 
 class UserService:
     """Service for manage users."""
 
     __user_repository: UserRepository
+    __user_loader: UserLoader
+    __users_cache: BaseCache[str, models.UserResponse]
+    __users_negative_cache: NegativeCache[str]
+    __users_sketch: CountMinSketch[str]
+    __users_refresher: Refresher[str, models.UserResponse]
+    __users_version: Version
+    __users_responses_cache: BaseCache[tuple, bytes]
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        user_loader: UserLoader,
+        users_cache: BaseCache[str, models.UserResponse],
+        users_negative_cache: NegativeCache[str],
+        users_sketch: CountMinSketch[str],
+        users_refresher: Refresher[str, models.UserResponse],
+        users_version: Version,
+        users_responses_cache: BaseCache[tuple, bytes],
+    ):
         self.__user_repository = user_repository
+        self.__user_loader = user_loader
+        self.__users_cache = users_cache
+        self.__users_negative_cache = users_negative_cache
+        self.__users_sketch = users_sketch
+        self.__users_refresher = users_refresher
+        self.__users_version = users_version
+        self.__users_responses_cache = users_responses_cache
 
     async def create_user(
         self,
         cmd: models.CreateUserCommand,
     ) -> models.UserResponse:
-        return await self.__user_repository.create(cmd=cmd)
+        user = await self.__user_repository.create(cmd=cmd)
+        after_commit(lambda: self.__cache_created_user(user))
+        return user
+
+    async def create_users(
+        self,
+        cmds: List[models.CreateUserCommand],
+    ) -> models.CreateUsersBatchResponse:
+        """Create users of the batch in one transaction.
+
+        A taken username does not abort the batch, it is reported in the
+        result of its user.
+        """
+
+        users: List[Optional[models.UserResponse]] = []
+        async with unit_of_work():
+            for i in range(0, len(cmds), CREATE_CHUNK_SIZE):
+                users += await self.__user_repository.create_many(
+                    cmds=cmds[i : i + CREATE_CHUNK_SIZE],
+                )
+            created = [user for user in users if user is not None]
+            after_commit(lambda: self.__forget_missing_users(created))
+            after_commit(self.__users_version.bump)
+
+        return models.CreateUsersBatchResponse(
+            results=[
+                models.CreateUserResult(
+                    user=user,
+                    error=None if user is not None else USERNAME_IS_TAKEN,
+                )
+                for user in users
+            ],
+        )
 
     async def read_user(
         self,
         query: models.ReadUserQuery,
     ) -> models.UserResponse:
+        """Read user, only ``query.fields`` of it if set.
+
+        Users are cached with all fields, so the projection is applied to
+        the cached user.
+        """
+
+        user = await self.__read_user(query=query)
+        return self.__project(user, query.fields)
+
+    async def __read_user(
+        self,
+        query: models.ReadUserQuery,
+    ) -> models.UserResponse:
+        """Read user from the cache, or coalesce concurrent reads of missed
+        users into one query.
+
+        Ids of missing users are remembered for a short time, so polling of
+        deleted users does not reach the database. An id created by another
+        worker may be answered as missing until its entry expires.
+
+        A user which has expired recently is returned at once, while one
+        background task reads it again. If the database is unreachable, an
+        expired user is returned within ``CACHE_STALE_IF_ERROR`` seconds and
+        the response is marked as stale.
+
+        Reads that must observe writes of the caller bypass the caches and
+        the loader until a replica replays the writes, as its batches run
+        outside of the caller's transaction and session.
+        """
+
+        self.__users_sketch.increment(query.id)
+        if self.__requires_consistent_read():
+            return await self.__read_user_consistently(query=query)
+
+        cached = self.__users_cache.get_stale(query.id)
+        if cached is None:
+            if self.__users_negative_cache.get(query.id):
+                raise UserWasNotFound
+        elif (user := self.__read_cached_user(query.id, *cached)) is not None:
+            return user
+
+        return await self.__load_user(query.id, cached)
+
+    async def __read_user_consistently(
+        self,
+        query: models.ReadUserQuery,
+    ) -> models.UserResponse:
+        """Read user from the database in the session of the caller."""
+
         try:
             return await self.__user_repository.read(query=query)
         except EmptyResult as e:
             raise UserWasNotFound from e
 
-    async def read_all_users(self) -> List[models.UserResponse]:
+    def __read_cached_user(
+        self,
+        id_: str,
+        user: models.UserResponse,
+        expired_for: float,
+    ) -> Optional[models.UserResponse]:
+        """Cached user if it is live, or if it has expired recently, while it
+        is refreshed in background."""
+
+        if expired_for < 0:
+            return user
+        if expired_for < self.__users_refresher.stale_while_revalidate:
+            self.__users_refresher.refresh(id_, self.__user_loader.load)
+            return user
+        return None
+
+    async def __load_user(
+        self,
+        id_: str,
+        cached: Optional[Tuple[models.UserResponse, float]],
+    ) -> models.UserResponse:
+        """Load missed user and cache it, or its absence.
+
+        Nothing is cached if users have been written or invalidated while
+        the user was loaded, as the load could have read it before.
+
+        The ``cached`` user is returned marked as stale if the database is
+        unreachable and it has expired within ``stale_if_error``.
+        """
+
+        version = self.__users_version.value
+        try:
+            user = await self.__user_loader.load(id_)
+        except (DriverError, OSError, asyncio.TimeoutError):
+            if cached is None or cached[1] >= self.__users_refresher.stale_if_error:
+                raise
+            mark_stale()
+            return cached[0]
+
+        if self.__users_version.value == version:
+            self.__cache_loaded_user(id_, user)
+        if user is None:
+            raise UserWasNotFound
+        return user
+
+    def __cache_loaded_user(
+        self,
+        id_: str,
+        user: Optional[models.UserResponse],
+    ) -> None:
+        """Cache loaded user, or that it is missing."""
+
+        if user is None:
+            self.__users_negative_cache.set(id_, True)
+        else:
+            self.__users_cache.set(user.id, user)
+
+    async def read_many_users(
+        self,
+        query: models.ReadManyUsersQuery,
+    ) -> models.ReadManyUsersResponse:
+        """Read users by ids, keeping the order of ``query.ids``.
+
+        Only ``query.fields`` of users are read if set, and their ids.
+        """
+
+        ids = list(dict.fromkeys(query.ids))
+        for id_ in ids:
+            self.__users_sketch.increment(id_)
+        try:
+            found = {
+                user.id: user
+                for user in await self.__user_repository.read_many(
+                    query=models.ReadManyUsersQuery(
+                        ids=ids,
+                        fields=self.__with_fields(query.fields, ("id",)),
+                    ),
+                )
+            }
+        except EmptyResult:
+            found = {}
+
+        return models.ReadManyUsersResponse(
+            users=[
+                self.__project(found[id_], query.fields) for id_ in ids if id_ in found
+            ],
+            not_found=[id_ for id_ in ids if id_ not in found],
+        )
+
+    def read_hot_users(self, limit: Optional[int]) -> models.HotUsersResponse:
+        """Most frequently read users of the worker by estimate of the
+        sketch."""
+
+        return models.HotUsersResponse(
+            users=[
+                models.HotUser(id=id_, reads=reads)
+                for id_, reads in self.__users_sketch.top(limit)
+            ],
+        )
+
+    async def read_users_page(
+        self,
+        query: models.ReadUsersPageQuery,
+    ) -> models.UsersPageResponse:
+        """Read page of users that follows ``query.cursor``.
+
+        One extra user is read to know if there is a next page. Only
+        ``query.fields`` of users are read if set, and the fields of the
+        cursor.
+        """
+
         try:
-            return await self.__user_repository.read_all()
+            users = await self.__user_repository.read_page(
+                query=query.copy(
+                    update={
+                        "limit": query.limit + 1,
+                        "fields": self.__with_fields(
+                            query.fields,
+                            PAGE_CURSOR_FIELDS,
+                        ),
+                    },
+                ),
+                after=self.__decode_cursor(query.cursor),
+            )
         except EmptyResult:
-            return []
+            users = []
+
+        next_cursor = None
+        if len(users) > query.limit:
+            users = users[: query.limit]
+            next_cursor = models.UsersPageCursor(
+                created_at=users[-1].created_at,
+                id=users[-1].id,
+            ).encode()
+
+        return models.UsersPageResponse(
+            users=[self.__project(user, query.fields) for user in users],
+            next_cursor=next_cursor,
+        )
+
+    async def read_users_page_json(self, query: models.ReadUsersPageQuery) -> bytes:
+        """Read page of users encoded as JSON of ``UsersPageResponse``.
+
+        Encoded pages are cached by the query and the version of users, so
+        a repeated query without writes in between is answered without
+        reading and serializing the page. Writes of other workers bump the
+        version once they are delivered by the invalidation listener, and
+        ``CACHE_RESPONSES_TTL`` bounds staleness until then.
+        """
+
+        if self.__requires_consistent_read():
+            page = await self.read_users_page(query=query)
+            return encode_json(page)
+
+        key = self.__page_key(query)
+        if (content := self.__users_responses_cache.get(key)) is not None:
+            return content
+
+        page = await self.read_users_page(query=query)
+        content = encode_json(page)
+        self.__users_responses_cache.set(key, content)
+        return content
+
+    async def export_users(
+        self,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream all active users as newline-delimited JSON.
+
+        Rows are serialized as they are read from the cursor, so memory
+        does not grow with the number of users. Fields and their format are
+        the same as of ``UserResponse``, only ``fields`` of them if set.
+        """
+
+        encode = model_encoder(models.UserResponse)
+        lines: List[str] = []
+        rows = self.__user_repository.export(
+            chunk_size=EXPORT_CHUNK_SIZE,
+            fields=fields,
+        )
+        async with aclosing(rows):
+            async for row in rows:
+                lines.append(encode(models.UserResponse.construct(**row)))
+                if len(lines) == EXPORT_CHUNK_SIZE:
+                    yield ("\n".join(lines) + "\n").encode()
+                    lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode()
 
     async def update_user(
         self,
         cmd: models.UpdateUserCommand,
     ) -> models.UserResponse:
         try:
-            return await self.__user_repository.update(cmd=cmd)
+            user = await self.__user_repository.update(cmd=cmd)
         except EmptyResult as e:
+            after_commit(lambda: self.__users_cache.delete(cmd.id))
+            after_commit(self.__users_version.bump)
             raise UserWasNotFound from e
 
+        after_commit(lambda: self.__users_cache.set(user.id, user))
+        after_commit(self.__users_version.bump)
+        return user
+
     async def delete_user(
         self,
         cmd: models.DeleteUserCommand,
@@ -56,3 +380,73 @@ class UserService:
             return await self.__user_repository.delete(cmd=cmd)
         except EmptyResult as e:
             raise UserWasNotFound from e
+        finally:
+            after_commit(lambda: self.__users_cache.delete(cmd.id))
+            after_commit(self.__users_version.bump)
+
+    def __page_key(self, query: models.ReadUsersPageQuery) -> tuple:
+        """Key of the encoded page in the responses cache.
+
+        The version is read before the page, so a write which races with
+        the read leaves the page under the outdated version.
+        """
+
+        return (
+            self.__users_version.value,
+            query.cursor,
+            query.limit,
+            query.created_after,
+            query.created_before,
+            query.username_prefix,
+            query.fields,
+        )
+
+    def __cache_created_user(self, user: models.UserResponse) -> None:
+        self.__users_cache.set(user.id, user)
+        self.__users_negative_cache.delete(user.id)
+        self.__users_version.bump()
+
+    def __forget_missing_users(self, users: List[models.UserResponse]) -> None:
+        for user in users:
+            self.__users_negative_cache.delete(user.id)
+
+    @staticmethod
+    def __decode_cursor(cursor: Optional[str]) -> Optional[models.UsersPageCursor]:
+        """Position of the page, ``None`` for the first page."""
+
+        if cursor is None:
+            return None
+        try:
+            return models.UsersPageCursor.decode(cursor)
+        except ValueError as e:
+            raise InvalidPageCursor from e
+
+    @staticmethod
+    def __with_fields(
+        fields: Optional[Tuple[str, ...]],
+        required: Tuple[str, ...],
+    ) -> Optional[Tuple[str, ...]]:
+        """Projection of ``fields`` which also has fields the service needs."""
+
+        if fields is None:
+            return None
+        return models.UserProjectionQuery(fields=(*fields, *required)).fields
+
+    @staticmethod
+    def __project(
+        user: models.UserResponse,
+        fields: Optional[Tuple[str, ...]],
+    ) -> models.UserResponse:
+        """Copy of ``user`` with only ``fields``, the same user if not set."""
+
+        if fields is None:
+            return user
+        return user.copy(include=set(fields))
+
+    @staticmethod
+    def __requires_consistent_read() -> bool:
+        """Check if the caller has uncommitted writes, or writes which no
+        replica has replayed yet, so the caches of the worker may not have
+        observed them either."""
+
+        return in_unit_of_work() or has_unreplayed_writes()
@@ -0,0 +1,22 @@
+"""Caches of the worker process and of the node."""
+
+from app.pkg.cache.admission import Doorkeeper, TinyLfuAdmission
+from app.pkg.cache.base import BaseCache
+from app.pkg.cache.memory import MemoryCache
+from app.pkg.cache.negative import NegativeCache
+from app.pkg.cache.refresh import Refresher
+from app.pkg.cache.shared import SharedMemoryCache
+from app.pkg.cache.sketch import CountMinSketch
+from app.pkg.cache.version import Version
+
+__all__ = [
+    "BaseCache",
+    "CountMinSketch",
+    "Doorkeeper",
+    "MemoryCache",
+    "NegativeCache",
+    "Refresher",
+    "SharedMemoryCache",
+    "TinyLfuAdmission",
+    "Version",
+]
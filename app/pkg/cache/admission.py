@@ -0,0 +1,98 @@
+"""Admission policies which decide what is worth caching."""
+
+from typing import Hashable
+
+from app.pkg.cache.sketch import CountMinSketch
+
+__all__ = ["Doorkeeper", "TinyLfuAdmission"]
+
+#: int: Minimum bits of ``Doorkeeper``, which records 8 keys before reset.
+MIN_DOORKEEPER_SIZE = 64
+
+
+class Doorkeeper:
+    """Admit keys seen at least twice recently.
+
+    Keys are recorded in a bloom filter of ``size`` bits with two hashes. A
+    key is admitted when it is already in the filter, so keys seen once,
+    e.g. by a scanner, never reach the cache. The filter is reset after
+    ``size // 8`` records, which keeps false positives at about 5%.
+
+    Examples:
+        ::
+
+            >>> doorkeeper = Doorkeeper(size=1024)
+            >>> doorkeeper.admit("a")
+            False
+            >>> doorkeeper.admit("a")
+            True
+    """
+
+    #: int: Bits of the filter.
+    size: int
+
+    def __init__(self, size: int):
+        if size < MIN_DOORKEEPER_SIZE:
+            # A smaller filter is reset before the second record of a key,
+            # so no key is ever admitted.
+            raise ValueError(
+                f"Doorkeeper size must be at least {MIN_DOORKEEPER_SIZE} bits",
+            )
+
+        self.size = size
+        self.__bits = bytearray((size + 7) // 8)
+        self.__records = 0
+
+    def admit(self, key: Hashable) -> bool:
+        """Record ``key`` and check if it was recorded before the current
+        call."""
+
+        h = hash(key)
+        seen = True
+        for bit in (h % self.size, (h >> 32) % self.size):
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self.__bits[byte] & mask:
+                seen = False
+                self.__bits[byte] |= mask
+
+        if not seen:
+            self.__records += 1
+            if self.__records >= self.size // 8:
+                self.clear()
+        return seen
+
+    def clear(self) -> None:
+        """Forget all recorded keys."""
+
+        self.__bits = bytearray(len(self.__bits))
+        self.__records = 0
+
+
+class TinyLfuAdmission:
+    """Admit a new key in place of an evicted one only if it is more
+    frequent.
+
+    Frequencies are estimated by ``sketch``, which is fed by reads of the
+    keys, so a scan of keys read once does not flush keys which are read
+    often.
+
+    Examples:
+        ::
+
+            >>> sketch = CountMinSketch(width=1024, sample_size=10000)
+            >>> admission = TinyLfuAdmission(sketch=sketch)
+            >>> sketch.increment("hot")
+            >>> admission.admit("cold", victim="hot")
+            False
+    """
+
+    #: CountMinSketch: Frequencies of keys.
+    sketch: CountMinSketch
+
+    def __init__(self, sketch: CountMinSketch):
+        self.sketch = sketch
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        """Check if ``candidate`` should replace ``victim`` in the cache."""
+
+        return self.sketch.estimate(candidate) > self.sketch.estimate(victim)
@@ -0,0 +1,77 @@
+"""Abstract cache."""
+
+from abc import ABC, abstractmethod
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+__all__ = ["BaseCache"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BaseCache(ABC, Generic[K, V]):
+    """Bounded cache of values with time to live.
+
+    Attributes:
+        hits: Lookups that found a live entry.
+        misses: Lookups that found no entry or an expired one.
+        evictions: Entries removed to free space for new ones.
+        rejections: Entries not stored by the admission policy.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    rejections: int
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """Number of entries in the cache, including expired ones."""
+
+        raise NotImplementedError()
+
+    def get(self, key: K) -> Optional[V]:
+        """Get live value of ``key``, ``None`` if it is absent or expired."""
+
+        found = self.get_stale(key)
+        if found is None or found[1] >= 0:
+            return None
+        return found[0]
+
+    @abstractmethod
+    def get_stale(self, key: K) -> Optional[Tuple[V, float]]:
+        """Get value of ``key`` even if it has expired within ``stale_ttl``.
+
+        A live value counts as a hit and an expired one as a miss.
+
+        Returns:
+            Value with seconds since it has expired, negative while it is
+            live, or ``None`` if it is absent or has expired earlier.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` of ``key``, evicting other entries if full."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, key: K) -> None:
+        """Remove entry of ``key`` if it is present."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+        raise NotImplementedError()
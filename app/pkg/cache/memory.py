@@ -0,0 +1,161 @@
+"""Cache in memory of the worker process."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.pkg.cache.admission import TinyLfuAdmission
+from app.pkg.cache.base import BaseCache
+from app.pkg.models.core.cache import CachePolicy
+
+__all__ = ["MemoryCache"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    #: V: Cached value.
+    value: V
+    #: float: Clock time after which the value is expired.
+    expires_at: float
+    #: int: Number of hits, used by LFU policy.
+    frequency: int = 1
+
+
+class MemoryCache(BaseCache[K, V]):
+    """Cache with LRU or LFU eviction in memory of the worker process.
+
+    Both policies take O(1) per operation. LFU keeps entries in buckets of
+    equal frequency, each ordered by recency, and evicts the least recent
+    entry of the lowest frequency. Expired entries are served by
+    ``get_stale`` for ``stale_ttl`` more seconds, and are removed when they
+    are looked up after that or evicted.
+
+    With ``admission`` a new key is stored in a full cache only if the
+    policy prefers it to the entry which would be evicted for it.
+
+    Examples:
+        ::
+
+            >>> cache = MemoryCache(max_size=2, ttl=60, policy=CachePolicy.LRU)
+            >>> cache.set("a", 1)
+            >>> cache.get("a")
+            1
+    """
+
+    #: int: Maximum number of entries, ``0`` disables the cache.
+    max_size: int
+    #: float: Seconds an entry is live after it is stored.
+    ttl: float
+    #: float: Seconds an expired entry is kept for ``get_stale``.
+    stale_ttl: float
+    #: CachePolicy: Eviction policy.
+    policy: CachePolicy
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        policy: CachePolicy = CachePolicy.LRU,
+        admission: Optional[TinyLfuAdmission] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.policy = CachePolicy(policy)
+        self.__admission = admission
+        self.__clock = clock
+        self.__entries: Dict[K, _Entry[V]] = {}
+        #: Keys of each frequency from least to most recent. LRU uses one
+        #: bucket, as frequencies are not counted.
+        self.__buckets: Dict[int, OrderedDict[K, None]] = {}
+        self.__min_frequency = 1
+
+    @property
+    def size(self) -> int:
+        return len(self.__entries)
+
+    def get_stale(self, key: K) -> Optional[Tuple[V, float]]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expired_for = self.__clock() - entry.expires_at
+        if expired_for >= self.stale_ttl:
+            self.delete(key)
+            self.misses += 1
+            return None
+        if expired_for >= 0:
+            self.misses += 1
+            return entry.value, expired_for
+
+        self.hits += 1
+        self.__touch(key, entry)
+        return entry.value, expired_for
+
+    def set(self, key: K, value: V) -> None:
+        if self.max_size == 0:
+            return
+
+        expires_at = self.__clock() + self.ttl
+        if (entry := self.__entries.get(key)) is not None:
+            entry.value, entry.expires_at = value, expires_at
+            self.__touch(key, entry)
+            return
+
+        if len(self.__entries) >= self.max_size:
+            victim = self.__victim()
+            if self.__admission is not None and not self.__admission.admit(key, victim):
+                self.rejections += 1
+                return
+            self.delete(victim)
+            self.evictions += 1
+
+        self.__entries[key] = _Entry(value=value, expires_at=expires_at)
+        self.__buckets.setdefault(1, OrderedDict())[key] = None
+        self.__min_frequency = 1
+
+    def delete(self, key: K) -> None:
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__unlink(key, entry.frequency)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__buckets.clear()
+        self.__min_frequency = 1
+
+    def __touch(self, key: K, entry: _Entry[V]) -> None:
+        """Mark ``key`` as the most recently used."""
+
+        if self.policy == CachePolicy.LRU:
+            self.__buckets[entry.frequency].move_to_end(key)
+            return
+
+        frequency = entry.frequency
+        self.__unlink(key, frequency)
+        entry.frequency += 1
+        self.__buckets.setdefault(entry.frequency, OrderedDict())[key] = None
+        if frequency == self.__min_frequency and frequency not in self.__buckets:
+            self.__min_frequency = entry.frequency
+
+    def __unlink(self, key: K, frequency: int) -> None:
+        bucket = self.__buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.__buckets[frequency]
+
+    def __victim(self) -> K:
+        """Find the least recently or the least frequently used entry."""
+
+        if self.__min_frequency not in self.__buckets:
+            self.__min_frequency = min(self.__buckets)
+
+        return next(iter(self.__buckets[self.__min_frequency]))
@@ -0,0 +1,51 @@
+"""Cache of keys known to be missing."""
+
+import time
+from typing import Callable, Hashable, TypeVar
+
+from app.pkg.cache.admission import Doorkeeper
+from app.pkg.cache.memory import MemoryCache
+
+__all__ = ["NegativeCache"]
+
+K = TypeVar("K", bound=Hashable)
+
+
+class NegativeCache(MemoryCache[K, bool]):
+    """LRU cache of keys whose lookups found nothing.
+
+    A missing key is admitted only on its second miss by ``Doorkeeper``, so
+    a scan of random keys does not evict keys which are polled again and
+    again.
+
+    Examples:
+        ::
+
+            >>> cache = NegativeCache(max_size=100, ttl=5, doorkeeper_size=1024)
+            >>> cache.set("a", True)
+            >>> cache.get("a") is None
+            True
+            >>> cache.set("a", True)
+            >>> cache.get("a")
+            True
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        doorkeeper_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(max_size=max_size, ttl=ttl, clock=clock)
+        self.__doorkeeper = Doorkeeper(size=doorkeeper_size)
+
+    def set(self, key: K, value: bool) -> None:
+        if self.max_size == 0:
+            return
+
+        if not self.__doorkeeper.admit(key):
+            self.rejections += 1
+            return
+
+        super().set(key, value)
@@ -0,0 +1,107 @@
+"""Refresh of expired cache entries in background."""
+
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from app.pkg.cache.base import BaseCache
+from app.pkg.cache.version import Version
+from app.pkg.logger import get_logger
+
+__all__ = ["Refresher"]
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+logger = get_logger(__name__)
+
+
+class Refresher(Generic[K, V]):
+    """Reload expired entries of ``cache`` in background tasks.
+
+    At most one task refreshes a key at a time, so concurrent reads of an
+    expired key do not stampede the database. Refreshes run in a fresh
+    context, so they do not inherit context variables of the request that
+    started them.
+
+    A value is not stored if ``version`` has been bumped while it was
+    loaded, as a write could change the entry after the value was read.
+
+    Examples:
+        ::
+
+            refresher = Refresher(
+                cache=cache,
+                stale_while_revalidate=10,
+                stale_if_error=300,
+                version=users_version,
+            )
+            refresher.refresh("a", load=loader.load)
+    """
+
+    #: float: Seconds after expiration an entry is served while it is
+    #: refreshed.
+    stale_while_revalidate: float
+    #: float: Seconds after expiration an entry is served if it cannot be
+    #: reloaded.
+    stale_if_error: float
+    #: int: Refreshes started.
+    refreshes: int
+    #: int: Refreshes which failed to load the value.
+    failures: int
+    #: int: Refreshes whose value was dropped after a concurrent write.
+    conflicts: int
+
+    def __init__(
+        self,
+        cache: BaseCache[K, V],
+        stale_while_revalidate: float,
+        stale_if_error: float,
+        version: Optional[Version] = None,
+    ):
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.refreshes = 0
+        self.failures = 0
+        self.conflicts = 0
+        self.__cache = cache
+        self.__version = version or Version()
+        self.__tasks: Dict[K, asyncio.Task] = {}
+
+    def refresh(self, key: K, load: Callable[[K], Awaitable[Optional[V]]]) -> None:
+        """Reload ``key`` with ``load`` unless it is already being reloaded.
+
+        A loaded value replaces the entry, and the entry is removed if
+        ``load`` finds nothing, unless ``version`` is bumped meanwhile.
+        """
+
+        if key in self.__tasks:
+            return
+
+        self.refreshes += 1
+        task = asyncio.get_running_loop().create_task(
+            self.__refresh(key, load, self.__version.value),
+            context=contextvars.Context(),
+        )
+        self.__tasks[key] = task
+        task.add_done_callback(lambda _: self.__tasks.pop(key, None))
+
+    async def __refresh(
+        self,
+        key: K,
+        load: Callable[[K], Awaitable[Optional[V]]],
+        version: int,
+    ) -> None:
+        try:
+            value = await load(key)
+        except Exception as e:  # pylint: disable=broad-except
+            self.failures += 1
+            logger.warning("Refresh of %r failed: %s", key, e)
+            return
+
+        if self.__version.value != version:
+            self.conflicts += 1
+        elif value is None:
+            self.__cache.delete(key)
+        else:
+            self.__cache.set(key, value)
@@ -0,0 +1,428 @@
+"""Cache in memory shared by all worker processes of the node."""
+
+import fcntl
+import hashlib
+import json
+import math
+import mmap
+import os
+import pathlib
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple, TypeVar
+
+from app.pkg.cache.admission import TinyLfuAdmission
+from app.pkg.cache.base import BaseCache
+
+__all__ = ["SharedMemoryCache"]
+
+V = TypeVar("V")
+
+#: struct.Struct: Segment header, magic and geometry of the slots.
+_HEADER = struct.Struct("<8sII")
+#: struct.Struct: Number of taken slots, follows the segment header.
+_COUNT = struct.Struct("<Q")
+#: int: Bytes reserved for the segment header.
+_HEADER_SIZE = 64
+#: bytes: Marks a segment initialized by ``SharedMemoryCache``.
+_MAGIC = b"USRCACHE"
+
+#: struct.Struct: Slot header, sequence, key hash, expiration time, key
+#: and value lengths.
+_SLOT = struct.Struct("<QQdHI")
+#: struct.Struct: Sequence of the slot, odd while the slot is written.
+_SEQUENCE = struct.Struct("<Q")
+#: int: Bytes reserved for the slot header.
+_SLOT_HEADER_SIZE = 32
+#: int: Maximum length of an encoded key.
+_KEY_SIZE = 64
+#: int: Offset of the value in the slot.
+_VALUE_OFFSET = _SLOT_HEADER_SIZE + _KEY_SIZE
+
+#: int: Minimum size of a slot.
+MIN_SLOT_SIZE = _VALUE_OFFSET + 32
+#: int: Slots probed for a key, starting from its hash.
+PROBES = 8
+#: int: Attempts to read a slot while it is being written.
+READ_ATTEMPTS = 4
+
+
+def _hash(key: bytes) -> int:
+    """Hash of ``key`` equal in every process, unlike ``hash``."""
+
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _encode_json(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class SharedMemoryCache(BaseCache[str, V]):
+    """Cache in a memory-mapped file shared by worker processes of the node.
+
+    The segment holds ``max_size`` slots of ``slot_size`` bytes. A key is
+    stored in one of ``PROBES`` slots that follow its hash, and the live
+    entry with the earliest expiration is evicted when all of them are
+    taken. With ``admission`` the new key replaces that entry only if the
+    policy prefers it. Values are stored encoded as JSON, so every process
+    decodes its own copy and the segment holds no executable data.
+
+    Reads take no lock: each slot has a sequence which writers make odd
+    before they change the slot and even after, and a reader retries when
+    the sequence has changed under it. Writers of all processes are
+    serialized by ``fcntl`` lock of the file.
+
+    Statistics are counted by each process separately.
+
+    Examples:
+        ::
+
+            >>> cache = SharedMemoryCache(
+            ...     path="/dev/shm/users-cache",
+            ...     max_size=10000,
+            ...     ttl=60,
+            ... )
+            >>> cache.set("a", 1)
+            >>> cache.get("a")
+            1
+
+    Notes:
+        Keys are ``str`` of at most 64 bytes in UTF-8. Values which are
+        longer than the slot when encoded are not cached. Expiration uses
+        wall clock time, as it is the same in every process. The geometry
+        of the slots is a part of the name of the segment file, so workers
+        with other settings map a segment of their own instead of resizing
+        one which is mapped.
+    """
+
+    #: pathlib.Path: Prefix of the file of the shared segment.
+    path: pathlib.Path
+    #: pathlib.Path: File of the shared segment of this geometry.
+    segment_path: pathlib.Path
+    #: int: Number of slots, ``0`` disables the cache.
+    max_size: int
+    #: int: Size of a slot in bytes, including key and header.
+    slot_size: int
+    #: float: Seconds an entry is live after it is stored.
+    ttl: float
+    #: float: Seconds an expired entry is kept for ``get_stale``.
+    stale_ttl: float
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        max_size: int,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        slot_size: int = 512,
+        admission: Optional[TinyLfuAdmission] = None,
+        encode: Callable[[V], bytes] = _encode_json,
+        decode: Callable[[bytes], V] = json.loads,
+        clock: Callable[[], float] = time.time,
+    ):
+        if slot_size < MIN_SLOT_SIZE:
+            raise ValueError(f"Slot size must be at least {MIN_SLOT_SIZE} bytes")
+
+        super().__init__()
+        self.path = pathlib.Path(path)
+        self.segment_path = self.path.with_name(
+            f"{self.path.name}-{max_size}x{slot_size}",
+        )
+        self.max_size = max_size
+        self.slot_size = slot_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.__admission = admission
+        self.__encode = encode
+        self.__decode = decode
+        self.__clock = clock
+        self.__thread_lock = threading.Lock()
+        self.__fd: Optional[int] = None
+        self.__mm: Optional[mmap.mmap] = None
+        if max_size:
+            self.__open()
+
+    @property
+    def size(self) -> int:
+        if self.__mm is None:
+            return 0
+
+        return int(_COUNT.unpack_from(self.__mm, _HEADER.size)[0])
+
+    def get_stale(self, key: str) -> Optional[Tuple[V, float]]:
+        if self.__mm is None:
+            self.misses += 1
+            return None
+
+        key_bytes = key.encode()
+        key_hash = _hash(key_bytes)
+        for index in self.__probe(key_hash):
+            if (found := self.__read(index, key_hash, key_bytes)) is None:
+                continue
+
+            expires_at, value = found
+            expired_for = self.__clock() - expires_at
+            if expired_for >= self.stale_ttl:
+                break
+            if expired_for >= 0:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return self.__decode(value), expired_for
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: V) -> None:
+        if self.__mm is None:
+            return
+
+        key_bytes = key.encode()
+        value_bytes = self.__encode(value)
+        if (
+            len(key_bytes) > _KEY_SIZE
+            or len(value_bytes) > self.slot_size - _VALUE_OFFSET
+        ):
+            return
+
+        key_hash = _hash(key_bytes)
+        now = self.__clock()
+        with self.__lock():
+            index, evicted = self.__find_slot(key_hash, key_bytes, now)
+            if evicted and not self.__admits(key, index):
+                self.rejections += 1
+                return
+            self.__write(index, key_hash, now + self.ttl, key_bytes, value_bytes)
+        self.evictions += evicted
+
+    def delete(self, key: str) -> None:
+        if self.__mm is None:
+            return
+
+        key_bytes = key.encode()
+        key_hash = _hash(key_bytes)
+        with self.__lock():
+            for index in self.__probe(key_hash):
+                if self.__has_key(index, key_hash, key_bytes):
+                    self.__write(index, 0, 0.0, b"", b"")
+
+    def clear(self) -> None:
+        if self.__mm is None:
+            return
+
+        with self.__lock():
+            for index in range(self.max_size):
+                if self.__read_header(index)[3]:
+                    self.__write(index, 0, 0.0, b"", b"")
+
+    def close(self) -> None:
+        """Unmap the segment of the current process."""
+
+        if self.__mm is not None:
+            self.__mm.close()
+            self.__mm = None
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    @property
+    def __buffer(self) -> mmap.mmap:
+        """Map of the segment, which is open unless the cache is disabled or
+        closed."""
+
+        if self.__mm is None:
+            raise ValueError(f"{self.segment_path} is not mapped")
+        return self.__mm
+
+    @property
+    def __file(self) -> int:
+        """Descriptor of the segment file, open while the segment is."""
+
+        if self.__fd is None:
+            raise ValueError(f"{self.segment_path} is not open")
+        return self.__fd
+
+    def __open(self) -> None:
+        """Map the segment, creating it if it is absent.
+
+        Raises:
+            ValueError: The file exists but is not a segment of this
+                geometry. It is never resized, as other processes may have
+                it mapped.
+        """
+
+        self.__fd = fd = os.open(
+            self.segment_path,
+            os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW,
+            0o600,
+        )
+        size = _HEADER_SIZE + self.max_size * self.slot_size
+        header = _HEADER.pack(_MAGIC, self.max_size, self.slot_size)
+        with self.__lock():
+            file_size = os.fstat(fd).st_size
+            if not file_size:
+                # Extension zeroes the slots, so every slot is empty.
+                os.ftruncate(fd, size)
+                os.pwrite(fd, header, 0)
+            is_segment = (
+                file_size in (0, size) and os.pread(fd, _HEADER.size, 0) == header
+            )
+
+        if not is_segment:
+            os.close(fd)
+            self.__fd = None
+            raise ValueError(
+                f"{self.segment_path} is not a cache segment of "
+                f"{self.max_size} slots of {self.slot_size} bytes",
+            )
+        self.__mm = mmap.mmap(fd, size)
+
+    @contextmanager
+    def __lock(self) -> Iterator[None]:
+        """Serialize writers of all threads and processes."""
+
+        fd = self.__file
+        with self.__thread_lock:
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN)
+
+    def __probe(self, key_hash: int) -> range:
+        """Indexes of slots which can hold the key, may wrap past the end."""
+
+        start = key_hash % self.max_size
+        return range(start, start + min(PROBES, self.max_size))
+
+    def __offset(self, index: int) -> int:
+        return _HEADER_SIZE + (index % self.max_size) * self.slot_size
+
+    def __read_header(self, index: int) -> Tuple[int, int, float, int, int]:
+        return _SLOT.unpack_from(self.__buffer, self.__offset(index))
+
+    def __read(
+        self,
+        index: int,
+        key_hash: int,
+        key_bytes: bytes,
+    ) -> Optional[Tuple[float, bytes]]:
+        """Read expiration time and value of the slot if it holds the key.
+
+        A slot which is being written for all attempts is treated as one
+        without the key.
+        """
+
+        mm, offset = self.__buffer, self.__offset(index)
+        for _ in range(READ_ATTEMPTS):
+            sequence, slot_hash, expires_at, key_len, value_len = _SLOT.unpack_from(
+                mm,
+                offset,
+            )
+            if sequence & 1:
+                continue
+            if slot_hash != key_hash or key_len != len(key_bytes):
+                return None
+
+            key_start = offset + _SLOT_HEADER_SIZE
+            value_start = offset + _VALUE_OFFSET
+            key = mm[key_start : key_start + key_len]
+            value = mm[value_start : value_start + value_len]
+            if _SEQUENCE.unpack_from(mm, offset)[0] != sequence:
+                continue
+            if key != key_bytes or value_len > self.slot_size - _VALUE_OFFSET:
+                return None
+            return expires_at, value
+
+        return None
+
+    def __has_key(self, index: int, key_hash: int, key_bytes: bytes) -> bool:
+        """Check if the slot holds the key, only under the writer lock."""
+
+        _, slot_hash, _, key_len, _ = self.__read_header(index)
+        if slot_hash != key_hash or key_len != len(key_bytes):
+            return False
+
+        key_start = self.__offset(index) + _SLOT_HEADER_SIZE
+        return self.__buffer[key_start : key_start + key_len] == key_bytes
+
+    def __find_slot(
+        self,
+        key_hash: int,
+        key_bytes: bytes,
+        now: float,
+    ) -> Tuple[int, bool]:
+        """Find slot for the key, only under the writer lock.
+
+        Returns:
+            Index of the slot of the key, or of a free slot or one expired
+            beyond ``stale_ttl``, or of the slot to evict, and whether an
+            entry is evicted.
+        """
+
+        free: Optional[int] = None
+        victim, victim_expires_at = 0, math.inf
+        for index in self.__probe(key_hash):
+            if self.__has_key(index, key_hash, key_bytes):
+                return index, False
+
+            _, _, expires_at, key_len, _ = self.__read_header(index)
+            if not key_len or expires_at + self.stale_ttl <= now:
+                free = index if free is None else free
+            elif expires_at < victim_expires_at:
+                victim, victim_expires_at = index, expires_at
+
+        if free is not None:
+            return free, False
+        return victim, True
+
+    def __admits(self, key: str, index: int) -> bool:
+        """Check if ``key`` should replace the entry of the slot."""
+
+        if self.__admission is None:
+            return True
+
+        key_len = self.__read_header(index)[3]
+        key_start = self.__offset(index) + _SLOT_HEADER_SIZE
+        victim = self.__buffer[key_start : key_start + key_len].decode()
+        return self.__admission.admit(key, victim)
+
+    def __write(
+        self,
+        index: int,
+        key_hash: int,
+        expires_at: float,
+        key_bytes: bytes,
+        value_bytes: bytes,
+    ) -> None:
+        """Write the slot, only under the writer lock."""
+
+        mm, offset = self.__buffer, self.__offset(index)
+        sequence, _, _, key_len, _ = _SLOT.unpack_from(mm, offset)
+        _SEQUENCE.pack_into(mm, offset, sequence + 1)
+
+        key_start = offset + _SLOT_HEADER_SIZE
+        value_start = offset + _VALUE_OFFSET
+        mm[key_start : key_start + len(key_bytes)] = key_bytes
+        mm[value_start : value_start + len(value_bytes)] = value_bytes
+        _SLOT.pack_into(
+            mm,
+            offset,
+            sequence + 1,
+            key_hash,
+            expires_at,
+            len(key_bytes),
+            len(value_bytes),
+        )
+
+        _SEQUENCE.pack_into(mm, offset, sequence + 2)
+
+        if bool(key_len) != bool(key_bytes):
+            count = _COUNT.unpack_from(mm, _HEADER.size)[0]
+            _COUNT.pack_into(
+                mm,
+                _HEADER.size,
+                count + (1 if key_bytes else -1),
+            )
@@ -0,0 +1,140 @@
+"""Frequency sketch of cache keys."""
+
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+__all__ = ["CountMinSketch"]
+
+K = TypeVar("K", bound=Hashable)
+
+#: int: Maximum value of a counter.
+MAX_COUNT = 255
+
+#: bytes: Table of ``bytes.translate`` which halves every counter.
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+class CountMinSketch(Generic[K]):
+    """Approximate frequencies of keys with the most frequent ones.
+
+    Each of ``depth`` rows has ``width`` byte counters, and a key
+    increments one counter of each row. Its frequency is estimated as the
+    minimum of them, so it is overestimated only by collisions in every
+    row. Counters are halved after ``sample_size`` increments, so
+    frequencies of keys that stopped being read decay.
+
+    ``top_size`` keys with the highest estimates are kept as candidates of
+    ``top``.
+
+    Examples:
+        ::
+
+            >>> sketch = CountMinSketch(width=1024, sample_size=10000)
+            >>> for key in ("a", "a", "b"):
+            ...     sketch.increment(key)
+            >>> sketch.estimate("a")
+            2
+            >>> sketch.top(1)
+            [('a', 2)]
+    """
+
+    #: int: Counters of a row.
+    width: int
+    #: int: Number of rows.
+    depth: int
+    #: int: Increments between halvings of the counters.
+    sample_size: int
+    #: int: Number of keys kept as the most frequent ones.
+    top_size: int
+    #: int: Increments since the last halving.
+    samples: int
+
+    def __init__(
+        self,
+        width: int,
+        sample_size: int,
+        depth: int = 4,
+        top_size: int = 100,
+    ):
+        self.width = width
+        self.depth = depth
+        self.sample_size = sample_size
+        self.top_size = top_size
+        self.samples = 0
+        self.__rows = [bytearray(width) for _ in range(depth)]
+        self.__top: Dict[K, int] = {}
+        #: Key with the lowest estimate of ``__top``, ``None`` if it has to
+        #: be searched again.
+        self.__top_min: Optional[K] = None
+
+    def increment(self, key: K) -> None:
+        """Count one occurrence of ``key``."""
+
+        estimate = MAX_COUNT
+        for row, index in zip(self.__rows, self.__indexes(key)):
+            count = row[index]
+            if count < MAX_COUNT:
+                count += 1
+                row[index] = count
+            estimate = min(estimate, count)
+
+        self.__update_top(key, estimate)
+
+        self.samples += 1
+        if self.samples >= self.sample_size:
+            self.__age()
+
+    def estimate(self, key: K) -> int:
+        """Estimate frequency of ``key``."""
+
+        return min(row[index] for row, index in zip(self.__rows, self.__indexes(key)))
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[K, int]]:
+        """Most frequent keys with their estimates, most frequent first."""
+
+        top = sorted(self.__top.items(), key=lambda item: item[1], reverse=True)
+        return top[:limit]
+
+    def clear(self) -> None:
+        """Forget all counts."""
+
+        self.__rows = [bytearray(self.width) for _ in range(self.depth)]
+        self.__top.clear()
+        self.__top_min = None
+        self.samples = 0
+
+    def __indexes(self, key: K) -> List[int]:
+        """Counter of each row, derived from two halves of one hash."""
+
+        h = hash(key)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def __update_top(self, key: K, estimate: int) -> None:
+        if key in self.__top:
+            self.__top[key] = estimate
+            if key == self.__top_min:
+                self.__top_min = None
+            return
+
+        if len(self.__top) < self.top_size:
+            self.__top[key] = estimate
+            self.__top_min = None
+            return
+
+        if self.__top_min is None:
+            self.__top_min = min(self.__top, key=self.__top.__getitem__)
+        if estimate > self.__top[self.__top_min]:
+            del self.__top[self.__top_min]
+            self.__top[key] = estimate
+            self.__top_min = None
+
+    def __age(self) -> None:
+        """Halve all counters and estimates of the most frequent keys."""
+
+        for row in self.__rows:
+            row[:] = row.translate(_HALVE)
+        self.__top = {
+            key: estimate for key in self.__top if (estimate := self.estimate(key)) > 0
+        }
+        self.__top_min = None
+        self.samples = 0
@@ -0,0 +1,48 @@
+"""Mark of a response built from stale cache entries."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+__all__ = ["Staleness", "mark_stale", "staleness"]
+
+
+class Staleness:
+    """Whether the response of the current request is stale."""
+
+    #: bool: An expired value is served, as a fresh one could not be read.
+    stale: bool
+
+    def __init__(self):
+        self.stale = False
+
+
+_staleness: ContextVar[Optional[Staleness]] = ContextVar("staleness", default=None)
+
+
+def mark_stale() -> None:
+    """Mark the response of the current request as stale, if it is tracked."""
+
+    if (current := _staleness.get()) is not None:
+        current.stale = True
+
+
+@contextmanager
+def staleness() -> Iterator[Staleness]:
+    """Track staleness of the response for the current context.
+
+    Examples:
+        ::
+
+            >>> with staleness() as current:
+            ...     mark_stale()
+            ...     current.stale
+            True
+    """
+
+    current = Staleness()
+    reset_token = _staleness.set(current)
+    try:
+        yield current
+    finally:
+        _staleness.reset(reset_token)
@@ -0,0 +1,31 @@
+"""Version of cached data."""
+
+__all__ = ["Version"]
+
+
+class Version:
+    """Counter of writes to a table seen by the worker process.
+
+    Cached results of queries to the table are keyed by the version, so
+    they are not served after the next write.
+
+    Examples:
+        ::
+
+            >>> version = Version()
+            >>> key = (version.value, "page")
+            >>> version.bump()
+            >>> key == (version.value, "page")
+            False
+    """
+
+    #: int: Number of writes seen.
+    value: int
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def bump(self) -> None:
+        """Mark that the table has changed."""
+
+        self.value += 1
@@ -16,12 +16,21 @@ class Connectors(containers.DeclarativeContainer):
         pydantic_settings=[settings],
     )
 
-    #: Postgresql: Connector to postgresql.
-    postgresql = providers.Factory(
+    #: Postgresql: Connector to postgresql, single pool per process.
+    postgresql = providers.Singleton(
         Postgresql,
         username=configuration.POSTGRESQL_USER,
         password=configuration.POSTGRESQL_PASSWORD,
         host=configuration.POSTGRESQL_HOST,
         port=configuration.POSTGRESQL_PORT,
         database_name=configuration.POSTGRESQL_DATABASE_NAME,
+        min_size=configuration.POSTGRESQL_POOL_MIN_SIZE,
+        max_size=configuration.POSTGRESQL_POOL_MAX_SIZE,
+        acquire_timeout=configuration.POSTGRESQL_POOL_ACQUIRE_TIMEOUT,
+        max_lifetime=configuration.POSTGRESQL_POOL_MAX_LIFETIME,
+        idle_recycle=configuration.POSTGRESQL_POOL_IDLE_RECYCLE,
+        replica_hosts=configuration.POSTGRESQL_REPLICA_HOSTS,
+        replica_max_lag=configuration.POSTGRESQL_REPLICA_MAX_LAG,
+        replica_check_interval=configuration.POSTGRESQL_REPLICA_CHECK_INTERVAL,
+        driver=configuration.POSTGRESQL_DRIVER,
     )
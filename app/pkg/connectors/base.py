@@ -1,14 +1,182 @@
 """Abstract connector."""
 
-from abc import abstractmethod
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from app.pkg.connectors.postgresql.statements import Statement
+
+__all__ = ["BaseConnector", "BaseConnection", "BaseDriver", "DatabaseError"]
+
+#: Query as plain string or as statement prepared by the driver.
+Query = Union[str, "Statement"]
+
+#: Row of query result as mapping of column names to decoded values.
+Row = Dict[str, Any]
+
+#: Query params mapped by ``%(name)s`` placeholders.
+Params = Optional[Mapping[str, Any]]
+
+
+class DatabaseError(Exception):
+    """Error of database raised by every driver.
+
+    Attributes:
+        pgcode: SQLSTATE code of the error, if the error came from the server.
+        pgerror: Error message.
+    """
+
+    pgcode: Optional[str]
+    pgerror: Optional[str]
+
+    def __init__(self, pgerror: Optional[str] = None, pgcode: Optional[str] = None):
+        self.pgcode = pgcode
+        self.pgerror = pgerror
+        super().__init__(pgerror)
+
+
+class BaseConnection(ABC):
+    """Connection acquired from a pool of database driver.
+
+    Queries are plain strings or prepared statements with ``%(name)s``
+    placeholders, and rows are returned as ``dict`` with decoded values.
+    """
+
+    #: float: Event loop time when the connection was opened.
+    opened_at: float
+
+    @abstractmethod
+    async def execute(self, query: Query, params: Params = None) -> None:
+        """Execute query without reading its result."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def fetchone(
+        self,
+        query: Query,
+        params: Params = None,
+    ) -> Optional[Row]:
+        """Execute query and read the first row of its result."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def fetchall(self, query: Query, params: Params = None) -> List[Row]:
+        """Execute query and read all rows of its result."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def stream(
+        self,
+        query: Query,
+        params: Params = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        """Read rows of query through a server-side cursor, ``chunk_size``
+        rows at a time."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def listen(self, channel: str) -> None:
+        """Subscribe the connection to notifications of ``channel``."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def notifications(self) -> AsyncIterator[str]:
+        """Read payloads of notifications of subscribed channels.
 
-__all__ = ["BaseConnector"]
+        Raises:
+            DatabaseError: The connection is lost.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def in_transaction(self) -> bool:
+        """Check if the connection is inside of transaction block."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the connection, so the pool does not reuse it."""
+
+        raise NotImplementedError()
+
+
+class BaseDriver(ABC):
+    """Database driver which creates pools and acquires their
+    connections."""
+
+    @abstractmethod
+    async def create_pool(
+        self,
+        dsn: str,
+        min_size: int,
+        max_size: int,
+        timeout: float,
+        idle_recycle: float,
+    ) -> Any:
+        """Create pool and open ``min_size`` connections.
+
+        ``timeout`` limits opening and acquisition of connections, but not
+        queries which run on them.
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def close_pool(self, pool: Any) -> None:
+        """Close all connections of the pool."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def acquire(self, pool: Any) -> AsyncContextManager[BaseConnection]:
+        """Acquire connection from the pool."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def connect(self, dsn: str) -> AsyncContextManager[BaseConnection]:
+        """Open dedicated connection out of any pool, e.g. to listen for
+        notifications."""
+
+        raise NotImplementedError()
 
 
 class BaseConnector:
     """Abstract connector."""
 
+    @abstractmethod
+    async def create_pool(self):
+        """Open connection pool for the lifetime of the process."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def close_pool(self):
+        """Close connection pool."""
+
+        raise NotImplementedError()
+
     @abstractmethod
     @asynccontextmanager
     async def get_connect(self):
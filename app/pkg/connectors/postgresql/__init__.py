@@ -0,0 +1,7 @@
+"""Postgresql connector with read replicas."""
+
+from app.pkg.connectors.postgresql.connector import Postgresql
+from app.pkg.connectors.postgresql.replica import Replica
+from app.pkg.connectors.postgresql.session import Session, get_session, session
+
+__all__ = ["Postgresql", "Replica", "Session", "get_session", "session"]
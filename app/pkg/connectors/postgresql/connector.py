@@ -0,0 +1,285 @@
+"""Postgresql connector."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, List, Optional, Sequence
+
+import pydantic
+
+from app.pkg.connectors.base import (
+    BaseConnection,
+    BaseConnector,
+    BaseDriver,
+    DatabaseError,
+)
+from app.pkg.connectors.postgresql.drivers import get_driver
+from app.pkg.connectors.postgresql.replica import Replica
+from app.pkg.connectors.postgresql.session import get_session, lsn_to_int
+from app.pkg.logger import get_logger
+from app.pkg.models.core.postgresql import PostgresqlDriver
+
+__all__ = ["Postgresql"]
+
+logger = get_logger(__name__)
+
+
+class Postgresql(BaseConnector):
+    """Process-lifetime pool of connections to a Postgres database.
+
+    If replicas are set, read-only connections are taken from the pools of
+    replicas which are in rotation, and the primary is used otherwise.
+    """
+
+    pool: Optional[Any]
+    driver: BaseDriver
+    replicas: List[Replica]
+
+    def __init__(
+        self,
+        username: str,
+        password: pydantic.SecretStr,
+        host: pydantic.PositiveInt,
+        port: pydantic.PositiveInt,
+        database_name: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 60.0,
+        max_lifetime: float = -1.0,
+        idle_recycle: float = -1.0,
+        replica_hosts: Sequence[str] = (),
+        replica_max_lag: float = 5.0,
+        replica_check_interval: float = 1.0,
+        driver: str = PostgresqlDriver.AIOPG,
+    ):
+        """Settings for create postgresql dsn and its pool.
+
+        Args:
+            min_size: Number of connections opened when the pool is created.
+            max_size: Upper limit of simultaneously opened connections.
+            acquire_timeout: Seconds to wait for a free connection.
+            max_lifetime: Seconds after which a connection is closed on release,
+                regardless of its usage. ``-1`` disables the limit.
+            idle_recycle: Seconds a connection may stay idle in the pool before
+                it is reopened. ``-1`` disables recycling.
+            replica_hosts: Streaming replicas of the database as
+                ``host`` or ``host:port``.
+            replica_max_lag: Seconds of replay lag after which a replica is
+                taken out of rotation.
+            replica_check_interval: Seconds between replication state checks.
+            driver: Name of the database driver, one of ``PostgresqlDriver``.
+        """
+
+        self.pool = None
+        self.driver = get_driver(driver)
+        self.driver_name = driver
+        self.username = username
+        self.password = password
+        self.host = host
+        self.port = port
+        self.database_name = database_name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.idle_recycle = idle_recycle
+        self.replica_max_lag = replica_max_lag
+        self.replica_check_interval = replica_check_interval
+        self.replicas = [
+            Replica(connector=self.__replica_connector(host)) for host in replica_hosts
+        ]
+
+        self.__replica_counter = itertools.count()
+        self.__monitor: Optional[asyncio.Task] = None
+        self.__lock = asyncio.Lock()
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_dsn(self):
+        """Description of ``BaseConnector.get_dsn``."""
+
+        return (
+            f"postgresql://"
+            f"{self.username}:"
+            f"{self.password.get_secret_value()}@"
+            f"{self.host}:{self.port}/"
+            f"{self.database_name}"
+        )
+
+    async def create_pool(self) -> Any:
+        """Create the pool and open ``min_size`` connections in advance."""
+
+        async with self.__lock:
+            if self.pool is not None and self.__loop is asyncio.get_running_loop():
+                return self.pool
+
+            self.pool = await self.driver.create_pool(
+                dsn=self.get_dsn(),
+                min_size=self.min_size,
+                max_size=self.max_size,
+                timeout=self.acquire_timeout,
+                idle_recycle=self.idle_recycle,
+            )
+            self.__loop = asyncio.get_running_loop()
+
+            if self.replicas:
+                await self.check_replicas()
+                self.__monitor = asyncio.create_task(self.__monitor_replicas())
+
+            return self.pool
+
+    async def close_pool(self) -> None:
+        """Close all connections of the pool."""
+
+        if self.__monitor is not None:
+            self.__monitor.cancel()
+            self.__monitor = None
+
+        for replica in self.replicas:
+            await replica.connector.close_pool()
+
+        if self.pool is None:
+            return
+
+        pool, self.pool = self.pool, None
+        await self.driver.close_pool(pool)
+
+    def has_replayed(self, lsn: int) -> bool:
+        """Check if a replica has replayed WAL position ``lsn``, so reads of
+        a session which has written it can be served by replicas."""
+
+        return any(replica.has_replayed(lsn) for replica in self.replicas)
+
+    async def check_replicas(self) -> None:
+        """Refresh replication state of all replicas."""
+
+        await asyncio.gather(
+            *(replica.check(self.replica_max_lag) for replica in self.replicas),
+        )
+
+    @asynccontextmanager
+    async def get_connect(
+        self,
+        read_only: bool = False,
+    ) -> AsyncIterator[BaseConnection]:
+        """Acquire connection from the pool of connectors to a Postgres
+        database.
+
+        Args:
+            read_only: Connection is used only for reads and can be taken
+                from a replica.
+        """
+
+        async with AsyncExitStack() as stack:
+            conn = None
+            if read_only:
+                conn = await self.__enter_replica(stack)
+            if conn is None:
+                conn = await stack.enter_async_context(self.__acquire())
+
+            yield conn
+
+            if not read_only and self.replicas:
+                await self.__observe_write_position(conn)
+
+    def connect(self) -> AsyncContextManager[BaseConnection]:
+        """Open dedicated connection to the primary, out of the pool.
+
+        Used by long-lived consumers, e.g. listeners of notifications, which
+        should not hold connections of the pool.
+        """
+
+        return self.driver.connect(self.get_dsn())
+
+    @asynccontextmanager
+    async def __acquire(self) -> AsyncIterator[BaseConnection]:
+        """Acquire connection from the pool of the primary."""
+
+        pool = self.pool
+        # The pool is bound to the event loop it was created in, so it is
+        # (re)created lazily, e.g. for scripts or for every test event loop.
+        if pool is None or self.__loop is not asyncio.get_running_loop():
+            pool = await self.create_pool()
+
+        async with self.driver.acquire(pool) as conn:
+            try:
+                yield conn
+            finally:
+                if self.__is_expired(conn):
+                    await conn.close()
+
+    async def __enter_replica(
+        self,
+        stack: AsyncExitStack,
+    ) -> Optional[BaseConnection]:
+        """Acquire connection from a replica that has replayed all writes of
+        the current session."""
+
+        session = get_session()
+        lsn = session.lsn if session is not None else 0
+
+        replicas = [r for r in self.replicas if r.has_replayed(lsn)]
+        if not replicas:
+            return None
+
+        replica = replicas[next(self.__replica_counter) % len(replicas)]
+        try:
+            return await stack.enter_async_context(replica.connector.get_connect())
+        except (DatabaseError, OSError, asyncio.TimeoutError):
+            replica.available = False
+            return None
+
+    @staticmethod
+    async def __observe_write_position(conn: BaseConnection) -> None:
+        """Move the current session forward to the WAL position of the
+        primary."""
+
+        session = get_session()
+        if session is None:
+            return
+
+        row = await conn.fetchone("select pg_current_wal_lsn()::text as lsn;")
+        session.observe(lsn_to_int(row["lsn"]))
+
+    async def __monitor_replicas(self) -> None:
+        """Periodically refresh replication state of all replicas.
+
+        An unexpected error of a check takes all replicas out of rotation
+        until the next check, so reads are not routed by an outdated state.
+        """
+
+        while True:
+            await asyncio.sleep(self.replica_check_interval)
+            try:
+                await self.check_replicas()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Replicas are taken out of rotation")
+                for replica in self.replicas:
+                    replica.available = False
+
+    def __replica_connector(self, host: str) -> Postgresql:
+        """Create connector to replica with the same settings as primary."""
+
+        host, _, port = host.partition(":")
+        return Postgresql(
+            username=self.username,
+            password=self.password,
+            host=host,
+            port=int(port) if port else self.port,
+            database_name=self.database_name,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            acquire_timeout=self.acquire_timeout,
+            max_lifetime=self.max_lifetime,
+            idle_recycle=self.idle_recycle,
+            driver=self.driver_name,
+        )
+
+    def __is_expired(self, conn: BaseConnection) -> bool:
+        """Check if the connection has outlived ``max_lifetime``."""
+
+        if self.max_lifetime < 0:
+            return False
+
+        return asyncio.get_running_loop().time() - conn.opened_at > self.max_lifetime
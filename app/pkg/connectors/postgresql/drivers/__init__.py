@@ -0,0 +1,32 @@
+"""Drivers of postgresql connector.
+
+Driver modules are imported only when selected, so optional drivers are
+not required to be installed.
+"""
+
+import importlib
+
+from app.pkg.connectors.base import BaseDriver
+from app.pkg.models.core.postgresql import PostgresqlDriver
+
+__all__ = ["get_driver"]
+
+_DRIVERS = {
+    PostgresqlDriver.AIOPG: ("aiopg", "AiopgDriver"),
+    PostgresqlDriver.ASYNCPG: ("asyncpg", "AsyncpgDriver"),
+}
+
+
+def get_driver(name: str) -> BaseDriver:
+    """Create driver by its name.
+
+    Args:
+        name: Name of the driver, one of ``PostgresqlDriver``.
+
+    Returns:
+        Driver instance.
+    """
+
+    module_name, class_name = _DRIVERS[PostgresqlDriver(name)]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, class_name)()
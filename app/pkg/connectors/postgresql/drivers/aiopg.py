@@ -0,0 +1,255 @@
+"""Driver on top of aiopg and psycopg2."""
+
+import asyncio
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from functools import wraps
+from typing import AsyncIterator, List, Optional
+
+import aiopg
+import psycopg2
+from aiopg import Connection, Cursor, Pool
+from psycopg2 import errorcodes, sql
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.extras import RealDictCursor
+
+from app.pkg.connectors.base import (
+    BaseConnection,
+    BaseDriver,
+    DatabaseError,
+    Params,
+    Query,
+    Row,
+)
+from app.pkg.connectors.postgresql.statements import Statement, registry
+
+__all__ = ["AiopgDriver", "AiopgConnection"]
+
+
+def _translate_errors(fn):
+    """Raise psycopg2 errors as ``DatabaseError``."""
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except psycopg2.Error as e:
+            raise DatabaseError(pgerror=e.pgerror or str(e), pgcode=e.pgcode) from e
+
+    return wrapper
+
+
+class AiopgConnection(BaseConnection):
+    """Connection of aiopg pool with ``RealDictCursor``.
+
+    Statements are prepared with SQL ``prepare`` and run with ``execute``,
+    as psycopg2 does not support the extended query protocol.
+    """
+
+    #: Connection: aiopg connection.
+    raw: Connection
+
+    def __init__(self, raw: Connection, cur: Cursor, opened_at: float):
+        self.raw = raw
+        self.opened_at = opened_at
+        self.__cur = cur
+
+    @_translate_errors
+    async def execute(self, query: Query, params: Params = None) -> None:
+        await self.__execute(query, params)
+
+    @_translate_errors
+    async def fetchone(self, query: Query, params: Params = None) -> Optional[Row]:
+        await self.__execute(query, params)
+        return await self.__cur.fetchone()
+
+    @_translate_errors
+    async def fetchall(self, query: Query, params: Params = None) -> List[Row]:
+        await self.__execute(query, params)
+        return await self.__cur.fetchall()
+
+    async def stream(
+        self,
+        query: Query,
+        params: Params = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        async with self.__own_transaction(), self.__cursor(query, params) as name:
+            fetch = f"fetch forward {chunk_size} from {name};"
+            while rows := await self.fetchall(fetch):
+                for row in rows:
+                    yield row
+
+    @_translate_errors
+    async def listen(self, channel: str) -> None:
+        await self.__cur.execute(
+            sql.SQL("listen {};").format(sql.Identifier(channel)),
+        )
+
+    async def notifications(self) -> AsyncIterator[str]:
+        while True:
+            try:
+                notify = await self.raw.notifies.get()
+            except psycopg2.Error as e:
+                raise DatabaseError(pgerror=e.pgerror or str(e), pgcode=e.pgcode) from e
+            yield notify.payload
+
+    def in_transaction(self) -> bool:
+        return self.raw.raw.get_transaction_status() != TRANSACTION_STATUS_IDLE
+
+    async def close(self) -> None:
+        await self.raw.close()
+
+    async def __execute(self, query: Query, params: Params) -> None:
+        if not isinstance(query, Statement):
+            await self.__cur.execute(query, params)
+            return
+
+        if not registry.is_prepared(self.raw, query):
+            await self.__prepare(query)
+
+        try:
+            await self.__cur.execute(query.execute_query, params)
+        except psycopg2.Error as e:
+            if e.pgcode != errorcodes.INVALID_SQL_STATEMENT_NAME:
+                raise
+            # Statement was deallocated on the server, e.g. by ``discard all``.
+            registry.discard(self.raw, query)
+            await self.__prepare(query)
+            await self.__cur.execute(query.execute_query, params)
+
+    async def __prepare(self, statement: Statement) -> None:
+        try:
+            await self.__cur.execute(statement.prepare_query)
+        except psycopg2.Error as e:
+            if e.pgcode != errorcodes.DUPLICATE_PREPARED_STATEMENT:
+                raise
+        registry.add(self.raw, statement)
+
+    @asynccontextmanager
+    async def __own_transaction(self) -> AsyncIterator[None]:
+        """Run the block in a transaction, unless one is already open, as
+        server-side cursors live only inside of a transaction."""
+
+        if self.in_transaction():
+            yield
+            return
+
+        await self.execute("begin;")
+        try:
+            yield
+        except BaseException:
+            if not self.raw.closed:
+                await asyncio.shield(self.__rollback())
+            raise
+        await self.execute("commit;")
+
+    @asynccontextmanager
+    async def __cursor(self, query: Query, params: Params) -> AsyncIterator[str]:
+        """Declare server-side cursor of ``query`` and close it after the
+        block.
+
+        psycopg2 does not support named cursors on asynchronous connections,
+        so the cursor is declared with SQL.
+        """
+
+        if isinstance(query, Statement):
+            query = query.query
+        name = f"stream_{uuid.uuid4().hex}"
+        await self.execute(
+            f"declare {name} no scroll cursor for {query.strip().rstrip(';')}",
+            params,
+        )
+        yield name
+        await self.execute(f"close {name};")
+
+    async def __rollback(self) -> None:
+        try:
+            await self.__cur.execute("rollback;")
+        except psycopg2.Error:
+            # The pool closes connections released in a failed transaction.
+            pass
+
+
+class AiopgDriver(BaseDriver):
+    """Default driver, aiopg pool of psycopg2 connections.
+
+    aiopg uses ``timeout`` of the pool also as the default timeout of every
+    query of its connections, so the pool is created without it, and only
+    opening and acquisition of connections are limited by ``timeout``.
+    """
+
+    #: float: Seconds to wait for a free connection.
+    timeout: Optional[float]
+
+    def __init__(self):
+        self.timeout = None
+        self.__opened_at: weakref.WeakKeyDictionary[Connection, float] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @_translate_errors
+    async def create_pool(
+        self,
+        dsn: str,
+        min_size: int,
+        max_size: int,
+        timeout: float,
+        idle_recycle: float,
+    ) -> Pool:
+        self.timeout = timeout
+        async with asyncio.timeout(timeout):
+            return await aiopg.create_pool(
+                dsn=dsn,
+                minsize=min_size,
+                maxsize=max_size,
+                timeout=None,
+                pool_recycle=idle_recycle,
+                enable_hstore=False,
+                on_connect=self.__on_connect,
+            )
+
+    async def close_pool(self, pool: Pool) -> None:
+        pool.close()
+        await pool.wait_closed()
+
+    @asynccontextmanager
+    async def acquire(self, pool: Pool) -> AsyncIterator[AiopgConnection]:
+        try:
+            async with asyncio.timeout(self.timeout):
+                conn = await pool.acquire()
+        except psycopg2.Error as e:
+            raise DatabaseError(pgerror=e.pgerror or str(e), pgcode=e.pgcode) from e
+
+        try:
+            async with await conn.cursor(cursor_factory=RealDictCursor) as cur:
+                yield AiopgConnection(
+                    raw=conn,
+                    cur=cur,
+                    opened_at=self.__opened_at.get(conn, conn.last_usage),
+                )
+        finally:
+            await pool.release(conn)
+
+    @asynccontextmanager
+    async def connect(self, dsn: str) -> AsyncIterator[AiopgConnection]:
+        try:
+            conn = await aiopg.connect(dsn=dsn, enable_hstore=False)
+        except psycopg2.Error as e:
+            raise DatabaseError(pgerror=e.pgerror or str(e), pgcode=e.pgcode) from e
+
+        try:
+            async with await conn.cursor(cursor_factory=RealDictCursor) as cur:
+                yield AiopgConnection(
+                    raw=conn,
+                    cur=cur,
+                    opened_at=asyncio.get_running_loop().time(),
+                )
+        finally:
+            await conn.close()
+
+    async def __on_connect(self, conn: Connection) -> None:
+        """Remember when the connection was opened."""
+
+        self.__opened_at[conn] = asyncio.get_running_loop().time()
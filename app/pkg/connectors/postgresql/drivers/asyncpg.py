@@ -0,0 +1,251 @@
+"""Driver on top of asyncpg.
+
+asyncpg talks the binary protocol and decodes values into native types
+without intermediate text. It is an optional dependency, installed with
+``poetry install --extras asyncpg``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from functools import wraps
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+try:
+    import asyncpg
+    from asyncpg.pool import Pool
+except ImportError:  # pragma: no cover
+    # The module is still imported by wiring of the containers.
+    asyncpg = None
+
+from app.pkg.connectors.base import (
+    BaseConnection,
+    BaseDriver,
+    DatabaseError,
+    Params,
+    Query,
+    Row,
+)
+from app.pkg.connectors.postgresql.statements import (
+    Statement,
+    registry,
+    to_positional,
+)
+
+__all__ = ["AsyncpgDriver", "AsyncpgConnection"]
+
+
+def _translate_errors(fn):
+    """Raise asyncpg errors as ``DatabaseError``."""
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            raise DatabaseError(
+                pgerror=str(e),
+                pgcode=getattr(e, "sqlstate", None),
+            ) from e
+
+    return wrapper
+
+
+if asyncpg is not None:
+
+    class _Connection(asyncpg.Connection):
+        """asyncpg connection which remembers when it was opened."""
+
+        __slots__ = ("opened_at",)
+
+        @property
+        def connection(self) -> _Connection:
+            """The connection itself, also when it is read through a proxy
+            of the pool, so statements are tracked per connection."""
+
+            return self
+
+
+class AsyncpgConnection(BaseConnection):
+    """Connection of asyncpg pool.
+
+    Statements are prepared by the statement cache of asyncpg, once per
+    connection. Their first execution on the connection is counted as a
+    miss of ``registry`` and the next ones as hits, as asyncpg does not
+    report its cache lookups.
+    """
+
+    #: asyncpg.Connection: Proxy of the pooled asyncpg connection.
+    raw: asyncpg.Connection
+
+    def __init__(self, raw: asyncpg.Connection):
+        self.raw = raw
+        self.opened_at = raw.opened_at
+        self.__notifications: Optional[asyncio.Queue] = None
+
+    @_translate_errors
+    async def execute(self, query: Query, params: Params = None) -> None:
+        query, args = self.__bind(query, params)
+        await self.raw.execute(query, *args)
+
+    @_translate_errors
+    async def fetchone(self, query: Query, params: Params = None) -> Optional[Row]:
+        query, args = self.__bind(query, params)
+        record = await self.raw.fetchrow(query, *args)
+        return dict(record) if record is not None else None
+
+    @_translate_errors
+    async def fetchall(self, query: Query, params: Params = None) -> List[Row]:
+        query, args = self.__bind(query, params)
+        return [dict(record) for record in await self.raw.fetch(query, *args)]
+
+    async def stream(
+        self,
+        query: Query,
+        params: Params = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        query, args = self.__bind(query, params)
+        async with self.__own_transaction():
+            async for record in self.raw.cursor(query, *args, prefetch=chunk_size):
+                yield dict(record)
+
+    @_translate_errors
+    async def listen(self, channel: str) -> None:
+        if self.__notifications is None:
+            self.__notifications = asyncio.Queue()
+            # ``None`` wakes up the reader when the connection is lost.
+            self.raw.add_termination_listener(
+                lambda _: self.__notifications.put_nowait(None),
+            )
+
+        await self.raw.add_listener(
+            channel,
+            lambda *args: self.__notifications.put_nowait(args[-1]),
+        )
+
+    async def notifications(self) -> AsyncIterator[str]:
+        if self.__notifications is None:
+            raise RuntimeError("The connection does not listen to any channel.")
+
+        while (payload := await self.__notifications.get()) is not None:
+            yield payload
+        raise DatabaseError(pgerror="Connection is closed.")
+
+    def in_transaction(self) -> bool:
+        return self.raw.is_in_transaction()
+
+    async def close(self) -> None:
+        await self.raw.close()
+
+    @asynccontextmanager
+    async def __own_transaction(self) -> AsyncIterator[None]:
+        """Run the block in a transaction, unless one is already open, as
+        cursors live only inside of a transaction."""
+
+        if self.in_transaction():
+            yield
+            return
+
+        transaction = self.raw.transaction()
+        await transaction.start()
+        try:
+            yield
+        except BaseException:
+            if not self.raw.is_closed():
+                await asyncio.shield(transaction.rollback())
+            raise
+        await transaction.commit()
+
+    def __bind(self, query: Query, params: Params) -> Tuple[str, List[Any]]:
+        """Replace named params of query with positional ones."""
+
+        if isinstance(query, Statement):
+            if not registry.is_prepared(self.raw.connection, query):
+                registry.add(self.raw.connection, query)
+            query, names = query.positional_query, query.params
+        else:
+            query, names = to_positional(query)
+
+        if not names:
+            return query, []
+        return query, [params[name] for name in names]
+
+
+class AsyncpgDriver(BaseDriver):
+    """Driver with asyncpg pool."""
+
+    #: float: Seconds to wait for a free connection.
+    timeout: Optional[float]
+
+    def __init__(self):
+        if asyncpg is None:
+            raise ImportError(
+                "asyncpg is not installed, use `poetry install --extras asyncpg`",
+            )
+        self.timeout = None
+
+    @_translate_errors
+    async def create_pool(
+        self,
+        dsn: str,
+        min_size: int,
+        max_size: int,
+        timeout: float,
+        idle_recycle: float,
+    ) -> Pool:
+        self.timeout = timeout
+        return await asyncpg.create_pool(
+            dsn=dsn,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            max_inactive_connection_lifetime=max(idle_recycle, 0),
+            connection_class=_Connection,
+            init=self.__on_connect,
+        )
+
+    async def close_pool(self, pool: Pool) -> None:
+        await pool.close()
+
+    @asynccontextmanager
+    async def acquire(self, pool: Pool) -> AsyncIterator[AsyncpgConnection]:
+        try:
+            conn = await pool.acquire(timeout=self.timeout)
+        except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            raise DatabaseError(
+                pgerror=str(e),
+                pgcode=getattr(e, "sqlstate", None),
+            ) from e
+
+        try:
+            yield AsyncpgConnection(raw=conn)
+        finally:
+            await pool.release(conn)
+
+    @asynccontextmanager
+    async def connect(self, dsn: str) -> AsyncIterator[AsyncpgConnection]:
+        try:
+            conn = await asyncpg.connect(
+                dsn=dsn,
+                timeout=self.timeout or 60,
+                connection_class=_Connection,
+            )
+        except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            raise DatabaseError(
+                pgerror=str(e),
+                pgcode=getattr(e, "sqlstate", None),
+            ) from e
+
+        await self.__on_connect(conn)
+        try:
+            yield AsyncpgConnection(raw=conn)
+        finally:
+            await conn.close()
+
+    @staticmethod
+    async def __on_connect(conn: _Connection) -> None:
+        """Remember when the connection was opened."""
+
+        conn.opened_at = asyncio.get_running_loop().time()
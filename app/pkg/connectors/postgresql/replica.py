@@ -0,0 +1,91 @@
+"""Streaming replica of the primary database."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import TYPE_CHECKING
+
+from app.pkg.connectors.base import DatabaseError
+from app.pkg.connectors.postgresql.session import lsn_to_int
+from app.pkg.logger import get_logger
+
+if TYPE_CHECKING:
+    from app.pkg.connectors.postgresql.connector import Postgresql
+
+__all__ = ["Replica"]
+
+logger = get_logger(__name__)
+
+
+class Replica:
+    """Replica pool with its replication state.
+
+    The replica is taken out of rotation while it is unreachable or while
+    its replay lag exceeds ``max_lag``.
+    """
+
+    #: Postgresql: Connector to the replica.
+    connector: Postgresql
+    #: bool: The replica can serve reads.
+    available: bool
+    #: int: Last WAL position replayed by the replica.
+    replay_lsn: int
+    #: float: Replay lag in seconds.
+    lag: float
+
+    __query = """
+        select
+            pg_last_wal_replay_lsn()::text as replay_lsn,
+            case
+                when pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() then 0
+                else coalesce(
+                    extract(epoch from now() - pg_last_xact_replay_timestamp()),
+                    0
+                )
+            end::float as lag;
+    """
+
+    def __init__(self, connector: Postgresql):
+        self.connector = connector
+        self.available = False
+        self.replay_lsn = 0
+        self.lag = math.inf
+
+    def __repr__(self) -> str:
+        return f"Replica({self.connector.host}:{self.connector.port})"
+
+    def has_replayed(self, lsn: int) -> bool:
+        """Check if the replica can serve a caller which has written
+        ``lsn``."""
+
+        return self.available and self.replay_lsn >= lsn
+
+    async def check(self, max_lag: float) -> None:
+        """Refresh replication state of the replica."""
+
+        try:
+            async with self.connector.get_connect() as conn:
+                row = await conn.fetchone(self.__query)
+        except (DatabaseError, OSError, asyncio.TimeoutError) as e:
+            self.__set_available(False, reason=str(e))
+            return
+
+        replay_lsn, lag = row["replay_lsn"], row["lag"]
+        if replay_lsn is None:
+            self.__set_available(False, reason="server is not in recovery")
+            return
+
+        self.replay_lsn = lsn_to_int(replay_lsn)
+        self.lag = lag
+        self.__set_available(
+            lag <= max_lag,
+            reason=f"replay lag {lag:.3f}s exceeds {max_lag}s",
+        )
+
+    def __set_available(self, available: bool, reason: str) -> None:
+        if self.available and not available:
+            logger.warning("%r is taken out of rotation: %s", self, reason)
+        elif available and not self.available:
+            logger.info("%r is back in rotation", self)
+        self.available = available
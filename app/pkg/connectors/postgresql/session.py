@@ -0,0 +1,80 @@
+"""Read-your-writes session of the caller."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+__all__ = ["Session", "get_session", "session", "lsn_to_int", "int_to_lsn"]
+
+
+def lsn_to_int(lsn: str) -> int:
+    """Convert textual WAL position (e.g. ``16/B374D848``) to int."""
+
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+def int_to_lsn(value: int) -> str:
+    """Convert int WAL position to its textual representation."""
+
+    return f"{value >> 32:X}/{value & 0xFFFFFFFF:X}"
+
+
+class Session:
+    """WAL position that reads of the caller have to observe.
+
+    The position is passed to the caller as an opaque session token after
+    each write. While replicas have not replayed it, reads of the caller are
+    routed to the primary.
+    """
+
+    #: int: Last WAL position written by the caller.
+    lsn: int
+
+    def __init__(self, token: Optional[str] = None):
+        self.lsn = 0
+        if token:
+            try:
+                self.lsn = lsn_to_int(token)
+            except ValueError:
+                self.lsn = 0
+
+    @property
+    def token(self) -> Optional[str]:
+        """Opaque session token, ``None`` if the caller has not written yet."""
+
+        return int_to_lsn(self.lsn) if self.lsn else None
+
+    def observe(self, lsn: int) -> None:
+        """Move session position forward to ``lsn``."""
+
+        self.lsn = max(self.lsn, lsn)
+
+
+_session: ContextVar[Optional[Session]] = ContextVar("session", default=None)
+
+
+def get_session() -> Optional[Session]:
+    """Get session of the current caller, if any."""
+
+    return _session.get()
+
+
+@contextmanager
+def session(token: Optional[str] = None) -> Iterator[Session]:
+    """Open read-your-writes session for the current context.
+
+    Examples:
+        ::
+
+            >>> with session("0/16B3748") as current:
+            ...     current.token
+            '0/16B3748'
+    """
+
+    current = Session(token=token)
+    reset_token = _session.set(current)
+    try:
+        yield current
+    finally:
+        _session.reset(reset_token)
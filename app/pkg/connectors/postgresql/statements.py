@@ -0,0 +1,139 @@
+"""Server-side prepared statements."""
+
+import re
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Hashable, Set, Tuple
+
+__all__ = ["Statement", "StatementRegistry", "registry", "to_positional"]
+
+_PLACEHOLDER = re.compile(r"%\((\w+)\)s")
+
+
+@lru_cache(maxsize=256)
+def to_positional(query: str) -> Tuple[str, Tuple[str, ...]]:
+    """Replace ``%(name)s`` placeholders of ``query`` with ``$n``.
+
+    Examples:
+        ::
+
+            >>> to_positional("select %(a)s, %(b)s, %(a)s;")
+            ('select $1, $2, $1;', ('a', 'b'))
+
+    Returns:
+        Query with positional placeholders and names of its params.
+    """
+
+    params: Dict[str, int] = {}
+
+    def replace(match: re.Match) -> str:
+        return f"${params.setdefault(match.group(1), len(params) + 1)}"
+
+    return _PLACEHOLDER.sub(replace, query), tuple(params)
+
+
+@dataclass(frozen=True)
+class Statement:
+    """Query which is prepared once per connection and then executed by
+    name.
+
+    Examples:
+        ::
+
+            >>> statement = Statement(
+            ...     name="users_read",
+            ...     query="select * from users where id = %(id)s;",
+            ... )
+            >>> statement.prepare_query
+            'prepare users_read as select * from users where id = $1'
+            >>> statement.execute_query
+            'execute users_read (%(id)s)'
+    """
+
+    #: str: Name of the prepared statement, unique per connection.
+    name: str
+
+    #: str: Query with ``%(param)s`` placeholders.
+    query: str
+
+    #: str: Query with ``$n`` placeholders.
+    positional_query: str = field(init=False)
+
+    #: Tuple[str, ...]: Names of parameters in order of ``$n`` placeholders.
+    params: Tuple[str, ...] = field(init=False)
+
+    #: str: Query that prepares the statement.
+    prepare_query: str = field(init=False)
+
+    #: str: Query that executes the prepared statement.
+    execute_query: str = field(init=False)
+
+    def __post_init__(self):
+        positional_query, params = to_positional(self.query)
+        positional_query = " ".join(positional_query.strip().rstrip(";").split())
+        arguments = ", ".join(f"%({param})s" for param in params)
+
+        object.__setattr__(self, "positional_query", positional_query)
+        object.__setattr__(self, "params", params)
+        object.__setattr__(
+            self,
+            "prepare_query",
+            f"prepare {self.name} as {positional_query}",
+        )
+        object.__setattr__(
+            self,
+            "execute_query",
+            f"execute {self.name} ({arguments})" if params else f"execute {self.name}",
+        )
+
+
+class StatementRegistry:
+    """Prepared statements of each pooled connection.
+
+    Connections are tracked by weak references, so a recycled connection
+    is a new one and its statements are prepared again.
+    """
+
+    #: int: Executions of a statement already prepared on the connection.
+    hits: int
+    #: int: Executions that had to prepare the statement first.
+    misses: int
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__prepared: weakref.WeakKeyDictionary[Hashable, Set[str]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def prepared(self) -> int:
+        """Number of statements prepared on open connections."""
+
+        return sum(len(names) for names in self.__prepared.values())
+
+    def is_prepared(self, conn: Hashable, statement: Statement) -> bool:
+        """Check if ``statement`` is prepared on ``conn`` and count the
+        lookup."""
+
+        if statement.name in self.__prepared.get(conn, ()):
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def add(self, conn: Hashable, statement: Statement) -> None:
+        """Mark ``statement`` as prepared on ``conn``."""
+
+        self.__prepared.setdefault(conn, set()).add(statement.name)
+
+    def discard(self, conn: Hashable, statement: Statement) -> None:
+        """Mark ``statement`` as deallocated on ``conn``."""
+
+        self.__prepared.get(conn, set()).discard(statement.name)
+
+
+#: StatementRegistry: Prepared statements of the current process.
+registry = StatementRegistry()
@@ -0,0 +1,5 @@
+"""Loaders that coalesce concurrent reads of single keys into batches."""
+
+from app.pkg.loaders.batch import BatchLoader
+
+__all__ = ["BatchLoader"]
@@ -0,0 +1,167 @@
+"""Batch loader."""
+
+import asyncio
+import contextvars
+from abc import ABC, abstractmethod
+from typing import Dict, Generic, List, Mapping, Optional, TypeVar
+
+__all__ = ["BatchLoader"]
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class BatchLoader(ABC, Generic[K, V]):
+    """Coalesce concurrent loads of single keys into ``load_many`` calls.
+
+    Keys requested within ``window`` seconds are loaded by one call, which
+    is dispatched earlier once ``max_batch_size`` keys are collected.
+    Concurrent loads of the same key share one result, so a key is never
+    loaded twice at the same time.
+
+    Batches are loaded in a fresh context, so they do not inherit
+    context variables of the caller that happened to dispatch them, e.g.
+    its unit of work.
+
+    Examples:
+        ::
+
+            class SquareLoader(BatchLoader[int, int]):
+                async def load_many(self, keys):
+                    return {key: key * key for key in keys}
+
+            loader = SquareLoader(max_batch_size=100, window=0.001)
+            # Both keys are loaded by one call of ``load_many``.
+            assert await asyncio.gather(loader.load(2), loader.load(3)) == [4, 9]
+    """
+
+    #: int: Maximum number of keys loaded by one call.
+    max_batch_size: int
+    #: float: Seconds to wait for more keys before a batch is loaded.
+    window: float
+
+    #: int: Number of ``load`` calls.
+    loads: int
+    #: int: Loads that joined a pending or running load of the same key.
+    coalesced: int
+    #: int: Number of ``load_many`` calls.
+    batches: int
+    #: int: Number of keys loaded by all ``load_many`` calls.
+    keys: int
+
+    def __init__(self, max_batch_size: int, window: float):
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.loads = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.keys = 0
+
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__pending: Dict[K, asyncio.Future[Optional[V]]] = {}
+        self.__in_flight: Dict[K, asyncio.Future[Optional[V]]] = {}
+        self.__timer: Optional[asyncio.TimerHandle] = None
+
+    @abstractmethod
+    async def load_many(self, keys: List[K]) -> Mapping[K, V]:
+        """Load values of ``keys``, missing keys are not found."""
+
+        raise NotImplementedError()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load value of ``key`` as part of the next batch.
+
+        Returns:
+            Value of the key, ``None`` if the key is not found.
+        """
+
+        self.loads += 1
+        loop = asyncio.get_running_loop()
+        if self.__loop is not loop:
+            # Futures are bound to their loop, e.g. to the loop of a test.
+            self.__reset(loop)
+
+        future = self.__pending.get(key) or self.__in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = self.__enqueue(loop, key)
+
+        # A cancelled caller must not cancel the load of other callers.
+        return await asyncio.shield(future)
+
+    def __enqueue(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: K,
+    ) -> asyncio.Future[Optional[V]]:
+        """Add ``key`` to the pending batch, which is dispatched when it is
+        full or when its window ends."""
+
+        future = self.__pending[key] = loop.create_future()
+        if len(self.__pending) >= self.max_batch_size:
+            self.__dispatch()
+        elif self.__timer is None:
+            self.__timer = loop.call_later(self.window, self.__dispatch)
+        return future
+
+    def __dispatch(self) -> None:
+        """Load pending keys in a separate task."""
+
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        batch, self.__pending = self.__pending, {}
+        if not batch:
+            return
+
+        self.__in_flight.update(batch)
+        asyncio.create_task(self.__load(batch), context=contextvars.Context())
+
+    async def __load(self, batch: Dict[K, asyncio.Future[Optional[V]]]) -> None:
+        self.batches += 1
+        self.keys += len(batch)
+        try:
+            values = await self.load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            self.__reject(batch, e)
+        else:
+            self.__resolve(batch, values)
+        finally:
+            self.__release(batch)
+
+    @staticmethod
+    def __resolve(
+        batch: Dict[K, asyncio.Future[Optional[V]]], values: Mapping[K, V]
+    ) -> None:
+        """Set values of the batch, ``None`` for missing keys."""
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+    @staticmethod
+    def __reject(batch: Dict[K, asyncio.Future[Optional[V]]], error: Exception) -> None:
+        """Raise the error of ``load_many`` to all callers of the batch."""
+
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def __release(self, batch: Dict[K, asyncio.Future[Optional[V]]]) -> None:
+        """Let next loads of the keys of the batch start a new batch."""
+
+        for key, future in batch.items():
+            if self.__in_flight.get(key) is future:
+                del self.__in_flight[key]
+
+    def __reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.__loop = loop
+        self.__pending = {}
+        self.__in_flight = {}
+        self.__timer = None
@@ -0,0 +1,169 @@
+"""Handlers of log records in batches on a background thread."""
+
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
+
+__all__ = ["BatchQueueHandler", "BatchQueueListener", "BatchRotatingFileHandler"]
+
+
+class BatchQueueHandler(QueueHandler):
+    """Queue handler which puts records to the queue as they are.
+
+    ``QueueHandler`` formats the message and copies the record, so it can
+    be pickled. Records of ``BatchQueueListener`` stay in the process, so
+    the message is formatted by handlers of the listener, on its thread.
+
+    With ``listener``, the handler starts it on the first record and stops
+    it when the handler is closed, which ``logging`` does at exit. A forked
+    child process has no thread of the listener, so the child starts it
+    again on a new queue, and records of the parent are left to the parent.
+
+    Notes:
+        Arguments of the message are formatted later, so they must not be
+        changed after they are logged.
+    """
+
+    #: Optional[BatchQueueListener]: Listener of the queue, started lazily.
+    listener: Optional["BatchQueueListener"]
+
+    def __init__(
+        self,
+        records: queue.SimpleQueue[logging.LogRecord],
+        listener: Optional["BatchQueueListener"] = None,
+    ):
+        super().__init__(records)
+        self.listener = listener
+        self.__started = False
+        if listener is not None:
+            os.register_at_fork(after_in_child=self.__after_fork)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Records are emitted under the lock of the handler, so the listener
+        # is started once.
+        if self.listener is not None and not self.__started:
+            self.listener.start()
+            self.__started = True
+        super().enqueue(record)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self.listener is not None and self.__started:
+                self.listener.stop()
+                self.__started = False
+        finally:
+            self.release()
+        super().close()
+
+    def __after_fork(self) -> None:
+        self.queue = queue.SimpleQueue()
+        if self.listener is not None:
+            self.listener.queue = self.queue
+        self.__started = False
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler which flushes the file only when ``flush`` is
+    called, not after each record.
+
+    Records are written to the buffer of the file, so a batch of them costs
+    one write of the file when ``BatchQueueListener`` flushes it.
+    """
+
+    __emitting = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.__emitting = True
+        try:
+            super().emit(record)
+        finally:
+            self.__emitting = False
+
+    def flush(self) -> None:
+        if not self.__emitting:
+            super().flush()
+
+
+class BatchQueueListener(QueueListener):
+    """Queue listener which handles records in batches.
+
+    The thread of the listener waits for a record, then takes up to
+    ``batch_size`` records which are already in the queue, handles them and
+    flushes its handlers once per batch.
+
+    Examples:
+        ::
+
+            >>> records = queue.SimpleQueue()
+            >>> listener = BatchQueueListener(
+            ...     records,
+            ...     BatchRotatingFileHandler("app.log", delay=True),
+            ...     batch_size=100,
+            ... )
+            >>> handler = BatchQueueHandler(records, listener=listener)
+            >>> logging.getLogger("app").addHandler(handler)
+    """
+
+    #: int: Maximum number of records handled before handlers are flushed.
+    batch_size: int
+    #: None: Record which stops the thread, set by ``QueueListener``.
+    _sentinel: None
+
+    def __init__(
+        self,
+        records: queue.SimpleQueue[logging.LogRecord],
+        *handlers: logging.Handler,
+        batch_size: int = 100,
+        respect_handler_level: bool = True,
+    ):
+        super().__init__(
+            records,
+            *handlers,
+            respect_handler_level=respect_handler_level,
+        )
+        self.batch_size = batch_size
+
+    def _monitor(self) -> None:
+        """Handle batches of records until the sentinel is dequeued."""
+
+        while self.__handle_batch(self.__dequeue_batch()):
+            pass
+
+    def __handle_batch(self, records: List[logging.LogRecord]) -> bool:
+        """Handle records of the batch and flush handlers once.
+
+        Returns:
+            ``False`` if the batch ends with the sentinel.
+        """
+
+        stop = records[-1] is self._sentinel
+        if stop:
+            records.pop()
+
+        for record in records:
+            self.handle(record)
+        if records:
+            self.__flush()
+        return not stop
+
+    def __flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+    def __dequeue_batch(self) -> List[logging.LogRecord]:
+        """Wait for a record and take records which follow it, up to the
+        sentinel."""
+
+        records = [self.dequeue(True)]
+        while len(records) < self.batch_size and records[-1] is not self._sentinel:
+            try:
+                records.append(self.dequeue(False))
+            except queue.Empty:
+                break
+        return records
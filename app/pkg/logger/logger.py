@@ -1,9 +1,15 @@
 """Methods for working with logger."""
 
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from functools import lru_cache
 from pathlib import Path
 
+from app.pkg.logger.batch import (
+    BatchQueueHandler,
+    BatchQueueListener,
+    BatchRotatingFileHandler,
+)
 from app.pkg.settings import settings
 
 LOG_FORMAT = (
@@ -12,14 +18,15 @@ LOG_FORMAT = (
 )
 
 
-def get_file_handler(file_name: str) -> RotatingFileHandler:
+def get_file_handler(file_name: str) -> BatchRotatingFileHandler:
     """Get file handler for logger."""
 
     Path(file_name).absolute().parent.mkdir(exist_ok=True, parents=True)
-    file_handler = RotatingFileHandler(
+    file_handler = BatchRotatingFileHandler(
         filename=file_name,
         maxBytes=5242880,
         backupCount=10,
+        delay=True,
     )
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
     return file_handler
@@ -33,17 +40,43 @@ def get_stream_handler():
     return stream_handler
 
 
-def get_logger(name):
-    """Get logger."""
+@lru_cache(maxsize=None)
+def get_queue_handler() -> BatchQueueHandler:
+    """Get handler shared by all loggers of the process.
+
+    The handler only puts records to a queue. File and stream handlers
+    format and write them on the thread of ``BatchQueueListener``, which is
+    started by the first record of the process, also of a forked one, and
+    stopped at exit. The log file is opened by the first write, so import
+    of modules with loggers starts no thread and opens no file.
+    """
 
-    logger = logging.getLogger(name)
     file_path = str(
         Path(
             settings.FOLDER_PATH,
             f"{settings.API_INSTANCE_APP_NAME}.log",
         ).absolute(),
     )
-    logger.addHandler(get_file_handler(file_name=file_path))
-    logger.addHandler(get_stream_handler())
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = BatchQueueListener(
+        records,
+        get_file_handler(file_name=file_path),
+        get_stream_handler(),
+        batch_size=settings.LOGGING_BATCH_SIZE,
+    )
+    return BatchQueueHandler(records, listener=listener)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get logger.
+
+    The shared queue handler is attached once, however many times the
+    logger is requested.
+    """
+
+    logger = logging.getLogger(name)
+    handler = get_queue_handler()
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
     logger.setLevel(settings.LOGGING_LEVEL.upper())
     return logger
@@ -1,23 +1,53 @@
 """Business models."""
 
 from app.pkg.models.app.healthcheck import HEALTHCHECK_STATUS
+from app.pkg.models.app.statistics import (
+    BatchLoaderStatistics,
+    CacheStatistics,
+    HotUser,
+    HotUsersResponse,
+    PreparedStatementsStatistics,
+    StatisticsResponse,
+)
 from app.pkg.models.app.users import (
     CreateUserCommand,
+    CreateUserResult,
+    CreateUsersBatchResponse,
     DeleteUserCommand,
+    ReadManyUsersQuery,
+    ReadManyUsersResponse,
     ReadUserQuery,
+    ReadUsersPageQuery,
     UpdateUserCommandPayload,
     UpdateUserCommand,
     User,
+    UserProjectionQuery,
     UserResponse,
+    UsersPageCursor,
+    UsersPageResponse,
 )
 
 __all__ = (
     "User",
     "UserResponse",
+    "UserProjectionQuery",
     "ReadUserQuery",
+    "ReadManyUsersQuery",
+    "ReadManyUsersResponse",
+    "ReadUsersPageQuery",
+    "UsersPageCursor",
+    "UsersPageResponse",
     "CreateUserCommand",
+    "CreateUserResult",
+    "CreateUsersBatchResponse",
     "UpdateUserCommandPayload",
     "UpdateUserCommand",
     "DeleteUserCommand",
     "HEALTHCHECK_STATUS",
+    "BatchLoaderStatistics",
+    "CacheStatistics",
+    "HotUser",
+    "HotUsersResponse",
+    "PreparedStatementsStatistics",
+    "StatisticsResponse",
 )
@@ -0,0 +1,85 @@
+"""Models for runtime statistics of the worker process."""
+
+from typing import List
+
+from pydantic import Field, NonNegativeInt, StrictStr
+
+from app.pkg.models.base import BaseModel
+
+__all__ = [
+    "BatchLoaderStatistics",
+    "CacheStatistics",
+    "HotUser",
+    "HotUsersResponse",
+    "PreparedStatementsStatistics",
+    "StatisticsResponse",
+]
+
+
+class PreparedStatementsStatistics(BaseModel):
+    prepared: NonNegativeInt = Field(
+        description="Statements prepared on open connections",
+        example=12,
+    )
+    hits: NonNegativeInt = Field(
+        description="Executions of already prepared statements",
+        example=1000,
+    )
+    misses: NonNegativeInt = Field(
+        description="Executions that prepared the statement first",
+        example=12,
+    )
+
+
+class BatchLoaderStatistics(BaseModel):
+    loads: NonNegativeInt = Field(description="Reads of single keys", example=1000)
+    coalesced: NonNegativeInt = Field(
+        description="Reads that joined a pending read of the same key",
+        example=200,
+    )
+    batches: NonNegativeInt = Field(description="Queries of batches", example=40)
+    keys: NonNegativeInt = Field(description="Keys read by all queries", example=800)
+
+
+class CacheStatistics(BaseModel):
+    size: NonNegativeInt = Field(description="Entries in the cache", example=900)
+    hits: NonNegativeInt = Field(
+        description="Lookups that found a live entry",
+        example=10000,
+    )
+    misses: NonNegativeInt = Field(
+        description="Lookups that found no entry or an expired one",
+        example=1000,
+    )
+    evictions: NonNegativeInt = Field(
+        description="Entries removed to free space for new ones",
+        example=100,
+    )
+    rejections: NonNegativeInt = Field(
+        description="Entries not stored by the admission policy",
+        example=500,
+    )
+
+
+class HotUser(BaseModel):
+    id: StrictStr = Field(
+        description="User's id",
+        example="9821d845-faed-4316-b68f-ee2ea5e79821",
+    )
+    reads: NonNegativeInt = Field(
+        description="Estimate of recent reads, halved periodically",
+        example=120,
+    )
+
+
+# Used to be sent to WEB
+class StatisticsResponse(BaseModel):
+    prepared_statements: PreparedStatementsStatistics
+    users_loader: BatchLoaderStatistics
+    users_cache: CacheStatistics
+    users_negative_cache: CacheStatistics
+
+
+# Used to be sent to WEB
+class HotUsersResponse(BaseModel):
+    users: List[HotUser] = Field(description="Users, most frequently read first")
@@ -1,17 +1,28 @@
 """Models for users."""
 
+import base64
+import binascii
 import datetime
+import json
 
-from typing import Optional
-from pydantic import Field, StrictStr
+from typing import List, Optional, Sequence, Tuple, Union
+from pydantic import Field, PositiveInt, StrictStr, validator
 
 from app.pkg.models.base import BaseModel
 
 __all__ = [
     "User",
     "UserResponse",
+    "UsersPageResponse",
+    "ReadManyUsersResponse",
+    "UsersPageCursor",
+    "CreateUserResult",
+    "CreateUsersBatchResponse",
     "CreateUserCommand",
+    "UserProjectionQuery",
     "ReadUserQuery",
+    "ReadUsersPageQuery",
+    "ReadManyUsersQuery",
     "UpdateUserCommandPayload",
     "UpdateUserCommand",
     "DeleteUserCommand",
@@ -60,14 +71,173 @@ class UserResponse(BaseModel):
     username: StrictStr = UserFields.username
     created_at: datetime.datetime = UserFields.created_at
 
+    def to_cache(self) -> bytes:
+        """Encode the user for a cache shared by worker processes.
+
+        ``created_at`` is kept in ISO format, so its microseconds and UTC
+        offset are decoded as they are.
+        """
+
+        return json.dumps(
+            [self.id, self.username, self.created_at.isoformat()],
+            separators=(",", ":"),
+        ).encode()
+
+    @classmethod
+    def from_cache(cls, raw: bytes) -> "UserResponse":
+        """Decode the user encoded by ``to_cache``.
+
+        The user was valid when it was encoded, so it is not validated
+        again.
+        """
+
+        id_, username, created_at = json.loads(raw)
+        return cls.construct(
+            id=id_,
+            username=username,
+            created_at=datetime.datetime.fromisoformat(created_at),
+        )
+
+
+class UsersPageResponse(BaseModel):
+    users: List[UserResponse] = Field(description="Users of the page")
+    next_cursor: Optional[StrictStr] = Field(
+        default=None,
+        description="Cursor of the next page, absent on the last page",
+        example=(
+            "WyIyMDI0LTEyLTAxVDE1OjMwOjAwLjEwMDAwMCIsICI5ODIxZDg0NS1mYWVkLTQzMTYt"
+            "YjY4Zi1lZTJlYTVlNzk4MjEiXQ"
+        ),
+    )
+
+
+class ReadManyUsersResponse(BaseModel):
+    users: List[UserResponse] = Field(description="Found users in request order")
+    not_found: List[StrictStr] = Field(
+        description="Ids of users that were not found",
+        example=["9821d845-faed-4316-b68f-ee2ea5e79821"],
+    )
+
+
+class CreateUserResult(BaseModel):
+    user: Optional[UserResponse] = Field(
+        default=None,
+        description="Created user, absent if the user was not created",
+    )
+    error: Optional[StrictStr] = Field(
+        default=None,
+        description="Reason why the user was not created",
+        example="Username is already taken.",
+    )
+
+
+class CreateUsersBatchResponse(BaseModel):
+    results: List[CreateUserResult] = Field(
+        description="Results in the same order as users of the request",
+    )
+
+
+class UsersPageCursor(BaseModel):
+    """Position of the last user of a page in ``(created_at, id)`` order."""
+
+    created_at: datetime.datetime = UserFields.created_at
+    id: StrictStr = UserFields.id
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque url-safe token."""
+
+        raw = json.dumps([self.created_at.isoformat(), self.id]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "UsersPageCursor":
+        """Decode the token made by ``encode``.
+
+        Raises:
+            ValueError: The token is malformed.
+        """
+
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            created_at, id_ = json.loads(raw)
+            return cls(
+                created_at=datetime.datetime.fromisoformat(created_at),
+                id=id_,
+            )
+        except (binascii.Error, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid page cursor: {token!r}") from e
+
 
 # Model queries
 
 
-class ReadUserQuery(BaseModel):
+class UserProjectionQuery(BaseModel):
+    """Query which selects fields of ``UserResponse`` to return."""
+
+    fields: Optional[Tuple[StrictStr, ...]] = Field(
+        default=None,
+        description="Fields of users to return, all fields if not set",
+        example=["id", "username"],
+    )
+
+    # pylint: disable=no-self-argument
+    @validator("fields", pre=True)
+    def __to_response_fields(
+        cls,
+        v: Optional[Union[str, Sequence[str]]],
+    ) -> Optional[Tuple[str, ...]]:
+        """Split comma-separated fields and order them as fields of
+        ``UserResponse``, so equal projections are equal tuples."""
+
+        if v is None:
+            return v
+        if isinstance(v, str):
+            v = v.split(",")
+        if unknown := set(v) - UserResponse.__fields__.keys():
+            raise ValueError(f"Unknown fields of user: {sorted(unknown)}")
+        return tuple(field for field in UserResponse.__fields__ if field in v)
+
+
+class ReadUserQuery(UserProjectionQuery):
     id: StrictStr = UserFields.id
 
 
+class ReadManyUsersQuery(UserProjectionQuery):
+    ids: List[StrictStr] = Field(description="Ids of users", min_items=1)
+
+
+class ReadUsersPageQuery(UserProjectionQuery):
+    cursor: Optional[StrictStr] = Field(
+        default=None,
+        description="Cursor returned with the previous page",
+    )
+    limit: PositiveInt = Field(description="Maximum number of users in the page")
+    created_after: Optional[datetime.datetime] = Field(
+        default=None,
+        description="Only users registered after the date",
+    )
+    created_before: Optional[datetime.datetime] = Field(
+        default=None,
+        description="Only users registered before the date",
+    )
+    username_prefix: Optional[StrictStr] = Field(
+        default=None,
+        description="Only users whose name starts with the prefix",
+    )
+
+    # pylint: disable=no-self-argument
+    @validator("created_after", "created_before")
+    def __to_naive_utc(
+        cls,
+        v: Optional[datetime.datetime],
+    ) -> Optional[datetime.datetime]:
+        """Compare with ``created_at`` that is stored without time zone."""
+
+        if v is None or v.tzinfo is None:
+            return v
+        return v.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
 # Model commands
 
 
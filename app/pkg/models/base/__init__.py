@@ -3,6 +3,7 @@
 All models **must** inherit from them.
 """
 
+from app.pkg.models.base.encoder import encode_json, model_encoder
 from app.pkg.models.base.enum import BaseEnum
 from app.pkg.models.base.exception import BaseAPIException
 from app.pkg.models.base.model import BaseModel, Model
@@ -12,4 +13,6 @@ __all__ = [
     "BaseAPIException",
     "BaseModel",
     "Model",
+    "encode_json",
+    "model_encoder",
 ]
@@ -4,16 +4,40 @@ from __future__ import annotations
 
 import time
 from datetime import date, datetime
-from typing import Any, Dict, List, Tuple, TypeVar
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, TypeVar
+from uuid import UUID
 
 import pydantic
-from jsf import JSF
+from pydantic.fields import (
+    SHAPE_DICT,
+    SHAPE_FROZENSET,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    ModelField,
+)
 
 __all__ = ["BaseModel", "Model"]
 
 Model = TypeVar("Model", bound="BaseModel")
 _T = TypeVar("_T")
 
+#: Cast of a value of ``dict`` of a model, by ``show_secrets``.
+_Cast = Callable[[Any, bool], Any]
+
+#: Tuple[type, ...]: Types whose values ``to_dict`` keeps as they are.
+_PLAIN_TYPES = (str, int, float, Decimal, bytes, UUID, Enum)
+
+#: FrozenSet[int]: Shapes of fields whose values ``to_dict`` keeps as they
+#: are if their items are plain. Sets are never cast, tuples become lists.
+_PLAIN_SHAPES: FrozenSet[int] = frozenset(
+    (SHAPE_SINGLETON, SHAPE_LIST, SHAPE_DICT, SHAPE_MAPPING),
+)
+
 
 class BaseModel(pydantic.BaseModel):
     """Base model for all models."""
@@ -24,13 +48,23 @@ class BaseModel(pydantic.BaseModel):
         values: dict[Any, Any] = None,
         **kwargs,
     ) -> dict[Any, Any]:
-        """Make transfer model to Dict object."""
+        """Make transfer model to Dict object.
+
+        Only fields which need casting by the plan of the model class are
+        cast, values of other fields are taken from ``dict`` as is.
+        """
 
-        values = self.dict(**kwargs).items() if not values else values.items()
-        r = {}
-        for k, v in values:
-            v = self.__cast_values(v=v, show_secrets=show_secrets)
-            r[k] = v
+        if values:
+            return _cast_dict(values, show_secrets=show_secrets)
+
+        r = self.dict(**kwargs)
+        plan = _cast_plan(type(self)) if not kwargs.get("by_alias") else None
+        if plan is None:
+            return _cast_dict(r, show_secrets=show_secrets)
+
+        for k, cast in plan.items():
+            if k in r:
+                r[k] = cast(r[k], show_secrets)
         return r
 
     def delete_attribute(self, attr: pydantic.StrictStr) -> BaseModel:
@@ -39,35 +73,6 @@ class BaseModel(pydantic.BaseModel):
         delattr(self, attr)
         return self
 
-    def __cast_values(self, v: _T, show_secrets: bool, **kwargs) -> _T:
-        """Cast value for dict object."""
-
-        if isinstance(v, (List, Tuple)):
-            return [
-                self.__cast_values(v=ve, show_secrets=show_secrets, **kwargs)
-                for ve in v
-            ]
-
-        elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
-            return self.__cast_secret(v=v, show_secrets=show_secrets)
-
-        elif isinstance(v, Dict) and v:
-            return self.to_dict(show_secrets=show_secrets, values=v, **kwargs)
-
-        elif isinstance(v, datetime):
-            return v.timestamp()
-
-        return v
-
-    @staticmethod
-    def __cast_secret(v, show_secrets: bool) -> pydantic.StrictStr:
-        """Cast secret value to str."""
-
-        if isinstance(v, pydantic.SecretBytes):
-            return v.get_secret_value().decode() if show_secrets else str(v)
-        elif isinstance(v, pydantic.SecretStr):
-            return v.get_secret_value() if show_secrets else str(v)
-
     def migrate(
         self,
         model: type[BaseModel],
@@ -93,6 +98,10 @@ class BaseModel(pydantic.BaseModel):
         if not random_fill:
             return pydantic.parse_obj_as(model, self_dict_model)
 
+        # jsf imports faker and its providers, which take most of the import
+        # time of the app, and only random fill needs it.
+        from jsf import JSF  # pylint: disable=import-outside-toplevel
+
         faker = JSF(model.schema()).generate()
         faker.update(self_dict_model)
         return pydantic.parse_obj_as(model, faker)
@@ -120,3 +129,120 @@ class BaseModel(pydantic.BaseModel):
 
         # Remove trailing whitespace
         anystr_strip_whitespace = True
+
+
+def _cast(v: _T, show_secrets: bool) -> _T:
+    """Cast value for dict object."""
+
+    if isinstance(v, (List, Tuple)):
+        return [_cast(ve, show_secrets) for ve in v]
+
+    elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
+        return _cast_secret(v, show_secrets)
+
+    elif isinstance(v, Dict) and v:
+        return _cast_dict(v, show_secrets=show_secrets)
+
+    elif isinstance(v, datetime):
+        return v.timestamp()
+
+    return v
+
+
+def _cast_dict(values: dict[Any, Any], show_secrets: bool) -> dict[Any, Any]:
+    return {k: _cast(v, show_secrets) for k, v in values.items()}
+
+
+def _cast_secret(v, show_secrets: bool) -> Optional[pydantic.StrictStr]:
+    """Cast secret value to str."""
+
+    if isinstance(v, pydantic.SecretBytes):
+        return v.get_secret_value().decode() if show_secrets else str(v)
+    elif isinstance(v, pydantic.SecretStr):
+        return v.get_secret_value() if show_secrets else str(v)
+    return v
+
+
+def _cast_datetime(v: _T, show_secrets: bool) -> _T:
+    _ = show_secrets
+    return v.timestamp() if isinstance(v, datetime) else v
+
+
+@lru_cache(maxsize=None)
+def _cast_plan(model: type[pydantic.BaseModel]) -> Dict[str, _Cast]:
+    """Casts of fields of ``model`` which ``to_dict`` has to apply.
+
+    Fields of plain types, and lists and dicts of them, are absent from the
+    plan, so their values are kept as they are.
+    """
+
+    plan: Dict[str, _Cast] = {}
+    for name, field in model.__fields__.items():
+        if _is_plain(field, seen=(model,)):
+            continue
+        plan[name] = _field_cast(field)
+    return plan
+
+
+def _field_cast(field: ModelField) -> _Cast:
+    """Cast of values of the field, specialized by its type."""
+
+    if field.sub_fields or field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+        return _cast
+
+    type_ = field.type_
+    if _is_type(type_, (pydantic.SecretStr, pydantic.SecretBytes)):
+        cast = _cast_secret
+    elif _is_type(type_, datetime):
+        cast = _cast_datetime
+    elif _is_type(type_, pydantic.BaseModel):
+        cast = _model_cast(type_)
+    else:
+        return _cast
+
+    if field.shape == SHAPE_LIST:
+        return lambda v, show_secrets: (
+            [cast(ve, show_secrets) for ve in v] if isinstance(v, list) else v
+        )
+    return cast
+
+
+def _model_cast(model: type[pydantic.BaseModel]) -> _Cast:
+    """Cast of a nested model, which ``dict`` has dumped to ``dict``."""
+
+    def cast(v: _T, show_secrets: bool) -> _T:
+        if not isinstance(v, dict) or not v:
+            return v
+
+        r = dict(v)
+        for k, cast_field in _cast_plan(model).items():
+            if k in r:
+                r[k] = cast_field(r[k], show_secrets)
+        return r
+
+    return cast
+
+
+def _is_plain(field: ModelField, seen: Tuple[type, ...]) -> bool:
+    """Check if ``to_dict`` keeps values of the field as they are."""
+
+    if field.shape in (SHAPE_SET, SHAPE_FROZENSET):
+        return True
+    if field.shape not in _PLAIN_SHAPES:
+        return False
+    if field.sub_fields:
+        return all(_is_plain(sub_field, seen) for sub_field in field.sub_fields)
+
+    type_ = field.type_
+    if _is_type(type_, pydantic.BaseModel):
+        # Nested models are dumped to dicts, which are cast by items.
+        return type_ not in seen and all(
+            _is_plain(nested, (*seen, type_)) for nested in type_.__fields__.values()
+        )
+    if _is_type(type_, date):
+        return not issubclass(type_, datetime)
+    return _is_type(type_, _PLAIN_TYPES)
+
+
+def _is_type(type_: Any, types: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, types)
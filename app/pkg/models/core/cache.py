@@ -0,0 +1,19 @@
+"""CachePolicy and CacheBackend models."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["CachePolicy", "CacheBackend"]
+
+
+class CachePolicy(str, BaseEnum):
+    #: Evict the least recently used entry.
+    LRU = "LRU"
+    #: Evict the least frequently used entry.
+    LFU = "LFU"
+
+
+class CacheBackend(str, BaseEnum):
+    #: Cache in memory of each worker process.
+    MEMORY = "MEMORY"
+    #: Cache in shared memory of all worker processes of the node.
+    SHARED_MEMORY = "SHARED_MEMORY"
@@ -29,6 +29,9 @@ class Resource:
         packages:
             Array of packages to which the injector will be available.
             Default: ["app"]
+        modules:
+            Array of modules to which the injector will be available.
+            Default: []
     """
 
     container: Type[_DIContainer]
@@ -37,6 +40,8 @@ class Resource:
 
     packages: List[str] = field(default_factory=lambda: ["app"])
 
+    modules: List[str] = field(default_factory=list)
+
 
 @dataclass(frozen=True)
 class Container:
@@ -49,6 +54,12 @@ class Container:
     #  Default: ["app"]
     packages: List[str] = field(default_factory=lambda: ["app"])
 
+    #: List[str]: Array of modules to which the injector will be available.
+    #  Wiring of a package imports and inspects all of its modules, so the
+    #  modules which use ``Provide`` can be listed instead of their packages.
+    #  Default: []
+    modules: List[str] = field(default_factory=list)
+
 
 class WiredContainer(dict, metaclass=SingletonMeta):
     """Singleton container for store all wired containers."""
@@ -181,7 +192,7 @@ class Containers:
             cont.unwire()
             return cont
 
-        cont.wire(packages=[pkg_name, *container.packages])
+        cont.wire(modules=container.modules, packages=[pkg_name, *container.packages])
 
         container_name = container.container.__name__
 
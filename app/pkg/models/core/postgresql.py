@@ -0,0 +1,12 @@
+"""PostgresqlDriver model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["PostgresqlDriver"]
+
+
+class PostgresqlDriver(str, BaseEnum):
+    #: aiopg on top of psycopg2, text protocol.
+    AIOPG = "aiopg"
+    #: asyncpg, binary protocol with native type decoding.
+    ASYNCPG = "asyncpg"
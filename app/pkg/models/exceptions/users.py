@@ -4,9 +4,14 @@ from fastapi import status
 
 from app.pkg.models.base import BaseAPIException
 
-__all__ = ["UserWasNotFound"]
+__all__ = ["UserWasNotFound", "InvalidPageCursor"]
 
 
 class UserWasNotFound(BaseAPIException):
     status_code = status.HTTP_404_NOT_FOUND
     message = "User was not found."
+
+
+class InvalidPageCursor(BaseAPIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    message = "Page cursor is invalid."
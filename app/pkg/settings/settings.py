@@ -3,13 +3,21 @@
 
 import pathlib
 from functools import lru_cache
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import find_dotenv
 from pydantic import BaseSettings, validator
-from pydantic.types import PositiveInt, SecretStr
-
+from pydantic.types import (
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    SecretStr,
+)
+
+from app.pkg.models.core.cache import CacheBackend, CachePolicy
 from app.pkg.models.core.logger import LoggerLevel
+from app.pkg.models.core.postgresql import PostgresqlDriver
 
 __all__ = ["Settings", "get_settings"]
 
@@ -39,26 +47,52 @@ class PostgreSQL(_Settings):
     POSTGRESQL_PASSWORD: SecretStr
     #: str: Postgresql database name.
     POSTGRESQL_DATABASE_NAME: str
+    #: PostgresqlDriver: Database driver, ``asyncpg`` requires its extra.
+    POSTGRESQL_DRIVER: PostgresqlDriver = PostgresqlDriver.AIOPG
+
+    # --- POOL SETTINGS ---
+    #: NonNegativeInt: Connections opened at startup and kept in the pool.
+    POSTGRESQL_POOL_MIN_SIZE: NonNegativeInt = 5
+    #: PositiveInt: Maximum number of connections in the pool.
+    POSTGRESQL_POOL_MAX_SIZE: PositiveInt = 20
+    #: PositiveFloat: Seconds to wait for a free connection.
+    POSTGRESQL_POOL_ACQUIRE_TIMEOUT: PositiveFloat = 10.0
+    #: float: Seconds after which a connection is reopened. -1 disables it.
+    POSTGRESQL_POOL_MAX_LIFETIME: float = 3600.0
+    #: float: Seconds an idle connection is kept in the pool. -1 disables it.
+    POSTGRESQL_POOL_IDLE_RECYCLE: float = 300.0
+
+    # --- REPLICA SETTINGS ---
+    #: List[str]: Streaming replicas as ``host`` or ``host:port``.
+    POSTGRESQL_REPLICA_HOSTS: List[str] = []
+    #: PositiveFloat: Replay lag in seconds after which a replica is not used.
+    POSTGRESQL_REPLICA_MAX_LAG: PositiveFloat = 5.0
+    #: PositiveFloat: Seconds between replication state checks.
+    POSTGRESQL_REPLICA_CHECK_INTERVAL: PositiveFloat = 1.0
+
+    # pylint: disable=unused-private-member, no-self-argument
+    @validator("POSTGRESQL_POOL_MAX_SIZE")
+    def __check_pool_size(cls, v: PositiveInt, values: dict) -> PositiveInt:
+        """Check that the pool can hold its minimum number of connections."""
+
+        if v < values.get("POSTGRESQL_POOL_MIN_SIZE", 0):
+            raise ValueError(
+                "POSTGRESQL_POOL_MAX_SIZE must not be less than "
+                "POSTGRESQL_POOL_MIN_SIZE",
+            )
+        return v
 
 
 class Logging(_Settings):
     """Logging settings."""
 
     LOGGING_LEVEL: LoggerLevel = LoggerLevel.DEBUG
+    #: PositiveInt: Maximum number of records written before log files are
+    #: flushed.
+    LOGGING_BATCH_SIZE: PositiveInt = 100
+    #: pathlib.Path: Folder of log files, created by the file handler.
     FOLDER_PATH: pathlib.Path = pathlib.Path("./src/logs")
 
-    # pylint: disable=unused-private-member, no-self-argument
-    @validator("FOLDER_PATH")
-    def __create_dir_if_not_exist(
-        cls,
-        v: pathlib.Path,
-    ):
-        """Create directory if not exist."""
-
-        if not v.exists():
-            v.mkdir(exist_ok=True, parents=True)
-        return v
-
 
 class APIServer(_Settings):
     """API settings."""
@@ -68,13 +102,80 @@ class APIServer(_Settings):
     API_INSTANCE_APP_NAME: str = "user_api"
     #: bool: Debug mode flag
     API_DEBUG_MODE: Optional[bool] = False
+    #: PositiveInt: Number of items in a page when it is not requested.
+    API_PAGE_SIZE_DEFAULT: PositiveInt = 100
+    #: PositiveInt: Maximum number of items in a page.
+    API_PAGE_SIZE_MAX: PositiveInt = 1000
+    #: PositiveInt: Maximum number of items in a batch request.
+    API_BATCH_SIZE_MAX: PositiveInt = 10000
+    #: PositiveInt: Maximum number of single reads coalesced into one query.
+    API_LOADER_MAX_BATCH_SIZE: PositiveInt = 100
+    #: NonNegativeFloat: Seconds to collect single reads into one query.
+    API_LOADER_WINDOW: NonNegativeFloat = 0.001
 
     # --- SECURITY SETTINGS ---
     #: SecretStr: Secret key for token auth.
     API_X_API_TOKEN: SecretStr = SecretStr("secret")
 
+    # pylint: disable=unused-private-member, no-self-argument
+    @validator("API_PAGE_SIZE_MAX")
+    def __check_page_size(cls, v: PositiveInt, values: dict) -> PositiveInt:
+        """Check that the default page size is allowed."""
+
+        if v < values.get("API_PAGE_SIZE_DEFAULT", 0):
+            raise ValueError(
+                "API_PAGE_SIZE_MAX must not be less than API_PAGE_SIZE_DEFAULT",
+            )
+        return v
+
 
-class Settings(APIServer, PostgreSQL, Logging):
+class Cache(_Settings):
+    """Cache settings."""
+
+    #: NonNegativeInt: Maximum number of cached users, 0 disables the cache.
+    CACHE_MAX_SIZE: NonNegativeInt = 10000
+    #: PositiveFloat: Seconds a cached user is served without a query.
+    CACHE_TTL: PositiveFloat = 60.0
+    #: NonNegativeFloat: Seconds after expiration a cached user is served
+    #: while one background task reads it again.
+    CACHE_STALE_WHILE_REVALIDATE: NonNegativeFloat = 10.0
+    #: NonNegativeFloat: Seconds after expiration a cached user is served if
+    #: the database is unreachable.
+    CACHE_STALE_IF_ERROR: NonNegativeFloat = 300.0
+    #: CachePolicy: Eviction policy of the cache in memory of the worker.
+    CACHE_POLICY: CachePolicy = CachePolicy.LRU
+    #: CacheBackend: Cache of each worker or one shared by workers of the node.
+    CACHE_BACKEND: CacheBackend = CacheBackend.MEMORY
+    #: pathlib.Path: Prefix of the file of the shared memory cache, followed by
+    #: the geometry of its slots.
+    CACHE_SHARED_MEMORY_PATH: pathlib.Path = pathlib.Path("/dev/shm/users-cache")
+    #: PositiveInt: Bytes of a shared memory cache slot, which holds one user,
+    #: at least 128.
+    CACHE_SHARED_MEMORY_SLOT_SIZE: PositiveInt = 512
+
+    #: PositiveInt: Counters of each row of the frequency sketch of user ids.
+    CACHE_SKETCH_WIDTH: PositiveInt = 16384
+    #: PositiveInt: Reads between halvings of the frequency sketch.
+    CACHE_SKETCH_SAMPLE_SIZE: PositiveInt = 100000
+    #: PositiveInt: Number of the most frequently read user ids tracked.
+    CACHE_SKETCH_TOP_SIZE: PositiveInt = 100
+    #: NonNegativeInt: Maximum number of ids of missing users, 0 disables it.
+    CACHE_NEGATIVE_MAX_SIZE: NonNegativeInt = 10000
+    #: PositiveFloat: Seconds an id of missing user is answered without a query.
+    CACHE_NEGATIVE_TTL: PositiveFloat = 5.0
+    #: PositiveInt: Bits of the filter of ids missed once, at least 64.
+    CACHE_NEGATIVE_DOORKEEPER_SIZE: PositiveInt = 65536
+    #: PositiveFloat: Seconds between reconnects of the invalidation listener.
+    CACHE_INVALIDATION_RECONNECT_DELAY: PositiveFloat = 1.0
+    #: NonNegativeInt: Maximum number of cached encoded pages of users, 0
+    #: disables the cache.
+    CACHE_RESPONSES_MAX_SIZE: NonNegativeInt = 1000
+    #: PositiveFloat: Seconds a cached page of users is served, bounds its
+    #: staleness while writes of other workers are not delivered.
+    CACHE_RESPONSES_TTL: PositiveFloat = 5.0
+
+
+class Settings(APIServer, PostgreSQL, Logging, Cache):
     """All server settings."""
 
 
@@ -0,0 +1,32 @@
+"""
+add users page index
+"""
+
+from yoyo import step
+
+__depends__ = {"20241202_01_saMXz-create-order-table"}
+
+# Index is built concurrently, which is not allowed in a transaction.
+__transactional__ = False
+
+steps = [
+    step(
+        """
+            update users set created_at = now() where created_at is null;
+            alter table users alter column created_at set not null;
+        """,
+        """
+            alter table users alter column created_at drop not null;
+        """
+    ),
+    step(
+        """
+            create index concurrently if not exists users_created_at_id_active
+            on users (created_at, id)
+            where deleted_at is null;
+        """,
+        """
+            drop index concurrently if exists users_created_at_id_active;
+        """
+    ),
+]
@@ -0,0 +1,18 @@
+"""
+add users invalidation sequence
+"""
+
+from yoyo import step
+
+__depends__ = {"20261018_01_kPq3d-add-users-page-index"}
+
+steps = [
+    step(
+        """
+            create sequence if not exists users_invalidation_seq;
+        """,
+        """
+            drop sequence if exists users_invalidation_seq;
+        """
+    ),
+]
@@ -0,0 +1,108 @@
+"""Report of the cold start time of the app."""
+
+import re
+import subprocess
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from typing import List
+
+#: str: Statement of the cold start of a worker.
+STATEMENT = "import app; app.create_app()"
+
+#: float: Seconds the cold start of a worker may take.
+BUDGET = 1.0
+
+#: re.Pattern: Line of ``-X importtime`` output.
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """Time of import of one module, in seconds."""
+
+    #: str: Name of the module.
+    module: str
+    #: float: Time of the module itself.
+    own: float
+    #: float: Time of the module with its imports.
+    cumulative: float
+    #: int: Depth in the tree of imports, 0 for top level imports.
+    depth: int
+
+
+def measure(statement: str = STATEMENT) -> List[ImportTime]:
+    """Run ``statement`` in a new interpreter with ``-X importtime``.
+
+    Returns:
+        Import times of all modules imported by ``statement``, in order of
+        completion.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in process.stderr.splitlines():
+        if match := _LINE.match(line):
+            own_us, cumulative_us, indent, module = match.groups()
+            times.append(
+                ImportTime(
+                    module=module,
+                    own=int(own_us) / 1e6,
+                    cumulative=int(cumulative_us) / 1e6,
+                    depth=len(indent) // 2,
+                ),
+            )
+    return times
+
+
+def total(times: List[ImportTime]) -> float:
+    """Import time of top level imports, in seconds."""
+
+    return sum(time.cumulative for time in times if time.depth == 0)
+
+
+def parse_cli_args():
+    """Parse cli arguments."""
+
+    parser = ArgumentParser(description="Report import time of the app")
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of the slowest modules to report",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=BUDGET,
+        help="Seconds of import time, exit with 1 when exceeded",
+    )
+    args = parser.parse_args()
+
+    return args
+
+
+def cli():
+    """Print the slowest modules and check total import time."""
+
+    args = parse_cli_args()
+
+    times = measure()
+    slowest = sorted(times, key=lambda item: item.cumulative, reverse=True)
+    for time in slowest[: args.top]:
+        print(f"{time.cumulative:8.3f}s {time.own:8.3f}s  {time.module}")
+
+    spent = total(times)
+    print(f"total: {spent:.3f}s, budget: {args.budget:.3f}s")
+    if spent > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,31 @@
+"""Module for testing wiring of modules which use the containers."""
+
+import ast
+import pathlib
+from typing import Set
+
+import app
+from app.configuration import WIRED_MODULES
+
+#: Set[str]: Markers of dependency_injector which are resolved by wiring.
+MARKERS = {"Provide", "Provider", "Closing"}
+
+
+def __modules_with_markers() -> Set[str]:
+    root = pathlib.Path(app.__file__).parent.parent
+    modules = set()
+    for path in pathlib.Path(app.__file__).parent.rglob("*.py"):
+        tree = ast.parse(path.read_text(), filename=str(path))
+        if any(
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in MARKERS
+            for node in ast.walk(tree)
+        ):
+            modules.add(".".join(path.relative_to(root).with_suffix("").parts))
+    return modules
+
+
+def test_only_modules_with_markers_are_wired():
+    # Each wired module is scanned at startup, so the list holds no others.
+    assert __modules_with_markers() == set(WIRED_MODULES)
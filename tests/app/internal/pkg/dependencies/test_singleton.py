@@ -0,0 +1,93 @@
+"""Module for testing dependency which resolves a singleton once."""
+
+import sys
+import time
+
+import pytest
+from dependency_injector import containers, providers
+from dependency_injector.wiring import Provide, Provider, inject
+
+from app.internal.pkg.dependencies.singleton import SingletonDependency
+
+
+class _Service:
+    pass
+
+
+class _Container(containers.DeclarativeContainer):
+    factory = providers.Factory(_Service)
+    singleton = providers.Singleton(_Service)
+
+
+@inject
+def __resolve_factory(service: _Service = Provide[_Container.factory]) -> _Service:
+    return service
+
+
+@inject
+def __resolve_singleton(
+    provider: providers.Provider = Provider[_Container.singleton],
+) -> providers.Provider:
+    return provider
+
+
+@pytest.fixture()
+def container():
+    container = _Container()
+    container.wire(modules=[sys.modules[__name__]])
+    yield container
+    container.unwire()
+
+
+async def test_resolves_once():
+    calls = []
+
+    def resolve() -> providers.Provider:
+        calls.append(1)
+        return providers.Singleton(_Service)
+
+    dependency = SingletonDependency(resolve)
+
+    first = await dependency()
+    second = await dependency()
+
+    assert first is second
+    assert len(calls) == 1
+
+
+async def test_resolves_wired_singleton(container):
+    dependency = SingletonDependency(__resolve_singleton)
+
+    assert await dependency() is container.singleton()
+
+
+async def test_follows_override(container):
+    dependency = SingletonDependency(__resolve_singleton)
+    service = await dependency()
+
+    with container.singleton.override(providers.Object(fake := _Service())):
+        assert await dependency() is fake
+
+    assert await dependency() is service
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_dependency_injection_overhead(container):
+    requests = 100_000
+    dependency = SingletonDependency(__resolve_singleton)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        __resolve_factory()
+    before = requests / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await dependency()
+    after = requests / (time.perf_counter() - start)
+
+    assert after > before, (
+        f"resolutions per second: @inject with Factory {before:.0f}, "
+        f"SingletonDependency {after:.0f}"
+    )
@@ -0,0 +1,82 @@
+"""Module for testing routes which trust models of their endpoints."""
+
+import datetime
+import json
+from typing import Union
+
+from fastapi import APIRouter, status
+from fastapi.responses import Response
+
+from app.internal.pkg.routes.trusted_response import TrustedResponseRoute
+from app.pkg import models
+
+
+def __user() -> models.UserResponse:
+    return models.UserResponse(
+        id="1",
+        username="user",
+        created_at=datetime.datetime.fromtimestamp(1733067000),
+    )
+
+
+def __route(router: APIRouter, path: str = "/"):
+    return next(route for route in router.routes if route.path == path)
+
+
+async def test_encodes_declared_model_without_validation():
+    router = APIRouter(route_class=TrustedResponseRoute)
+
+    @router.post(
+        "/",
+        status_code=status.HTTP_201_CREATED,
+        response_model=models.UserResponse,
+    )
+    async def create():
+        return __user()
+
+    response = await __route(router).endpoint()
+
+    assert isinstance(response, Response)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert json.loads(response.body) == {
+        "id": "1",
+        "username": "user",
+        "created_at": 1733067000,
+    }
+
+
+async def test_encodes_model_of_declared_union():
+    router = APIRouter(route_class=TrustedResponseRoute)
+
+    @router.get(
+        "/",
+        response_model=Union[models.ReadManyUsersResponse, models.UsersPageResponse],
+    )
+    async def read():
+        return models.UsersPageResponse(users=[__user()])
+
+    response = await __route(router).endpoint()
+
+    assert json.loads(response.body)["next_cursor"] is None
+
+
+async def test_returns_other_values_as_is():
+    router = APIRouter(route_class=TrustedResponseRoute)
+
+    @router.get("/", response_model=models.UserResponse)
+    async def read():
+        return {"id": "1", "username": "user", "created_at": 1733067000}
+
+    @router.get(
+        "/excluded",
+        response_model=models.UserResponse,
+        response_model_exclude={"created_at"},
+    )
+    async def read_excluded():
+        return __user()
+
+    assert isinstance(await __route(router).endpoint(), dict)
+    assert isinstance(
+        await __route(router, "/excluded").endpoint(),
+        models.UserResponse,
+    )
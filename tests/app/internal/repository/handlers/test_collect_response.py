@@ -0,0 +1,146 @@
+"""Module for testing conversion of query results to models."""
+
+import datetime
+import time
+from typing import List, Optional
+
+import pydantic
+import pytest
+
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.pkg import models
+from app.pkg.models.base import BaseModel
+from app.pkg.models.exceptions.repository import EmptyResult
+
+ITERATIONS = 20
+
+
+class __Blob(BaseModel):
+    id: pydantic.StrictStr
+    content: Optional[bytes] = None
+
+
+def __rows(count: int) -> List[dict]:
+    return [
+        {
+            "id": str(i),
+            "username": f"user-{i}",
+            "created_at": datetime.datetime(2024, 12, 1),
+        }
+        for i in range(count)
+    ]
+
+
+async def __legacy_convert(rows: List[dict]) -> List[models.UserResponse]:
+    """Conversion which resolved the annotation on every call."""
+
+    annotation = List[models.UserResponse]
+    converted = []
+    if str(annotation).replace("typing.", "").startswith("List"):
+        for row in rows.copy():
+            for key, value in row.items():
+                if isinstance(value, memoryview):
+                    row[key] = value.tobytes()
+            converted.append(row)
+    return pydantic.parse_obj_as(annotation, converted)
+
+
+async def __rows_per_second(read_all, rows: List[dict]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await read_all(rows)
+    return ITERATIONS * len(rows) / (time.perf_counter() - started_at)
+
+
+async def test_converts_row_to_model():
+    @collect_response
+    async def read() -> models.UserResponse:
+        return __rows(1)[0]
+
+    user = await read()
+
+    assert user == models.UserResponse(
+        id="0",
+        username="user-0",
+        created_at=datetime.datetime(2024, 12, 1),
+    )
+
+
+async def test_converts_rows_to_list_of_models():
+    @collect_response
+    async def read_all() -> List[models.UserResponse]:
+        return __rows(3)
+
+    users = await read_all()
+
+    assert [user.id for user in users] == ["0", "1", "2"]
+
+
+async def test_converts_memoryview_of_bytes_fields():
+    @collect_response
+    async def read() -> __Blob:
+        return {"id": "1", "content": memoryview(b"blob")}
+
+    blob = await read()
+
+    assert blob.content == b"blob"
+
+
+async def test_trusted_constructs_model_of_known_columns():
+    @collect_response(trusted=True)
+    async def read() -> models.UserResponse:
+        return {**__rows(1)[0], "username": " user ", "password": "secret"}
+
+    user = await read()
+
+    assert user.username == " user "
+    assert not hasattr(user, "password")
+    assert user.dict() == {
+        "id": "0",
+        "username": " user ",
+        "created_at": datetime.datetime(2024, 12, 1),
+    }
+
+
+async def test_trusted_converts_memoryview_of_bytes_fields():
+    @collect_response(trusted=True)
+    async def read_all() -> List[__Blob]:
+        return [{"id": "1", "content": memoryview(b"blob")}, {"id": "2"}]
+
+    blobs = await read_all()
+
+    assert [blob.content for blob in blobs] == [b"blob", None]
+
+
+async def test_empty_result_raises():
+    @collect_response
+    async def read_all() -> List[models.UserResponse]:
+        return []
+
+    with pytest.raises(EmptyResult):
+        await read_all()
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [1, 100, 10_000])
+async def test_benchmark_compiled_converter(count: int):
+    @collect_response
+    async def read_all(rows: List[dict]) -> List[models.UserResponse]:
+        return rows
+
+    @collect_response(trusted=True)
+    async def read_all_trusted(rows: List[dict]) -> List[models.UserResponse]:
+        return rows
+
+    rows = __rows(count)
+    before = await __rows_per_second(__legacy_convert, rows)
+    after = await __rows_per_second(read_all, rows)
+    trusted = await __rows_per_second(read_all_trusted, rows)
+
+    assert trusted > after > before, (
+        f"{count} rows, per call: {before:.0f} rows/s, "
+        f"compiled: {after:.0f} rows/s, trusted: {trusted:.0f} rows/s"
+    )
@@ -0,0 +1,39 @@
+"""Module for testing create_many method of user repository."""
+
+import pytest
+
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg import models
+
+
+@pytest.mark.postgresql
+async def test_create_many(
+    user_repository: UserRepository,
+    user_generator,
+):
+    cmds = [user_generator().migrate(models.CreateUserCommand) for _ in range(3)]
+
+    users = await user_repository.create_many(cmds=cmds)
+
+    assert [user.username for user in users] == [cmd.username for cmd in cmds]
+
+
+@pytest.mark.postgresql
+async def test_create_many_skips_taken_usernames(
+    user_repository: UserRepository,
+    user_generator,
+    user_inserter,
+):
+    taken, _ = await user_inserter()
+    new = user_generator().migrate(models.CreateUserCommand)
+    cmds = [
+        models.CreateUserCommand(username=taken.username, password="password"),
+        new,
+        models.CreateUserCommand(username=new.username, password="password"),
+    ]
+
+    users = await user_repository.create_many(cmds=cmds)
+
+    assert users[0] is None
+    assert users[1].username == new.username
+    assert users[2] is None
@@ -0,0 +1,34 @@
+"""Module for testing export method of user repository."""
+
+import pytest
+
+from app.internal.repository.postgresql.users import UserRepository
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_export(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    created = [(await user_inserter())[0] for _ in range(5)]
+
+    rows = [row async for row in user_repository.export(chunk_size=2)]
+
+    assert [row["id"] for row in rows] == [user.id for user in created]
+
+
+@pytest.mark.postgresql
+async def test_export_stops_when_closed(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    for _ in range(3):
+        await user_inserter()
+
+    rows = user_repository.export(chunk_size=1)
+    first = await rows.__anext__()
+    await rows.aclose()
+
+    exported = [row async for row in user_repository.export(chunk_size=1)]
+    assert exported[0] == first
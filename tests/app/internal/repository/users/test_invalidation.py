@@ -0,0 +1,257 @@
+"""Module for testing invalidation of cached users across workers."""
+
+import asyncio
+import contextlib
+
+import pytest
+from dependency_injector.wiring import Provide, inject
+
+from app.internal.repository.postgresql.invalidation import (
+    UsersInvalidationListener,
+    invalidation_origin,
+)
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg import models
+from app.pkg.cache import MemoryCache, Version
+from app.pkg.connectors import Connectors
+from app.pkg.connectors.postgresql import Postgresql
+
+#: str: Origin of another worker.
+OTHER_ORIGIN = "other"
+
+
+async def __wait_for(condition, timeout: float = 5.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture()
+@inject
+async def postgresql(
+    postgresql: Postgresql = Provide[Connectors.postgresql],
+) -> Postgresql:
+    return postgresql
+
+
+@pytest.fixture()
+async def users_cache() -> MemoryCache:
+    return MemoryCache(max_size=100, ttl=60)
+
+
+@pytest.fixture()
+async def listener(
+    postgresql: Postgresql,
+    users_cache: MemoryCache,
+) -> UsersInvalidationListener:
+    listener = UsersInvalidationListener(
+        users_cache=users_cache,
+        origin=OTHER_ORIGIN,
+    )
+    await listener.start(postgresql)
+    yield listener
+    await listener.stop()
+
+
+@pytest.mark.postgresql
+@pytest.mark.parametrize("write", ["update", "delete"])
+async def test_write_evicts_user(
+    user_repository: UserRepository,
+    user_generator,
+    users_cache: MemoryCache,
+    listener: UsersInvalidationListener,
+    write: str,
+):
+    user = await user_repository.create(
+        cmd=user_generator().migrate(models.CreateUserCommand),
+    )
+    users_cache.set(user.id, user)
+
+    if write == "update":
+        await user_repository.update(
+            cmd=models.UpdateUserCommand(id=user.id, password="new"),
+        )
+    else:
+        await user_repository.delete(cmd=models.DeleteUserCommand(id=user.id))
+
+    await __wait_for(lambda: users_cache.get(user.id) is None)
+    assert listener.position is not None
+
+
+@pytest.mark.postgresql
+async def test_own_write_keeps_user_cached(
+    postgresql: Postgresql,
+    user_repository: UserRepository,
+    user_generator,
+    users_cache: MemoryCache,
+):
+    users_version = Version()
+    listener = UsersInvalidationListener(
+        users_cache=users_cache,
+        users_version=users_version,
+    )
+    user = await user_repository.create(
+        cmd=user_generator().migrate(models.CreateUserCommand),
+    )
+    await listener.start(postgresql)
+    try:
+        position, version = listener.position, users_version.value
+        user = await user_repository.update(
+            cmd=models.UpdateUserCommand(id=user.id, password="new"),
+        )
+        users_cache.set(user.id, user)
+
+        await __wait_for(lambda: listener.position > position)
+        assert users_cache.get(user.id) is user
+        assert users_version.value == version
+    finally:
+        await listener.stop()
+
+
+@pytest.mark.parametrize(
+    "origin, evicted",
+    [(OTHER_ORIGIN, True), (invalidation_origin(), False)],
+)
+async def test_invalidate_skips_own_messages(
+    users_cache: MemoryCache,
+    origin: str,
+    evicted: bool,
+):
+    users_version = Version()
+    listener = UsersInvalidationListener(
+        users_cache=users_cache,
+        users_version=users_version,
+    )
+    users_cache.set("user:1", object())
+
+    listener._UsersInvalidationListener__invalidate(f"7:{origin}:user:1")
+
+    assert (users_cache.get("user:1") is None) is evicted
+    assert (users_version.value > 0) is evicted
+    assert listener.position == 7
+
+
+@pytest.mark.postgresql
+async def test_reconnect_clears_cache(
+    postgresql: Postgresql,
+    users_cache: MemoryCache,
+):
+    users_version = Version()
+    listener = UsersInvalidationListener(
+        users_cache=users_cache,
+        users_version=users_version,
+    )
+    await listener.start(postgresql)
+    await listener.stop()
+
+    users_cache.set("user", object())
+    version = users_version.value
+
+    await listener.start(postgresql)
+    try:
+        assert users_cache.get("user") is None
+        assert users_version.value > version
+    finally:
+        await listener.stop()
+
+
+class _Connection:
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    async def listen(self, channel):
+        pass
+
+    async def fetchone(self, query):
+        return {"position": 0}
+
+    async def notifications(self):
+        for payload in self.payloads:
+            yield payload
+        await asyncio.Event().wait()
+
+
+class _Postgresql:
+    def __init__(self, *payloads):
+        self.payloads = payloads
+        self.connects = 0
+
+    @contextlib.asynccontextmanager
+    async def connect(self):
+        self.connects += 1
+        yield _Connection(self.payloads if self.connects == 1 else ())
+
+
+async def test_malformed_message_reconnects_listener(users_cache: MemoryCache):
+    postgresql = _Postgresql("malformed")
+    listener = UsersInvalidationListener(users_cache=users_cache, reconnect_delay=0)
+    await listener.start(postgresql)
+    try:
+        await __wait_for(lambda: postgresql.connects == 2)
+    finally:
+        await listener.stop()
+
+
+@pytest.mark.postgresql
+@pytest.mark.parametrize("write", ["create", "create_many"])
+async def test_create_bumps_version_and_forgets_missing_user(
+    postgresql: Postgresql,
+    user_repository: UserRepository,
+    user_generator,
+    users_cache: MemoryCache,
+    write: str,
+):
+    users_negative_cache = MemoryCache(max_size=100, ttl=60)
+    users_version = Version()
+    listener = UsersInvalidationListener(
+        users_cache=users_cache,
+        users_negative_cache=users_negative_cache,
+        users_version=users_version,
+        origin=OTHER_ORIGIN,
+    )
+    await listener.start(postgresql)
+    try:
+        cmd = user_generator().migrate(models.CreateUserCommand)
+        if write == "create":
+            user = await user_repository.create(cmd=cmd)
+        else:
+            [user] = await user_repository.create_many(cmds=[cmd])
+        users_negative_cache.set(user.id, True)
+
+        await __wait_for(lambda: users_negative_cache.get(user.id) is None)
+        assert users_version.value > 0
+    finally:
+        await listener.stop()
+
+
+@pytest.mark.postgresql
+@pytest.mark.parametrize("write", ["create", "create_many"])
+async def test_own_create_keeps_version(
+    postgresql: Postgresql,
+    user_repository: UserRepository,
+    user_generator,
+    users_cache: MemoryCache,
+    write: str,
+):
+    users_negative_cache = MemoryCache(max_size=100, ttl=60)
+    users_version = Version()
+    listener = UsersInvalidationListener(
+        users_cache=users_cache,
+        users_negative_cache=users_negative_cache,
+        users_version=users_version,
+    )
+    await listener.start(postgresql)
+    try:
+        position, version = listener.position, users_version.value
+        cmd = user_generator().migrate(models.CreateUserCommand)
+        if write == "create":
+            user = await user_repository.create(cmd=cmd)
+        else:
+            [user] = await user_repository.create_many(cmds=[cmd])
+        users_cache.set(user.id, user)
+
+        await __wait_for(lambda: listener.position > position)
+        assert users_cache.get(user.id) is user
+        assert users_version.value == version
+    finally:
+        await listener.stop()
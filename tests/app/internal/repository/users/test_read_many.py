@@ -0,0 +1,45 @@
+"""Module for testing read_many method of user repository."""
+
+import pytest
+
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+@pytest.mark.postgresql
+async def test_read_many(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    created = [(await user_inserter())[0] for _ in range(3)]
+
+    users = await user_repository.read_many(
+        query=models.ReadManyUsersQuery(
+            ids=[user.id for user in created] + ["not_existing_id"],
+        ),
+    )
+
+    assert sorted(users, key=lambda u: u.id) == sorted(created, key=lambda u: u.id)
+
+
+@pytest.mark.postgresql
+async def test_read_many_empty(user_repository: UserRepository):
+    with pytest.raises(EmptyResult):
+        await user_repository.read_many(
+            query=models.ReadManyUsersQuery(ids=["not_existing_id"]),
+        )
+
+
+@pytest.mark.postgresql
+async def test_read_many_fields(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    created, _ = await user_inserter()
+
+    [user] = await user_repository.read_many(
+        query=models.ReadManyUsersQuery(ids=[created.id], fields="id,username"),
+    )
+
+    assert user.dict() == {"id": created.id, "username": created.username}
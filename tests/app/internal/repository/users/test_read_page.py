@@ -0,0 +1,73 @@
+"""Module for testing read_page method of user repository."""
+
+import pytest
+
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+USERS = 5
+
+
+async def __read_all_pages(
+    user_repository: UserRepository,
+    query: models.ReadUsersPageQuery,
+):
+    users, after = [], None
+    while True:
+        try:
+            page = await user_repository.read_page(query=query, after=after)
+        except EmptyResult:
+            return users
+        users.extend(page)
+        after = models.UsersPageCursor(created_at=page[-1].created_at, id=page[-1].id)
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_page(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    created = [(await user_inserter(username=f"page_{i}"))[0] for i in range(USERS)]
+
+    users = await __read_all_pages(
+        user_repository,
+        models.ReadUsersPageQuery(limit=2, username_prefix="page_"),
+    )
+
+    assert [user.id for user in users] == [user.id for user in created]
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_read_page_created_range(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    created = [(await user_inserter(username=f"range_{i}"))[0] for i in range(USERS)]
+
+    users = await __read_all_pages(
+        user_repository,
+        models.ReadUsersPageQuery(
+            limit=2,
+            username_prefix="range_",
+            created_after=created[0].created_at,
+            created_before=created[-1].created_at,
+        ),
+    )
+
+    assert [user.id for user in users] == [user.id for user in created[1:-1]]
+
+
+@pytest.mark.postgresql
+async def test_read_page_username_prefix_is_not_pattern(
+    user_repository: UserRepository,
+    user_inserter,
+):
+    await user_inserter(username="prefix_user")
+
+    with pytest.raises(EmptyResult):
+        await user_repository.read_page(
+            query=models.ReadUsersPageQuery(limit=1, username_prefix="prefix%"),
+        )
@@ -0,0 +1,83 @@
+"""Module for testing user repository calls inside of unit of work."""
+
+import pytest
+
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    in_unit_of_work,
+    unit_of_work,
+)
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg import models
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+class __Rollback(Exception):
+    """Raised to roll back the unit of work."""
+
+
+@pytest.mark.postgresql
+async def test_unit_of_work_reuses_connection():
+    async with unit_of_work() as uow_conn:
+        assert in_unit_of_work()
+        async with get_connection() as first, get_connection(read_only=True) as second:
+            assert first is uow_conn
+            assert second is uow_conn
+        assert uow_conn.in_transaction()
+
+    assert not in_unit_of_work()
+    assert not uow_conn.in_transaction()
+
+
+@pytest.mark.postgresql
+async def test_unit_of_work_commit(
+    user_repository: UserRepository,
+    user_generator,
+):
+    cmd = user_generator().migrate(models.CreateUserCommand)
+    async with unit_of_work():
+        created_user = await user_repository.create(cmd=cmd)
+        await user_repository.update(
+            cmd=models.UpdateUserCommand(
+                id=created_user.id,
+                username=f"{cmd.username}-new",
+            ),
+        )
+
+    user = await user_repository.read(query=models.ReadUserQuery(id=created_user.id))
+    assert user.username == f"{cmd.username}-new"
+
+
+@pytest.mark.postgresql
+async def test_unit_of_work_rollback(
+    user_repository: UserRepository,
+    user_generator,
+):
+    cmd = user_generator().migrate(models.CreateUserCommand)
+    with pytest.raises(__Rollback):
+        async with unit_of_work():
+            created_user = await user_repository.create(cmd=cmd)
+            raise __Rollback
+
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query=models.ReadUserQuery(id=created_user.id))
+
+
+@pytest.mark.postgresql
+async def test_unit_of_work_nested_rollback(
+    user_repository: UserRepository,
+    user_generator,
+):
+    first_cmd = user_generator().migrate(models.CreateUserCommand)
+    second_cmd = user_generator().migrate(models.CreateUserCommand)
+
+    async with unit_of_work():
+        first_user = await user_repository.create(cmd=first_cmd)
+        with pytest.raises(__Rollback):
+            async with unit_of_work():
+                second_user = await user_repository.create(cmd=second_cmd)
+                raise __Rollback
+
+    assert await user_repository.read(query=models.ReadUserQuery(id=first_user.id))
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query=models.ReadUserQuery(id=second_user.id))
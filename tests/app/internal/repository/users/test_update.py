@@ -4,6 +4,7 @@ import pytest
 
 from app.internal.repository.postgresql.users import UserRepository
 from app.pkg import models
+from app.pkg.models.exceptions.repository import DriverError
 
 
 @pytest.mark.postgresql
@@ -27,3 +28,44 @@ async def test_update(
     )
 
     assert updated_user != created_user
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"password": "new_password"},
+        {"username": "new_username", "password": "new_password"},
+    ],
+)
+async def test_update_variants(
+    user_repository: UserRepository,
+    user_generator,
+    fields,
+):
+    cmd = user_generator().migrate(models.CreateUserCommand)
+    created_user = await user_repository.create(cmd=cmd)
+
+    updated_user = await user_repository.update(
+        cmd=models.UpdateUserCommand(id=created_user.id, **fields),
+    )
+
+    assert updated_user.id == created_user.id
+    if "username" in fields:
+        assert updated_user.username == fields["username"]
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_update_nothing(
+    user_repository: UserRepository,
+    user_generator,
+):
+    cmd = user_generator().migrate(models.CreateUserCommand)
+    created_user = await user_repository.create(cmd=cmd)
+
+    with pytest.raises(DriverError):
+        await user_repository.update(
+            cmd=models.UpdateUserCommand(id=created_user.id),
+        )
@@ -0,0 +1,204 @@
+"""Module for testing service of users."""
+
+import asyncio
+import datetime
+import json
+from typing import Optional
+
+from app.internal.repository.postgresql import connection
+from app.internal.services.users import UserService
+from app.pkg import models
+from app.pkg.cache import (
+    CountMinSketch,
+    MemoryCache,
+    NegativeCache,
+    Refresher,
+    Version,
+)
+from app.pkg.cache.stale import staleness
+from app.pkg.connectors.postgresql import session
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ExportRepository:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def export(self, chunk_size, fields=None):
+        for row in self.rows:
+            yield {
+                key: value for key, value in row.items() if not fields or key in fields
+            }
+
+
+class _ReadRepository:
+    def __init__(self, user):
+        self.user = user
+        self.queries = []
+
+    async def read(self, query):
+        self.queries.append(query)
+        return self.user
+
+
+class _Loader:
+    def __init__(self, user=None, error=None, during_load=None):
+        self.user = user
+        self.error = error
+        self.during_load = during_load
+        self.ids = []
+
+    async def load(self, id_):
+        self.ids.append(id_)
+        if self.during_load is not None:
+            self.during_load()
+        if self.error is not None:
+            raise self.error
+        return self.user
+
+
+def __service(user_repository=None, **dependencies) -> UserService:
+    return UserService(
+        **{
+            "user_repository": user_repository,
+            "user_loader": None,
+            "users_cache": None,
+            "users_negative_cache": None,
+            "users_sketch": None,
+            "users_refresher": None,
+            "users_version": None,
+            "users_responses_cache": None,
+            **dependencies,
+        },
+    )
+
+
+def __caching_service(
+    loader: _Loader,
+    clock: _Clock,
+    users_version: Optional[Version] = None,
+    user_repository=None,
+) -> UserService:
+    users_cache = MemoryCache(max_size=10, ttl=60, stale_ttl=300, clock=clock)
+    users_cache.set("1", __user("cached"))
+    return __service(
+        user_repository=user_repository,
+        user_loader=loader,
+        users_cache=users_cache,
+        users_negative_cache=NegativeCache(max_size=10, ttl=5, doorkeeper_size=64),
+        users_sketch=CountMinSketch(width=64, sample_size=1000),
+        users_refresher=Refresher(
+            cache=users_cache,
+            stale_while_revalidate=10,
+            stale_if_error=300,
+        ),
+        users_version=users_version or Version(),
+    )
+
+
+def __user(username: str) -> models.UserResponse:
+    return models.UserResponse(
+        id="1",
+        username=username,
+        created_at=datetime.datetime(2024, 12, 1, 15, 30),
+    )
+
+
+async def test_export_users_encodes_rows_as_responses():
+    rows = [
+        {
+            "id": str(i),
+            "username": f"user-{i}",
+            "created_at": datetime.datetime(2024, 12, 1, 15, 30, i),
+        }
+        for i in range(3)
+    ]
+    service = __service(_ExportRepository(rows))
+
+    content = b"".join([chunk async for chunk in service.export_users()])
+
+    assert [json.loads(line) for line in content.splitlines()] == [
+        json.loads(models.UserResponse(**row).json()) for row in rows
+    ]
+
+
+async def test_export_users_encodes_only_fields():
+    rows = [{"id": "1", "username": "user", "created_at": datetime.datetime.now()}]
+    service = __service(_ExportRepository(rows))
+
+    content = b"".join(
+        [chunk async for chunk in service.export_users(fields=("id", "username"))],
+    )
+
+    assert json.loads(content) == {"id": "1", "username": "user"}
+
+
+async def test_read_user_serves_expired_user_while_refreshing():
+    clock = _Clock()
+    loader = _Loader(user=__user("fresh"))
+    service = __caching_service(loader, clock)
+
+    clock.now = 65
+    user = await service.read_user(query=models.ReadUserQuery(id="1"))
+    assert user.username == "cached"
+
+    await asyncio.sleep(0)
+    assert loader.ids == ["1"]
+    user = await service.read_user(query=models.ReadUserQuery(id="1"))
+    assert user.username == "fresh"
+
+
+async def test_read_user_serves_expired_user_if_database_is_unreachable():
+    clock = _Clock()
+    loader = _Loader(error=ConnectionError("database is unreachable"))
+    service = __caching_service(loader, clock)
+
+    clock.now = 100
+    with staleness() as current:
+        user = await service.read_user(query=models.ReadUserQuery(id="1"))
+
+    assert user.username == "cached"
+    assert current.stale
+    assert loader.ids == ["1"]
+
+
+async def test_read_user_does_not_cache_user_loaded_before_write():
+    clock = _Clock()
+    users_version = Version()
+    loader = _Loader(user=__user("old"), during_load=users_version.bump)
+    service = __caching_service(loader, clock, users_version)
+
+    clock.now = 1000
+    user = await service.read_user(query=models.ReadUserQuery(id="1"))
+    assert user.username == "old"
+
+    loader.user, loader.during_load = __user("new"), None
+    user = await service.read_user(query=models.ReadUserQuery(id="1"))
+    assert user.username == "new"
+    assert loader.ids == ["1", "1"]
+
+
+async def test_read_user_of_writer_hits_cache_once_writes_are_replayed(monkeypatch):
+    replayed = False
+    monkeypatch.setattr(connection, "__has_replayed", lambda lsn: replayed)
+    repository = _ReadRepository(__user("primary"))
+    loader = _Loader()
+    service = __caching_service(loader, _Clock(), user_repository=repository)
+
+    with session("0/16B3748"):
+        user = await service.read_user(query=models.ReadUserQuery(id="1"))
+        assert user.username == "primary"
+
+        replayed = True
+        user = await service.read_user(query=models.ReadUserQuery(id="1"))
+        assert user.username == "cached"
+
+    assert len(repository.queries) == 1
+    assert loader.ids == []
@@ -0,0 +1,59 @@
+"""Module for testing admission policies of caches."""
+
+import pytest
+
+from app.pkg.cache import CountMinSketch, Doorkeeper, TinyLfuAdmission
+from app.pkg.cache.admission import MIN_DOORKEEPER_SIZE
+
+
+def test_doorkeeper_admits_second_record():
+    doorkeeper = Doorkeeper(size=1024)
+
+    assert not doorkeeper.admit("a")
+    assert doorkeeper.admit("a")
+    assert not doorkeeper.admit("b")
+
+
+def test_doorkeeper_resets():
+    # Integers hash to themselves, so keys below the size set distinct bits.
+    doorkeeper = Doorkeeper(size=1024)
+    doorkeeper.admit(1000)
+
+    for i in range(1, 1024 // 8 + 1):
+        assert not doorkeeper.admit(i)
+
+    assert not doorkeeper.admit(1000)
+
+
+@pytest.mark.parametrize("size", [1, 7, MIN_DOORKEEPER_SIZE - 1])
+def test_doorkeeper_rejects_small_size(size: int):
+    with pytest.raises(ValueError):
+        Doorkeeper(size=size)
+
+
+def test_doorkeeper_admits_with_min_size():
+    doorkeeper = Doorkeeper(size=MIN_DOORKEEPER_SIZE)
+
+    assert not doorkeeper.admit("a")
+    assert doorkeeper.admit("a")
+
+
+def test_doorkeeper_false_positives():
+    doorkeeper = Doorkeeper(size=1 << 16)
+    for i in range((1 << 16) // 8 - 1):
+        doorkeeper.admit(f"seen-{i}")
+
+    admitted = sum(doorkeeper.admit(f"unseen-{i}") for i in range(1000))
+
+    assert admitted < 100
+
+
+def test_tiny_lfu_prefers_more_frequent():
+    sketch = CountMinSketch(width=1024, sample_size=10000)
+    admission = TinyLfuAdmission(sketch=sketch)
+    for key in ("hot", "hot", "warm"):
+        sketch.increment(key)
+
+    assert admission.admit("hot", victim="warm")
+    assert not admission.admit("warm", victim="hot")
+    assert not admission.admit("warm", victim="warm")
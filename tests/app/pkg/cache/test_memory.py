@@ -0,0 +1,133 @@
+"""Module for testing cache in memory of the worker process."""
+
+import pytest
+
+from app.pkg.cache import CountMinSketch, MemoryCache, TinyLfuAdmission
+from app.pkg.models.core.cache import CachePolicy
+
+
+class __Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy))
+def test_get_set(policy: CachePolicy):
+    cache = MemoryCache(max_size=2, ttl=60, policy=policy)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.size) == (1, 1, 1)
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy))
+def test_ttl(policy: CachePolicy):
+    clock = __Clock()
+    cache = MemoryCache(max_size=2, ttl=10, policy=policy, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_lru_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2, ttl=60, policy=CachePolicy.LRU)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = MemoryCache(max_size=2, ttl=60, policy=CachePolicy.LFU)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("b")
+
+    cache.set("c", 3)
+    cache.set("d", 4)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert cache.get("d") == 4
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy))
+def test_delete_and_clear(policy: CachePolicy):
+    cache = MemoryCache(max_size=3, ttl=60, policy=policy)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert cache.size == 0
+    cache.set("c", 3)
+    assert cache.get("c") == 3
+
+
+def test_disabled():
+    cache = MemoryCache(max_size=0, ttl=60)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize("policy", list(CachePolicy))
+def test_admission(policy: CachePolicy):
+    sketch = CountMinSketch(width=1024, sample_size=10000)
+    cache = MemoryCache(
+        max_size=2,
+        ttl=60,
+        policy=policy,
+        admission=TinyLfuAdmission(sketch=sketch),
+    )
+    for key in ("a", "a", "b", "b", "scanned"):
+        sketch.increment(key)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.set("scanned", 3)
+    assert cache.get("scanned") is None
+    assert cache.rejections == 1
+
+    for _ in range(3):
+        sketch.increment("hot")
+    cache.set("hot", 4)
+    assert cache.get("hot") == 4
+    assert cache.evictions == 1
+
+
+def test_get_stale():
+    clock = __Clock()
+    cache = MemoryCache(max_size=2, ttl=10, stale_ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get_stale("a") == (1, -10)
+    clock.now = 12
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == (1, 2)
+    clock.now = 15
+    assert cache.get_stale("a") is None
+    assert cache.size == 0
+    assert (cache.hits, cache.misses) == (1, 3)
@@ -0,0 +1,56 @@
+"""Module for testing cache of missing keys."""
+
+from app.pkg.cache import NegativeCache
+
+
+class __Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_admits_on_second_miss():
+    cache = NegativeCache(max_size=10, ttl=5, doorkeeper_size=1024)
+
+    cache.set("a", True)
+    assert cache.get("a") is None
+    assert cache.rejections == 1
+
+    cache.set("a", True)
+    assert cache.get("a") is True
+
+
+def test_scan_does_not_evict_polled_keys():
+    cache = NegativeCache(max_size=10, ttl=5, doorkeeper_size=1 << 16)
+    for _ in range(2):
+        cache.set("polled", True)
+
+    for i in range(1000):
+        cache.set(f"scanned-{i}", True)
+
+    assert cache.get("polled") is True
+    assert cache.rejections >= 990
+
+
+def test_ttl_and_delete():
+    clock = __Clock()
+    cache = NegativeCache(max_size=10, ttl=5, doorkeeper_size=1024, clock=clock)
+    for key in ("a", "a", "b", "b"):
+        cache.set(key, True)
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    clock.now = 5
+    assert cache.get("b") is None
+
+
+def test_disabled():
+    cache = NegativeCache(max_size=0, ttl=5, doorkeeper_size=1024)
+
+    cache.set("a", True)
+    cache.set("a", True)
+
+    assert cache.get("a") is None
+    assert cache.rejections == 0
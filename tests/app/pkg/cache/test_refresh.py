@@ -0,0 +1,95 @@
+"""Module for testing background refresh of expired cache entries."""
+
+import asyncio
+from typing import List, Optional
+
+from app.pkg.cache import MemoryCache, Refresher, Version
+from app.pkg.cache.stale import mark_stale, staleness
+
+
+class __Loader:
+    def __init__(self, value: Optional[str] = "fresh", error: bool = False):
+        self.value = value
+        self.error = error
+        self.keys: List[str] = []
+
+    async def load(self, key: str) -> Optional[str]:
+        self.keys.append(key)
+        await asyncio.sleep(0.01)
+        if self.error:
+            raise ConnectionError("database is unreachable")
+        return self.value
+
+
+def __refresher(cache: MemoryCache) -> Refresher:
+    return Refresher(cache=cache, stale_while_revalidate=10, stale_if_error=300)
+
+
+async def test_refresh_once_per_key():
+    cache = MemoryCache(max_size=10, ttl=60)
+    refresher = __refresher(cache)
+    loader = __Loader()
+
+    for _ in range(3):
+        refresher.refresh("a", loader.load)
+    await asyncio.sleep(0.05)
+
+    assert loader.keys == ["a"]
+    assert cache.get("a") == "fresh"
+    assert refresher.refreshes == 1
+
+    refresher.refresh("a", loader.load)
+    await asyncio.sleep(0.05)
+    assert loader.keys == ["a", "a"]
+
+
+async def test_refresh_of_missing_value_deletes_entry():
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set("a", "stale")
+    refresher = __refresher(cache)
+
+    refresher.refresh("a", __Loader(value=None).load)
+    await asyncio.sleep(0.05)
+
+    assert cache.size == 0
+
+
+async def test_failed_refresh_keeps_entry():
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set("a", "stale")
+    refresher = __refresher(cache)
+
+    refresher.refresh("a", __Loader(error=True).load)
+    await asyncio.sleep(0.05)
+
+    assert cache.get("a") == "stale"
+    assert refresher.failures == 1
+
+
+async def test_refresh_is_dropped_after_concurrent_write():
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set("a", "stale")
+    version = Version()
+    refresher = Refresher(
+        cache=cache,
+        stale_while_revalidate=10,
+        stale_if_error=300,
+        version=version,
+    )
+
+    refresher.refresh("a", __Loader(value="loaded before write").load)
+    cache.set("a", "written")
+    version.bump()
+    await asyncio.sleep(0.05)
+
+    assert cache.get("a") == "written"
+    assert refresher.conflicts == 1
+
+
+def test_mark_stale():
+    mark_stale()
+
+    with staleness() as current:
+        assert not current.stale
+        mark_stale()
+        assert current.stale
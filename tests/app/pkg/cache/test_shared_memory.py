@@ -0,0 +1,259 @@
+"""Module for testing cache in memory shared by worker processes."""
+
+import datetime
+import multiprocessing
+import pathlib
+
+import pytest
+
+from app.pkg import models
+from app.pkg.cache import (
+    CountMinSketch,
+    MemoryCache,
+    SharedMemoryCache,
+    TinyLfuAdmission,
+)
+from app.pkg.cache.shared import PROBES
+
+
+class __Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "users-cache"
+
+
+def __set_in_other_process(path: pathlib.Path, key: str, value: str):
+    SharedMemoryCache(path=path, max_size=16, ttl=60).set(key, value)
+
+
+def test_get_set(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    cache.set("a", {"id": "a"})
+
+    assert cache.get("a") == {"id": "a"}
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.size) == (1, 1, 1)
+
+
+def test_shared_by_instances(path: pathlib.Path):
+    first = SharedMemoryCache(path=path, max_size=16, ttl=60)
+    second = SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    first.set("a", 1)
+    assert second.get("a") == 1
+
+    second.delete("a")
+    assert first.get("a") is None
+
+
+def test_shared_by_processes(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    process = multiprocessing.get_context("spawn").Process(
+        target=__set_in_other_process,
+        args=(path, "a", "from other process"),
+    )
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert cache.get("a") == "from other process"
+
+
+def test_other_geometry_maps_other_segment(path: pathlib.Path):
+    first = SharedMemoryCache(path=path, max_size=16, ttl=60)
+    first.set("a", 1)
+
+    second = SharedMemoryCache(path=path, max_size=32, ttl=60)
+
+    assert second.segment_path != first.segment_path
+    assert second.get("a") is None
+    assert second.size == 0
+    assert first.get("a") == 1
+
+
+def test_foreign_file_is_not_mapped(path: pathlib.Path):
+    segment_path = SharedMemoryCache(path=path, max_size=16, ttl=60).segment_path
+    segment_path.write_bytes(b"not a cache segment")
+
+    with pytest.raises(ValueError):
+        SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    assert segment_path.read_bytes() == b"not a cache segment"
+
+
+def test_values_are_stored_as_json(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    cache.set("a", {"id": "a"})
+
+    assert b'{"id":"a"}' in cache.segment_path.read_bytes()
+
+
+@pytest.mark.parametrize(
+    "tz",
+    [None, datetime.timezone.utc, datetime.timezone(datetime.timedelta(hours=3))],
+)
+def test_user_is_returned_as_by_memory_cache(
+    path: pathlib.Path,
+    tz: datetime.tzinfo,
+):
+    user = models.UserResponse(
+        id="1",
+        username="a",
+        created_at=datetime.datetime(2024, 12, 1, 15, 30, 0, 123456, tzinfo=tz),
+    )
+    memory = MemoryCache(max_size=16, ttl=60)
+    shared = SharedMemoryCache(
+        path=path,
+        max_size=16,
+        ttl=60,
+        encode=models.UserResponse.to_cache,
+        decode=models.UserResponse.from_cache,
+    )
+
+    memory.set("1", user)
+    shared.set("1", user)
+
+    assert shared.get("1") == memory.get("1")
+    assert shared.get("1").created_at.utcoffset() == user.created_at.utcoffset()
+    assert shared.get("1").__fields_set__ == user.__fields_set__
+
+
+def test_size_is_shared_by_instances(path: pathlib.Path):
+    first = SharedMemoryCache(path=path, max_size=16, ttl=60)
+    second = SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    first.set("a", 1)
+    second.set("b", 2)
+    second.set("a", 3)
+    assert (first.size, second.size) == (2, 2)
+
+    first.delete("a")
+    first.delete("c")
+    assert second.size == 1
+
+
+def test_ttl(path: pathlib.Path):
+    clock = __Clock()
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+
+
+def test_update(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=60)
+
+    cache.set("a", "first")
+    cache.set("a", "second value")
+
+    assert cache.get("a") == "second value"
+    assert cache.size == 1
+
+
+def test_evicts_earliest_expiration(path: pathlib.Path):
+    clock = __Clock()
+    cache = SharedMemoryCache(path=path, max_size=PROBES, ttl=60, clock=clock)
+    for i in range(PROBES):
+        clock.now = i
+        cache.set(str(i), i)
+
+    clock.now = PROBES
+    cache.set("new", "new")
+
+    assert cache.get("0") is None
+    assert all(cache.get(str(i)) == i for i in range(1, PROBES))
+    assert cache.get("new") == "new"
+    assert cache.evictions == 1
+
+
+def test_expired_slot_is_reused(path: pathlib.Path):
+    clock = __Clock()
+    cache = SharedMemoryCache(path=path, max_size=PROBES, ttl=10, clock=clock)
+    for i in range(PROBES):
+        cache.set(str(i), i)
+
+    clock.now = 10
+    cache.set("new", "new")
+
+    assert cache.get("new") == "new"
+    assert cache.evictions == 0
+
+
+def test_too_large_is_not_cached(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=60, slot_size=128)
+
+    cache.set("a", "x" * 128)
+    cache.set("b" * 65, 1)
+
+    assert cache.size == 0
+
+
+def test_clear(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.clear()
+
+    assert cache.size == 0
+    cache.set("c", 3)
+    assert cache.get("c") == 3
+
+
+def test_disabled(path: pathlib.Path):
+    cache = SharedMemoryCache(path=path, max_size=0, ttl=60)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert not cache.segment_path.exists()
+
+
+def test_admission(path: pathlib.Path):
+    sketch = CountMinSketch(width=1024, sample_size=10000)
+    cache = SharedMemoryCache(
+        path=path,
+        max_size=PROBES,
+        ttl=60,
+        admission=TinyLfuAdmission(sketch=sketch),
+    )
+    for i in range(PROBES):
+        sketch.increment(str(i))
+        cache.set(str(i), i)
+
+    cache.set("scanned", "scanned")
+    assert cache.get("scanned") is None
+    assert cache.rejections == 1
+
+    for _ in range(2):
+        sketch.increment("hot")
+    cache.set("hot", "hot")
+    assert cache.get("hot") == "hot"
+    assert cache.evictions == 1
+
+
+def test_get_stale(path: pathlib.Path):
+    clock = __Clock()
+    cache = SharedMemoryCache(path=path, max_size=16, ttl=10, stale_ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get_stale("a") == (1, -10)
+    clock.now = 12
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == (1, 2)
+    clock.now = 15
+    assert cache.get_stale("a") is None
+    assert (cache.hits, cache.misses) == (1, 3)
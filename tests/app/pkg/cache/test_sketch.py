@@ -0,0 +1,68 @@
+"""Module for testing frequency sketch of cache keys."""
+
+from app.pkg.cache import CountMinSketch
+
+
+def test_estimate():
+    sketch = CountMinSketch(width=1024, sample_size=10000)
+    for _ in range(5):
+        sketch.increment("a")
+    sketch.increment("b")
+
+    assert sketch.estimate("a") >= 5
+    assert sketch.estimate("b") >= 1
+    assert sketch.estimate("a") > sketch.estimate("b")
+
+
+def test_estimate_saturates():
+    sketch = CountMinSketch(width=64, sample_size=10000)
+    for _ in range(300):
+        sketch.increment("a")
+
+    assert sketch.estimate("a") == 255
+
+
+def test_aging_halves_counters():
+    sketch = CountMinSketch(width=1024, sample_size=10)
+    for _ in range(9):
+        sketch.increment("a")
+    assert sketch.estimate("a") == 9
+
+    sketch.increment("a")
+
+    assert sketch.estimate("a") == 5
+    assert sketch.samples == 0
+    assert sketch.top() == [("a", 5)]
+
+
+def test_top():
+    sketch = CountMinSketch(width=4096, sample_size=100000, top_size=3)
+    for i in range(10):
+        for _ in range(i + 1):
+            sketch.increment(f"key-{i}")
+
+    assert [key for key, _ in sketch.top()] == ["key-9", "key-8", "key-7"]
+    assert [key for key, _ in sketch.top(1)] == ["key-9"]
+
+
+def test_top_survives_scan():
+    sketch = CountMinSketch(width=4096, sample_size=100000, top_size=2)
+    for _ in range(10):
+        sketch.increment("hot")
+
+    for i in range(1000):
+        sketch.increment(f"scanned-{i}")
+
+    # Collisions with scanned keys may raise the estimate of "hot" after
+    # its last increment, so only the key is compared.
+    assert [key for key, _ in sketch.top(1)] == ["hot"]
+
+
+def test_clear():
+    sketch = CountMinSketch(width=1024, sample_size=10000)
+    sketch.increment("a")
+
+    sketch.clear()
+
+    assert sketch.estimate("a") == 0
+    assert sketch.top() == []
@@ -0,0 +1,14 @@
+"""Module for testing version of cached data."""
+
+from app.pkg.cache import MemoryCache, Version
+
+
+def test_bump_changes_keys_of_cached_results():
+    version = Version()
+    cache = MemoryCache(max_size=10, ttl=60)
+    cache.set((version.value, "page"), b"[]")
+
+    version.bump()
+
+    assert cache.get((version.value, "page")) is None
+    assert version.value == 1
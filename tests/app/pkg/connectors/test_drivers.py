@@ -0,0 +1,105 @@
+"""Module for testing drivers of postgresql connector."""
+
+import time
+from contextlib import aclosing
+
+import pytest
+
+from app.pkg.connectors.base import DatabaseError
+from app.pkg.connectors.postgresql import Postgresql
+from app.pkg.connectors.postgresql.drivers import get_driver
+from app.pkg.connectors.postgresql.drivers.aiopg import AiopgDriver
+from app.pkg.connectors.postgresql.statements import Statement, registry
+from app.pkg.models.core.postgresql import PostgresqlDriver
+from app.pkg.settings import settings
+
+ROWS = 10_000
+ITERATIONS = 20
+
+__select = Statement(
+    name="test_drivers_select",
+    query="""
+        select i as id, md5(i::text) as username, now() as created_at
+            from generate_series(1, %(rows)s::int) as i;
+    """,
+)
+
+
+def __connector(driver: PostgresqlDriver) -> Postgresql:
+    return Postgresql(
+        username=settings.POSTGRESQL_USER,
+        password=settings.POSTGRESQL_PASSWORD,
+        host=settings.POSTGRESQL_HOST,
+        port=settings.POSTGRESQL_PORT,
+        database_name=settings.POSTGRESQL_DATABASE_NAME,
+        driver=driver,
+    )
+
+
+async def __rows_per_second(driver: PostgresqlDriver) -> float:
+    connector = __connector(driver)
+    await connector.create_pool()
+
+    started = time.perf_counter()
+    async with connector.get_connect() as conn:
+        for _ in range(ITERATIONS):
+            await conn.fetchall(__select, {"rows": ROWS})
+    elapsed = time.perf_counter() - started
+
+    await connector.close_pool()
+    return ROWS * ITERATIONS / elapsed
+
+
+def test_get_driver():
+    assert isinstance(get_driver(PostgresqlDriver.AIOPG), AiopgDriver)
+    assert isinstance(get_driver("aiopg"), AiopgDriver)
+
+
+def test_get_driver_unknown():
+    with pytest.raises(ValueError):
+        get_driver("psycopg3")
+
+
+@pytest.mark.postgresql
+@pytest.mark.parametrize("driver", list(PostgresqlDriver))
+async def test_driver_interface(driver: PostgresqlDriver):
+    if driver == PostgresqlDriver.ASYNCPG:
+        pytest.importorskip("asyncpg")
+
+    connector = __connector(driver)
+    await connector.create_pool()
+
+    async with connector.get_connect() as conn:
+        row = await conn.fetchone(__select, {"rows": 1})
+        assert row["id"] == 1
+
+        hits = registry.hits
+        await conn.fetchone(__select, {"rows": 1})
+        assert registry.hits == hits + 1
+
+        rows = [row async for row in conn.stream(__select, {"rows": 5}, 2)]
+        assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+        assert not conn.in_transaction()
+
+        rows = conn.stream(__select, {"rows": 5}, 2)
+        async with aclosing(rows):
+            assert (await anext(rows))["id"] == 1
+        assert not conn.in_transaction()
+
+        with pytest.raises(DatabaseError) as e:
+            await conn.execute("select * from not_existing_table;")
+        assert e.value.pgcode == "42P01"
+
+    await connector.close_pool()
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_benchmark_asyncpg_driver():
+    pytest.importorskip("asyncpg")
+
+    before = await __rows_per_second(PostgresqlDriver.AIOPG)
+    after = await __rows_per_second(PostgresqlDriver.ASYNCPG)
+
+    assert after > before, f"aiopg: {before:.0f} rows/s, asyncpg: {after:.0f} rows/s"
@@ -0,0 +1,161 @@
+"""Module for testing the pool of postgresql connector."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.pkg.connectors.postgresql import Postgresql
+from app.pkg.connectors.postgresql.replica import Replica
+from app.pkg.settings import settings
+
+REQUESTS = 500
+CONCURRENCY = 20
+
+
+def __connector() -> Postgresql:
+    return Postgresql(
+        username=settings.POSTGRESQL_USER,
+        password=settings.POSTGRESQL_PASSWORD,
+        host=settings.POSTGRESQL_HOST,
+        port=settings.POSTGRESQL_PORT,
+        database_name=settings.POSTGRESQL_DATABASE_NAME,
+        min_size=CONCURRENCY,
+        max_size=CONCURRENCY,
+    )
+
+
+@asynccontextmanager
+async def __pool_per_request():
+    """Previous behaviour: every request opens and closes its own pool."""
+
+    connector = __connector()
+    try:
+        async with connector.get_connect() as conn:
+            yield conn
+    finally:
+        await connector.close_pool()
+
+
+async def __requests_per_second(get_connect) -> float:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def request():
+        async with semaphore, get_connect() as conn:
+            await conn.execute("select 1;")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(REQUESTS)))
+    return REQUESTS / (time.perf_counter() - started)
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_pool_is_reused():
+    connector = __connector()
+    await connector.create_pool()
+
+    async with connector.get_connect() as first:
+        pass
+    async with connector.get_connect() as second:
+        pass
+
+    assert first.raw is second.raw
+    assert connector.pool.size == CONCURRENCY
+    await connector.close_pool()
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_connection_is_closed_after_max_lifetime():
+    connector = __connector()
+    connector.max_lifetime = 0
+    await connector.create_pool()
+
+    async with connector.get_connect() as conn:
+        await asyncio.sleep(0.01)
+
+    assert conn.raw.closed
+    await connector.close_pool()
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_acquire_timeout_does_not_limit_queries():
+    connector = __connector()
+    connector.acquire_timeout = 0.1
+    await connector.create_pool()
+
+    try:
+        async with connector.get_connect() as conn:
+            await conn.execute("select pg_sleep(0.3);")
+    finally:
+        await connector.close_pool()
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+async def test_acquire_timeout_limits_wait_for_connection():
+    connector = __connector()
+    connector.min_size = connector.max_size = 1
+    connector.acquire_timeout = 0.1
+    await connector.create_pool()
+
+    try:
+        async with connector.get_connect():
+            with pytest.raises(asyncio.TimeoutError):
+                async with connector.get_connect():
+                    pass
+    finally:
+        await connector.close_pool()
+
+
+async def test_replicas_monitor_survives_unexpected_error(monkeypatch):
+    connector = __connector()
+    connector.replicas = [Replica(connector=__connector())]
+    connector.replicas[0].available = True
+    connector.replica_check_interval = 0
+    checks = []
+
+    async def check_replicas():
+        checks.append(1)
+        if len(checks) == 1:
+            raise RuntimeError("unexpected")
+        if len(checks) == 3:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(connector, "check_replicas", check_replicas)
+
+    with pytest.raises(asyncio.CancelledError):
+        await connector._Postgresql__monitor_replicas()
+
+    assert len(checks) == 3
+    assert not connector.replicas[0].available
+
+
+@pytest.mark.postgresql
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_benchmark_pool_per_process():
+    before = await __requests_per_second(__pool_per_request)
+
+    connector = __connector()
+    await connector.create_pool()
+    after = await __requests_per_second(connector.get_connect)
+    await connector.close_pool()
+
+    assert (
+        after > before
+    ), f"pool per request: {before:.0f} rps, per process: {after:.0f} rps"
+
+
+def test_has_replayed():
+    connector = __connector()
+    connector.replicas = [Replica(connector=__connector()) for _ in range(2)]
+    connector.replicas[0].available = True
+    connector.replicas[0].replay_lsn = 10
+    connector.replicas[1].replay_lsn = 20
+
+    assert connector.has_replayed(10)
+    assert not connector.has_replayed(11)
@@ -0,0 +1,52 @@
+"""Module for testing read-your-writes session of postgresql connector."""
+
+from app.pkg.connectors.postgresql import Replica, Postgresql, get_session, session
+from app.pkg.settings import settings
+
+
+def __replica(replay_lsn: int, available: bool = True) -> Replica:
+    replica = Replica(
+        connector=Postgresql(
+            username=settings.POSTGRESQL_USER,
+            password=settings.POSTGRESQL_PASSWORD,
+            host="replica",
+            port=settings.POSTGRESQL_PORT,
+            database_name=settings.POSTGRESQL_DATABASE_NAME,
+        ),
+    )
+    replica.available = available
+    replica.replay_lsn = replay_lsn
+    return replica
+
+
+async def test_session_token_round_trip():
+    with session() as current:
+        assert current.token is None
+
+        current.observe(0x16B374D848)
+
+        assert current.token == "16/B374D848"
+        assert get_session() is current
+
+    with session(token="16/B374D848") as current:
+        assert current.lsn == 0x16B374D848
+
+    assert get_session() is None
+
+
+async def test_session_invalid_token():
+    with session(token="not-a-lsn") as current:
+        assert current.lsn == 0
+
+
+async def test_session_observe_keeps_latest_position():
+    with session(token="0/20") as current:
+        current.observe(0x10)
+
+        assert current.token == "0/20"
+
+
+async def test_replica_has_replayed():
+    assert __replica(replay_lsn=0x20).has_replayed(0x20)
+    assert not __replica(replay_lsn=0x10).has_replayed(0x20)
+    assert not __replica(replay_lsn=0x20, available=False).has_replayed(0)
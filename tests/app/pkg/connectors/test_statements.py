@@ -0,0 +1,67 @@
+"""Module for testing server-side prepared statements."""
+
+import pytest
+
+from app.internal.repository.postgresql.connection import get_connection
+from app.pkg.connectors.postgresql.statements import (
+    Statement,
+    registry,
+    to_positional,
+)
+
+
+async def test_statement_positional_params():
+    statement = Statement(
+        name="users_update",
+        query="""
+            update users set username = %(username)s
+                where id = %(id)s and username <> %(username)s;
+        """,
+    )
+
+    assert statement.params == ("username", "id")
+    assert statement.prepare_query == (
+        "prepare users_update as update users set username = $1 "
+        "where id = $2 and username <> $1"
+    )
+    assert statement.execute_query == "execute users_update (%(username)s, %(id)s)"
+
+
+async def test_statement_without_params():
+    statement = Statement(name="users_count", query="select count(*) from users;")
+
+    assert statement.params == ()
+    assert statement.execute_query == "execute users_count"
+
+
+async def test_to_positional_reuses_numbers_of_repeated_params():
+    assert to_positional("select %(a)s, %(b)s, %(a)s;") == (
+        "select $1, $2, $1;",
+        ("a", "b"),
+    )
+
+
+@pytest.mark.postgresql
+async def test_registry_prepares_once_per_connection():
+    statement = Statement(name="test_select", query="select %(value)s::int as v;")
+    misses, hits = registry.misses, registry.hits
+
+    async with get_connection() as conn:
+        await conn.fetchone(statement, {"value": 1})
+        row = await conn.fetchone(statement, {"value": 2})
+
+    assert row["v"] == 2
+    assert registry.misses - misses == 1
+    assert registry.hits - hits == 1
+
+
+@pytest.mark.postgresql
+async def test_registry_prepares_again_after_deallocate():
+    statement = Statement(name="test_select", query="select %(value)s::int as v;")
+
+    async with get_connection() as conn:
+        await conn.fetchone(statement, {"value": 1})
+        await conn.execute("deallocate all;")
+        row = await conn.fetchone(statement, {"value": 2})
+
+    assert row["v"] == 2
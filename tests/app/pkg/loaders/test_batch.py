@@ -0,0 +1,100 @@
+"""Module for testing batch loader."""
+
+import asyncio
+import contextvars
+from typing import Dict, List
+
+import pytest
+
+from app.pkg.loaders import BatchLoader
+
+VARIABLE: contextvars.ContextVar[str] = contextvars.ContextVar("variable")
+
+
+class __SquareLoader(BatchLoader[int, int]):
+    def __init__(self, max_batch_size: int = 100, window: float = 0.001):
+        super().__init__(max_batch_size=max_batch_size, window=window)
+        self.calls: List[List[int]] = []
+        self.contexts: List[str] = []
+
+    async def load_many(self, keys: List[int]) -> Dict[int, int]:
+        self.calls.append(keys)
+        self.contexts.append(VARIABLE.get("unset"))
+        await asyncio.sleep(0.01)
+        if -1 in keys:
+            raise ValueError("negative key")
+        return {key: key * key for key in keys if key != 0}
+
+
+async def test_load_coalesces_keys():
+    loader = __SquareLoader()
+
+    result = await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 3, 0]))
+
+    assert result == [1, 4, 4, 9, None]
+    assert loader.calls == [[1, 2, 3, 0]]
+    assert (loader.loads, loader.coalesced, loader.batches, loader.keys) == (
+        5,
+        1,
+        1,
+        4,
+    )
+
+
+async def test_load_dispatches_full_batch():
+    loader = __SquareLoader(max_batch_size=2, window=60)
+
+    result = await asyncio.gather(*(loader.load(key) for key in [1, 2, 3, 4]))
+
+    assert result == [1, 4, 9, 16]
+    assert loader.calls == [[1, 2], [3, 4]]
+
+
+async def test_load_joins_key_in_flight():
+    loader = __SquareLoader()
+
+    first = asyncio.create_task(loader.load(2))
+    await asyncio.sleep(0.005)
+    second = await loader.load(2)
+
+    assert await first == second == 4
+    assert loader.calls == [[2]]
+
+
+async def test_load_error_is_raised_to_all_callers():
+    loader = __SquareLoader()
+
+    result = await asyncio.gather(
+        loader.load(-1),
+        loader.load(2),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ValueError) for r in result)
+
+
+async def test_cancelled_caller_does_not_cancel_batch():
+    loader = __SquareLoader()
+
+    cancelled = asyncio.create_task(loader.load(2))
+    other = asyncio.create_task(loader.load(2))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await other == 4
+
+
+async def test_batch_runs_in_fresh_context():
+    loader = __SquareLoader()
+    VARIABLE.set("caller")
+
+    await loader.load(2)
+
+    assert loader.contexts == ["unset"]
+
+
+@pytest.mark.parametrize("window", [0, 0.001])
+async def test_load_window(window: float):
+    loader = __SquareLoader(window=window)
+
+    assert await loader.load(3) == 9
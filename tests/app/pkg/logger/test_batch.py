@@ -0,0 +1,168 @@
+"""Module for testing handlers of log records in batches."""
+
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
+
+import pytest
+
+from app.pkg.logger import get_logger
+from app.pkg.logger.batch import (
+    BatchQueueHandler,
+    BatchQueueListener,
+    BatchRotatingFileHandler,
+)
+
+
+class _CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+
+def __record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_listener_flushes_once_per_batch():
+    records = queue.SimpleQueue()
+    handler = _CountingHandler()
+    listener = BatchQueueListener(records, handler, batch_size=10)
+    for index in range(25):
+        records.put(__record(str(index)))
+
+    listener.start()
+    listener.stop()
+
+    assert handler.records == [str(index) for index in range(25)]
+    assert handler.flushes == 3
+
+
+def test_handler_starts_listener_on_first_record():
+    records = queue.SimpleQueue()
+    handler = _CountingHandler()
+    queue_handler = BatchQueueHandler(
+        records,
+        listener=BatchQueueListener(records, handler, batch_size=10),
+    )
+    threads = threading.active_count()
+    logger = __logger("tests.logger.lazy", queue_handler)
+    assert threading.active_count() == threads
+
+    logger.info("message")
+    assert threading.active_count() == threads + 1
+
+    queue_handler.close()
+    assert handler.records == ["message"]
+    assert threading.active_count() == threads
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not supported")
+def test_handler_restarts_listener_in_forked_child(tmp_path):
+    path = tmp_path / "app.log"
+    records = queue.SimpleQueue()
+    queue_handler = BatchQueueHandler(
+        records,
+        listener=BatchQueueListener(
+            records,
+            BatchRotatingFileHandler(path, delay=True),
+            batch_size=10,
+        ),
+    )
+    logger = __logger("tests.logger.fork", queue_handler)
+    logger.info("before fork")
+    __wait_for(lambda: path.exists() and path.read_text())
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            logger.info("child")
+            queue_handler.close()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    logger.info("parent")
+    queue_handler.close()
+
+    assert path.read_text().splitlines() == ["before fork", "child", "parent"]
+
+
+def __wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition is not met in time"
+        time.sleep(0.01)
+
+
+def test_file_handler_writes_on_flush(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BatchRotatingFileHandler(path)
+    try:
+        handler.emit(__record("message"))
+        assert path.read_text() == ""
+
+        handler.flush()
+        assert path.read_text() == "message\n"
+    finally:
+        handler.close()
+
+
+def test_get_logger_attaches_handler_once():
+    logger = get_logger("tests.logger")
+    get_logger("tests.logger")
+
+    handlers = [h for h in logger.handlers if isinstance(h, QueueHandler)]
+    assert len(handlers) == 1
+    assert all(not isinstance(h, RotatingFileHandler) for h in logger.handlers)
+
+
+def __logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_logging_on_caller_thread(tmp_path):
+    messages = 20_000
+    file_handler = RotatingFileHandler(tmp_path / "before.log", maxBytes=5242880)
+    batch_handler = BatchRotatingFileHandler(tmp_path / "after.log", maxBytes=5242880)
+    records = queue.SimpleQueue()
+    listener = BatchQueueListener(records, batch_handler, batch_size=100)
+    listener.start()
+
+    try:
+        logger = __logger("tests.logger.before", file_handler)
+        start = time.perf_counter()
+        for index in range(messages):
+            logger.info("message %s", index)
+        before = messages / (time.perf_counter() - start)
+
+        logger = __logger("tests.logger.after", BatchQueueHandler(records))
+        start = time.perf_counter()
+        for index in range(messages):
+            logger.info("message %s", index)
+        after = messages / (time.perf_counter() - start)
+    finally:
+        listener.stop()
+        file_handler.close()
+        batch_handler.close()
+
+    assert after > before, (
+        f"records per second on the caller thread: "
+        f"RotatingFileHandler {before:.0f}, BatchQueueHandler {after:.0f}"
+    )
+    assert len((tmp_path / "after.log").read_text().splitlines()) == messages
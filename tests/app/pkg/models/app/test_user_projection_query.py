@@ -0,0 +1,33 @@
+"""Module for testing selection of returned fields of users."""
+
+import pydantic
+import pytest
+
+from app.pkg import models
+from app.pkg.models.base import encode_json
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [
+        (None, None),
+        ("username,id", ("id", "username")),
+        (["created_at", "id", "created_at"], ("id", "created_at")),
+    ],
+)
+def test_fields_are_ordered_as_response(fields, expected):
+    assert models.UserProjectionQuery(fields=fields).fields == expected
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(pydantic.ValidationError):
+        models.UserProjectionQuery(fields="id,password")
+
+
+def test_projection_is_encoded_without_other_fields():
+    user = models.UserResponse(id="1", username="user", created_at=0)
+
+    projected = user.copy(include=set(models.ReadUserQuery(id="1", fields="id").fields))
+
+    assert projected.json() == '{"id": "1"}'
+    assert encode_json(projected) == b'{"id":"1"}'
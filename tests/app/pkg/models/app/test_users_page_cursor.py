@@ -0,0 +1,34 @@
+"""Module for testing cursor of users page."""
+
+import datetime
+
+import pytest
+
+from app.pkg import models
+
+
+def test_cursor_round_trip():
+    cursor = models.UsersPageCursor(
+        created_at=datetime.datetime(2024, 12, 1, 15, 30, 0, 100000),
+        id="9821d845-faed-4316-b68f-ee2ea5e79821",
+    )
+
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert models.UsersPageCursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not a cursor", "WyJhIl0", "bnVsbA"])
+def test_cursor_decode_invalid(token: str):
+    with pytest.raises(ValueError):
+        models.UsersPageCursor.decode(token)
+
+
+def test_page_query_created_range_to_naive_utc():
+    query = models.ReadUsersPageQuery(
+        limit=1,
+        created_after="2024-12-01T18:30:00+03:00",
+    )
+
+    assert query.created_after == datetime.datetime(2024, 12, 1, 15, 30)
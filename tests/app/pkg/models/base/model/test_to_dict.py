@@ -2,11 +2,13 @@
 
 import datetime
 import decimal
+import time
 import typing
 
 import pydantic
 import pytest
 
+from app.pkg import models
 from app.pkg.models.base import BaseModel
 
 
@@ -204,5 +206,121 @@ async def test_model_reduction_with_deciphering(create_model):
     assert dict_model["reduction"] == "reduction"
 
 
-# TODO: Добавить бенчмарки для to_dict.
-#   Есть ощущение, что тут происходит много лишних операций.
+class _Nested(BaseModel):
+    secret: pydantic.SecretStr
+    created_at: datetime.datetime
+    tags: typing.Tuple[str, ...]
+
+
+class _Complex(BaseModel):
+    id: str
+    count: int
+    price: decimal.Decimal
+    flags: typing.Set[int]
+    names: typing.List[str]
+    updated_at: typing.Optional[datetime.datetime]
+    born_on: datetime.date
+    password: pydantic.SecretBytes
+    nested: _Nested
+    nested_list: typing.List[_Nested]
+    extra: typing.Dict[str, typing.Any]
+
+
+def __legacy_cast(v, show_secrets: bool, **kwargs):
+    """Cast of ``to_dict`` before the plans of model classes."""
+
+    if isinstance(v, (typing.List, typing.Tuple)):
+        return [__legacy_cast(ve, show_secrets, **kwargs) for ve in v]
+    elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
+        if isinstance(v, pydantic.SecretBytes):
+            return v.get_secret_value().decode() if show_secrets else str(v)
+        return v.get_secret_value() if show_secrets else str(v)
+    elif isinstance(v, typing.Dict) and v:
+        return __legacy_to_dict(None, show_secrets, values=v, **kwargs)
+    elif isinstance(v, datetime.datetime):
+        return v.timestamp()
+    return v
+
+
+def __legacy_to_dict(model, show_secrets=False, values=None, **kwargs) -> dict:
+    values = model.dict(**kwargs).items() if not values else values.items()
+    r = {}
+    for k, v in values:
+        v = __legacy_cast(v, show_secrets, **kwargs)
+        r[k] = v
+    return r
+
+
+def __complex() -> _Complex:
+    nested = {
+        "secret": "secret",
+        "created_at": datetime.datetime(2024, 12, 1, 15, 30),
+        "tags": ("a", "b"),
+    }
+    return _Complex(
+        id="1",
+        count=2,
+        price="3.5",
+        flags={1, 2},
+        names=["a", "b"],
+        updated_at=None,
+        born_on=datetime.date(2000, 1, 1),
+        password=b"password",
+        nested=nested,
+        nested_list=[nested, nested],
+        extra={"at": datetime.datetime(2024, 1, 1), "items": ("x",), "empty": {}},
+    )
+
+
+@pytest.mark.parametrize("show_secrets", [False, True])
+async def test_cast_plan_is_identical_to_casting_every_value(show_secrets: bool):
+    model = __complex()
+
+    assert model.to_dict(show_secrets=show_secrets) == __legacy_to_dict(
+        model,
+        show_secrets=show_secrets,
+    )
+
+
+async def test_cast_plan_with_dict_kwargs():
+    model = __complex()
+
+    dict_model = model.to_dict(include={"nested", "count"})
+
+    assert dict_model == {
+        "count": 2,
+        "nested": {
+            "secret": "**********",
+            "created_at": datetime.datetime(2024, 12, 1, 15, 30).timestamp(),
+            "tags": ["a", "b"],
+        },
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("model", ["command", "query"])
+async def test_benchmark_to_dict(model: str):
+    instance = (
+        models.CreateUserCommand(username="user", password="password")
+        if model == "command"
+        else models.ReadUsersPageQuery(
+            limit=10,
+            created_after=datetime.datetime(2024, 12, 1),
+            username_prefix="user",
+        )
+    )
+
+    before = __calls_per_second(__legacy_to_dict, instance)
+    after = __calls_per_second(BaseModel.to_dict, instance)
+
+    assert (
+        after > before
+    ), f"{model}, cast every value: {before:.0f}/s, plan: {after:.0f}/s"
+
+
+def __calls_per_second(to_dict, model: BaseModel, iterations: int = 20_000) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        to_dict(model)
+    return iterations / (time.perf_counter() - started_at)
@@ -0,0 +1,95 @@
+"""Module for testing JSON encoder compiled for models."""
+
+import datetime
+import json
+import time
+from typing import List, Optional
+
+import pydantic
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.pkg import models
+from app.pkg.models.base import BaseModel, encode_json
+
+#: int: Users encoded by a benchmark of each implementation.
+USERS = 20_000
+
+
+class __Account(BaseModel):
+    id: pydantic.StrictInt
+    active: bool
+    balance: Optional[float] = None
+    tags: List[str] = []
+    secret: pydantic.SecretStr
+    owner: Optional[models.UserResponse] = None
+    birthday: datetime.date
+
+
+def __user(i: int = 0) -> models.UserResponse:
+    return models.UserResponse(
+        id=str(i),
+        username=f'user "{i}" ü',
+        created_at=datetime.datetime(2024, 12, 1, 15, 30, 0, 100000),
+    )
+
+
+def __legacy_encode(content) -> bytes:
+    """Encoding of FastAPI response of ``response_model``."""
+
+    return JSONResponse(content=jsonable_encoder(content)).body
+
+
+def __per_second(encode, content, iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        encode(content)
+    return iterations / (time.perf_counter() - started_at)
+
+
+def test_encodes_as_model_json():
+    user = __user()
+
+    assert json.loads(encode_json(user)) == json.loads(user.json(by_alias=True))
+
+
+def test_encodes_list_of_models():
+    users = [__user(i) for i in range(3)]
+
+    assert json.loads(encode_json(users)) == [
+        json.loads(user.json(by_alias=True)) for user in users
+    ]
+
+
+def test_encodes_fields_of_every_type():
+    account = __Account(
+        id=1,
+        active=True,
+        tags=["a", "b"],
+        secret="secret",
+        owner=__user(),
+        birthday=datetime.date(2000, 1, 1),
+    )
+
+    assert json.loads(encode_json(account)) == json.loads(account.json(by_alias=True))
+
+
+def test_skips_deleted_fields():
+    user = __user().delete_attribute("created_at")
+
+    assert json.loads(encode_json(user)) == {"id": "0", "username": 'user "0" ü'}
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [1, 10_000])
+def test_benchmark_encode_json(count: int):
+    content = __user() if count == 1 else [__user(i) for i in range(count)]
+
+    before = __per_second(__legacy_encode, content, USERS // count)
+    after = __per_second(encode_json, content, USERS // count)
+
+    assert (
+        after > before
+    ), f"{count} users, jsonable_encoder: {before:.0f}/s, compiled: {after:.0f}/s"
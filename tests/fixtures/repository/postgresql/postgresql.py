@@ -24,9 +24,9 @@ async def __clean_postgres():
         $$ LANGUAGE plpgsql;
     """
 
-    async with get_connection() as cur:
-        await cur.execute(q)
-        await cur.execute("select truncate_tables();")
+    async with get_connection() as conn:
+        await conn.execute(q)
+        await conn.execute("select truncate_tables();")
 
 
 @pytest.fixture(autouse=True, scope="module")
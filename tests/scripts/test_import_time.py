@@ -0,0 +1,22 @@
+"""Module for testing cold start time of the app."""
+
+import pytest
+
+from scripts.import_time import BUDGET, measure, total
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    return measure()
+
+
+@pytest.mark.benchmark
+def test_import_time_within_budget(import_times):
+    seconds = total(import_times)
+    assert seconds <= BUDGET, f"cold start {seconds:.3f}s, budget {BUDGET:.3f}s"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("module", ["jsf", "faker"])
+def test_heavy_modules_are_not_imported(import_times, module):
+    assert module not in {time.module for time in import_times}